@@ -0,0 +1,111 @@
+"""
+Code Conversion Cache
+=====================
+요청 간에 공유되는 코드 변환 결과 캐시 (LRU + 선택적 TTL)
+
+키는 (정규화된 코드, 매핑 규칙 해시)이며, 규칙 테이블이 바뀌면
+이전 규칙으로 변환된 항목은 모두 무효화됩니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class ConversionCache:
+    """
+    코드 변환 결과 LRU 캐시
+
+    Args:
+        max_size: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+        ttl_seconds: 항목 유효 시간(초). None이면 만료되지 않음
+    """
+
+    def __init__(self, max_size: int = 100_000, ttl_seconds: float | None = None):
+        self.max_size = max(1, max_size)
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+        self._fingerprint: str | None = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def normalize(external_code: str) -> str:
+        """캐시 키용 코드 정규화"""
+        return external_code.strip().upper()
+
+    def _sync_fingerprint(self, fingerprint: str) -> None:
+        """규칙 해시가 바뀌었으면 전체 무효화 (lock 보유 상태에서 호출)"""
+        if fingerprint != self._fingerprint:
+            if self._entries:
+                self._invalidations += 1
+            self._entries.clear()
+            self._fingerprint = fingerprint
+
+    def get(self, external_code: str, fingerprint: str) -> dict[str, Any] | None:
+        """
+        캐시된 변환 결과를 조회합니다.
+
+        Args:
+            external_code: 외부 코드 (정규화 전)
+            fingerprint: 현재 매핑 규칙 해시
+
+        Returns:
+            변환 결과 딕셔너리. 없거나 만료되었으면 None
+        """
+        key = (self.normalize(external_code), fingerprint)
+        with self._lock:
+            self._sync_fingerprint(fingerprint)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            stored_at, value = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, external_code: str, fingerprint: str, value: dict[str, Any]) -> None:
+        """변환 결과를 캐시에 저장합니다."""
+        key = (self.normalize(external_code), fingerprint)
+        with self._lock:
+            self._sync_fingerprint(fingerprint)
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """모든 항목 삭제 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """캐시 통계를 반환합니다."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "rules_fingerprint": self._fingerprint,
+            }
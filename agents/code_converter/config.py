@@ -72,3 +72,102 @@ def get_skills_paths() -> list[str]:
     """
     skills_dir = AGENT_DIR / "skills"
     return [str(skills_dir)]
+
+
+def is_rule_first_enabled() -> bool:
+    """
+    Rule-first 실행 모드 사용 여부를 반환합니다.
+    활성화되면 매핑 규칙에 일치하는 코드는 LLM 없이 즉시 변환하고,
+    규칙에 없는 코드만 DeepAgent로 전달합니다.
+    
+    Returns:
+        CODE_CONVERTER_RULE_FIRST 환경변수 값 (기본값: True)
+    """
+    return os.getenv("CODE_CONVERTER_RULE_FIRST", "true").lower() not in ("0", "false", "no")
+
+
+def get_cache_config() -> dict:
+    """
+    변환 결과 캐시 설정을 반환합니다.
+    
+    Returns:
+        캐시 설정 딕셔너리 (max_size, ttl_seconds - 0 이하이면 만료 없음)
+    """
+    ttl = float(os.getenv("CODE_CONVERTER_CACHE_TTL", "0"))
+    return {
+        "max_size": int(os.getenv("CODE_CONVERTER_CACHE_SIZE", "100000")),
+        "ttl_seconds": ttl if ttl > 0 else None,
+    }
+
+
+def get_store_config() -> dict | None:
+    """
+    영구 변환 저장소 설정을 반환합니다.
+    CODE_CONVERTER_STORE_PATH가 없으면 저장소를 사용하지 않습니다.
+    
+    Returns:
+        저장소 설정 딕셔너리 또는 None
+    """
+    store_path = os.getenv("CODE_CONVERTER_STORE_PATH")
+    if not store_path:
+        return None
+    return {
+        "directory": store_path,
+        "compact_threshold": int(os.getenv("CODE_CONVERTER_STORE_COMPACT_THRESHOLD", "10000")),
+    }
+
+
+def get_concurrency_config() -> dict:
+    """
+    에이전트 fallback 동시 실행 설정을 반환합니다.
+    
+    Returns:
+        max_concurrency: 동시에 실행할 에이전트 호출 수
+        shard_size: 에이전트 호출 1회에 전달할 최대 코드 수
+    """
+    return {
+        "max_concurrency": max(1, int(os.getenv("CODE_CONVERTER_MAX_CONCURRENCY", "8"))),
+        "shard_size": max(1, int(os.getenv("CODE_CONVERTER_SHARD_SIZE", "50"))),
+    }
+
+
+def get_worker_count() -> int:
+    """
+    변환 워커 프로세스 수를 반환합니다 (--workers 인자의 기본값).
+    0이면 워커 없이 서버 프로세스에서 직접 변환합니다.
+    
+    Returns:
+        CODE_CONVERTER_WORKERS 환경변수 값 (기본값: 0)
+    """
+    return max(0, int(os.getenv("CODE_CONVERTER_WORKERS", "0")))
+
+
+def get_result_config() -> dict:
+    """
+    MCP 변환 결과 응답 설정을 반환합니다.
+    
+    Returns:
+        inline_limit: 응답에 직접 포함할 최대 결과 수 (초과 시 결과 핸들 반환)
+        preview_size: 핸들 응답에 포함할 미리보기 결과 수
+        max_handles: 서버가 보관할 최대 결과 핸들 수
+        ttl_seconds: 결과 핸들 유효 시간(초). 0 이하이면 만료 없음
+    """
+    ttl = float(os.getenv("CODE_CONVERTER_RESULT_TTL", "600"))
+    return {
+        "inline_limit": max(0, int(os.getenv("CODE_CONVERTER_INLINE_LIMIT", "200"))),
+        "preview_size": max(0, int(os.getenv("CODE_CONVERTER_RESULT_PREVIEW", "20"))),
+        "max_handles": max(1, int(os.getenv("CODE_CONVERTER_RESULT_HANDLES", "64"))),
+        "ttl_seconds": ttl if ttl > 0 else None,
+    }
+
+
+def is_eager_agent_enabled() -> bool:
+    """
+    서버 시작 시 변환 DeepAgent를 미리 만들지 여부를 반환합니다.
+    비활성화(기본값)이면 LangChain/deepagents를 import하지 않고 시작하여
+    규칙 기반 변환은 즉시 응답하고, 에이전트는 첫 LLM fallback에서 생성합니다.
+    
+    Returns:
+        CODE_CONVERTER_EAGER_AGENT 환경변수 값 (기본값: False)
+    """
+    return os.getenv("CODE_CONVERTER_EAGER_AGENT", "false").lower() in ("1", "true", "yes")
@@ -0,0 +1,171 @@
+"""
+Conversion Result Payloads
+==========================
+MCP 도구가 돌려주는 구조화된 변환 결과 형식
+
+모든 응답에는 schema_version이 포함되며, 결과는 두 가지 형태로 제공됩니다.
+    records  - [{"external_code", "standard_code", "category", "success", "message"}, ...]
+    columnar - {"external_code": [...], "standard_code": [...], ...} (키 반복이 없어 토큰이 적음)
+
+inline_limit을 넘는 결과는 응답에 넣지 않고 ResultHandleStore에 보관한 뒤
+핸들("res_...")과 미리보기만 돌려줍니다. 전체 결과는 fetch_conversion_results로
+페이지 단위로 가져옵니다.
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+# 결과 형식이 바뀌면 올림 (소비자는 이 값으로 형식을 확인)
+SCHEMA_VERSION = 1
+
+RECORD_FIELDS = ("external_code", "standard_code", "category", "success", "message")
+RESULT_FORMATS = ("records", "columnar")
+
+# fetch_conversion_results 한 페이지의 최대 결과 수
+MAX_PAGE = 1000
+
+
+def to_record(result: dict[str, Any]) -> dict[str, Any]:
+    """변환 결과를 스키마 필드만 가진 레코드로 정규화 (에이전트 응답의 누락 필드는 None)"""
+    return {field: result.get(field) for field in RECORD_FIELDS}
+
+
+def to_columnar(records: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    """레코드 목록을 필드별 열 목록으로 변환"""
+    return {field: [record.get(field) for record in records] for field in RECORD_FIELDS}
+
+
+def check_format(format: str) -> None:
+    """
+    지원하는 결과 형식인지 확인합니다.
+
+    Raises:
+        ValueError: 지원하지 않는 형식인 경우
+    """
+    if format not in RESULT_FORMATS:
+        raise ValueError(f"지원하지 않는 결과 형식입니다: {format} (지원: {', '.join(RESULT_FORMATS)})")
+
+
+def format_results(records: list[dict[str, Any]], format: str) -> list[dict[str, Any]] | dict[str, list[Any]]:
+    """
+    결과를 요청한 형식으로 변환합니다.
+
+    Raises:
+        ValueError: 지원하지 않는 형식인 경우
+    """
+    check_format(format)
+    if format == "columnar":
+        return to_columnar(records)
+    return [to_record(record) for record in records]
+
+
+class ResultHandleStore:
+    """
+    큰 변환 결과를 핸들로 보관하는 LRU 저장소 (MCP 서버 프로세스 메모리)
+
+    Args:
+        max_entries: 보관할 최대 결과 수 (초과 시 가장 오래 사용되지 않은 결과부터 제거)
+        ttl_seconds: 결과 유효 시간(초). None이면 만료되지 않음
+    """
+
+    def __init__(self, max_entries: int = 64, ttl_seconds: float | None = 600):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, list[dict[str, Any]], dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, records: list[dict[str, Any]], stats: dict[str, Any]) -> str:
+        """결과를 보관하고 핸들을 반환합니다."""
+        handle = f"res_{secrets.token_hex(8)}"
+        with self._lock:
+            self._entries[handle] = (time.monotonic(), records, stats)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return handle
+
+    def get(self, handle: str) -> tuple[list[dict[str, Any]], dict[str, Any]] | None:
+        """
+        핸들로 결과를 조회합니다.
+
+        Returns:
+            (변환 결과 목록, 요청별 카운터). 없거나 만료되었으면 None
+        """
+        with self._lock:
+            entry = self._entries.get(handle)
+            if entry is None:
+                return None
+            stored_at, records, stats = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[handle]
+                return None
+            self._entries.move_to_end(handle)
+            return records, stats
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def build_payload(
+    records: list[dict[str, Any]],
+    stats: dict[str, Any],
+    format: str,
+    handles: ResultHandleStore,
+    inline_limit: int,
+    preview_size: int,
+) -> dict[str, Any]:
+    """
+    batch 변환 응답을 만듭니다. 결과가 inline_limit 이하이면 응답에 포함하고,
+    넘으면 핸들과 미리보기만 포함합니다.
+    """
+    if len(records) <= inline_limit:
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "format": format,
+            "results": format_results(records, format),
+            "stats": stats,
+        }
+    preview = format_results(records[:min(preview_size, inline_limit)], format)
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "format": format,
+        "handle": handles.put(records, stats),
+        "total": len(records),
+        "preview": preview,
+        "stats": stats,
+    }
+
+
+def page_payload(
+    handle: str,
+    records: list[dict[str, Any]],
+    stats: dict[str, Any],
+    offset: int,
+    limit: int,
+    format: str,
+) -> dict[str, Any]:
+    """
+    핸들로 보관된 결과의 한 페이지 응답
+
+    Raises:
+        ValueError: limit이 1~MAX_PAGE 범위를 벗어나거나 지원하지 않는 형식인 경우
+            (limit이 0이면 next_offset이 진행되지 않아 페이지 조회가 끝나지 않음)
+    """
+    if not 1 <= limit <= MAX_PAGE:
+        raise ValueError(f"limit은 1 이상 {MAX_PAGE} 이하여야 합니다: {limit}")
+    offset = max(0, offset)
+    page = records[offset:offset + limit]
+    next_offset = offset + len(page)
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "format": format,
+        "handle": handle,
+        "total": len(records),
+        "offset": offset,
+        "next_offset": next_offset if next_offset < len(records) else None,
+        "results": format_results(page, format),
+        "stats": stats,
+    }
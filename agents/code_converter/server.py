@@ -8,26 +8,36 @@ Usage:
     python -m agents.code_converter.server
 """
 
+import json
 import sys
 from pathlib import Path
 
-from langchain.chat_models import init_chat_model
-from deepagents import create_deep_agent
-from deepagents.backends import FilesystemBackend
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.types import CallToolResult, TextContent
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from agents.code_converter.config import (
-    get_model_config,
-    get_system_prompt,
-    get_agents_md_path,
-    get_skills_paths
+    is_rule_first_enabled,
+    get_concurrency_config,
+    get_worker_count,
+    get_result_config,
+    is_eager_agent_enabled
 )
+from agents.code_converter.results import (
+    MAX_PAGE,
+    SCHEMA_VERSION,
+    ResultHandleStore,
+    build_payload,
+    check_format,
+    page_payload,
+    to_record
+)
+from agents.code_converter.service import convert_codes, cache_stats
+from agents.code_converter.workers import ConversionWorkerPool
 from agents.code_converter.tools.lookup_code import (
-    lookup_standard_code,
     get_supported_patterns,
     CODE_MAPPING_RULES
 )
@@ -40,92 +50,172 @@ mcp = FastMCP(
     name="code-converter",
 )
 
-# ============================================================================
-# DeepAgent 설정 (코드 변환 전문가)
-# ============================================================================
+# 멀티 워커 모드의 워커 풀 (--workers 지정 시 초기화)
+worker_pool: ConversionWorkerPool | None = None
 
-def create_converter_agent():
-    """코드 변환 DeepAgent 생성 (DeepAgents 표준 구조)"""
-    
-    # 모델 설정 로드
-    model_config = get_model_config()
-    model = init_chat_model(**model_config)
-    
-    # System Prompt (WHO - 정체성과 절대 규칙)
-    system_prompt = get_system_prompt()
-    
-    # AGENTS.md 경로 (WHEN + WHICH - 비즈니스 규칙)
-    agents_md_path = get_agents_md_path()
-    
-    # Skills 경로 (HOW - 재사용 가능한 지침)
-    skills_paths = get_skills_paths()
-    
-    # Backend 설정 (FilesystemBackend)
-    agent_dir = Path(__file__).parent
-    backend = FilesystemBackend(root_dir=agent_dir)
-    
-    # DeepAgent 생성 (DeepAgents 표준 패턴)
-    agent = create_deep_agent(
-        model=model,
-        tools=[lookup_standard_code],
-        system_prompt=system_prompt,  # WHO
-        memory=[agents_md_path],      # WHEN + WHICH (MemoryMiddleware가 로드)
-        skills=skills_paths,           # HOW (SkillsMiddleware가 로드)
-        backend=backend,
-    )
-    
-    return agent
+# 응답에 포함하기에 큰 batch 결과를 보관 (fetch_conversion_results로 조회)
+_result_config = get_result_config()
+result_handles = ResultHandleStore(_result_config["max_handles"], _result_config["ttl_seconds"])
 
-# 전역 에이전트 인스턴스
-converter_agent = create_converter_agent()
 
+async def _convert(external_codes: list[str]) -> tuple[list[dict], dict[str, int]]:
+    """워커 풀이 있으면 워커 프로세스로, 없으면 현재 프로세스에서 변환"""
+    if worker_pool is not None:
+        return await worker_pool.convert(external_codes)
+    return await convert_codes(external_codes)
+
+
+def _structured(payload: dict) -> CallToolResult:
+    """
+    구조화된 결과를 structuredContent로, 같은 내용을 압축 JSON 텍스트로 반환
+    (텍스트만 읽는 클라이언트도 그대로 json.loads 가능)
+    """
+    text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return CallToolResult(content=[TextContent(type="text", text=text)], structuredContent=payload)
 
 # ============================================================================
 # MCP Tools (Agent Wrapper)
 # ============================================================================
 
 @mcp.tool()
-def convert_code(external_code: str) -> str:
+async def convert_code(external_code: str) -> CallToolResult:
     """
     [Agent 호출] 외부 코드를 내부 표준 코드로 변환합니다.
-    내부적으로 DeepAgent를 실행하여 결과를 생성합니다.
+    캐시된 코드나 매핑 규칙에 일치하는 코드는 즉시 변환하고, 그 외에는 DeepAgent를 실행하여 결과를 생성합니다.
     
     Args:
         external_code: 외부 시스템의 코드 (예: EXT-PROD-001)
         
     Returns:
-        JSON 형식의 변환 결과 문자열
+        변환 결과 레코드
+        ({"schema_version", "external_code", "standard_code", "category", "success", "message"})
     """
-    # 에이전트 실행
-    result = converter_agent.invoke({
-        "messages": [
-            {"role": "user", "content": f"코드 '{external_code}'를 변환해줘."}
-        ]
-    })
-    
-    return result["messages"][-1].content
+    results, _ = await _convert([external_code])
+    return _structured({"schema_version": SCHEMA_VERSION, **to_record(results[0])})
 
 
 @mcp.tool()
-def batch_convert_codes(external_codes: list[str]) -> str:
+async def batch_convert_codes(external_codes: list[str], format: str = "records") -> CallToolResult:
     """
     [Agent 호출] 여러 외부 코드를 한 번에 표준 코드로 변환합니다.
-    내부적으로 DeepAgent를 실행하여 결과를 생성합니다.
+    캐시된 코드나 매핑 규칙에 일치하는 코드는 즉시 변환하고, 나머지 코드만 모아 DeepAgent를 실행합니다.
+    결과가 많으면 응답에 모두 넣지 않고 결과 핸들과 미리보기만 반환합니다.
     
     Args:
         external_codes: 외부 코드 목록
+        format: 결과 형식 ("records": 레코드 목록, "columnar": 필드별 열 목록)
+        
+    Returns:
+        {"schema_version", "format", "results", "stats"} 또는
+        {"schema_version", "format", "handle", "total", "preview", "stats"}
+        (handle은 fetch_conversion_results로 페이지 단위 조회)
+    """
+    # 잘못된 형식이면 변환(에이전트 호출 포함)을 시작하기 전에 거부
+    try:
+        check_format(format)
+    except ValueError as e:
+        return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
+    results, stats = await _convert(external_codes)
+    return _structured(build_payload(
+        results, stats, format, result_handles,
+        _result_config["inline_limit"], _result_config["preview_size"],
+    ))
+
+
+@mcp.tool()
+async def fetch_conversion_results(
+    handle: str,
+    offset: int = 0,
+    limit: int = MAX_PAGE,
+    format: str = "records",
+) -> CallToolResult:
+    """
+    batch_convert_codes가 반환한 결과 핸들에서 변환 결과를 페이지 단위로 가져옵니다.
+    
+    Args:
+        handle: 결과 핸들 (예: res_0123abcd...)
+        offset: 시작 인덱스
+        limit: 최대 결과 수 (1~1000)
+        format: 결과 형식 ("records" 또는 "columnar")
         
     Returns:
-        JSON 배열 형식의 변환 결과 문자열
+        {"schema_version", "format", "handle", "total", "offset", "next_offset", "results", "stats"}
+        (next_offset이 null이면 마지막 페이지)
+    """
+    entry = result_handles.get(handle)
+    if entry is None:
+        message = f"결과 핸들을 찾을 수 없습니다 (만료되었거나 잘못된 핸들): {handle}"
+        return CallToolResult(content=[TextContent(type="text", text=message)], isError=True)
+    records, stats = entry
+    try:
+        return _structured(page_payload(handle, records, stats, offset, limit, format))
+    except ValueError as e:
+        return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
+
+
+@mcp.tool()
+async def stream_convert_codes(
+    external_codes: list[str],
+    chunk_size: int = 500,
+    ctx: Context = None,
+) -> str:
     """
-    # 에이전트 실행
-    result = converter_agent.invoke({
-        "messages": [
-            {"role": "user", "content": f"다음 코드 목록을 모두 변환해줘: {external_codes}"}
-        ]
-    })
+    [Streaming] 대량의 외부 코드를 청크 단위로 변환하며 결과를 점진적으로 전송합니다.
+    각 청크의 변환 결과는 MCP progress notification의 message로 즉시 전달되며
+    ({"offset": 시작 인덱스, "results": [...]}), 서버는 전체 결과를 누적하지 않습니다.
+    progress token 없이 호출되면 전체 결과를 응답에 포함합니다.
     
-    return result["messages"][-1].content
+    Args:
+        external_codes: 외부 코드 목록
+        chunk_size: 청크당 코드 수
+        
+    Returns:
+        JSON 형식의 요약 문자열
+        ({"schema_version", "stats"} 또는 {"schema_version", "results", "stats"})
+    """
+    chunk_size = max(1, chunk_size)
+    total = len(external_codes)
+    can_stream = ctx is not None and ctx.request_context.meta is not None \
+        and ctx.request_context.meta.progressToken is not None
+
+    stats = {"total": total, "cache_hit": 0, "store_hit": 0, "fast_path": 0, "agent_fallback": 0, "chunks": 0}
+    inline_results: list[dict] = []
+    for offset in range(0, total, chunk_size):
+        chunk = external_codes[offset:offset + chunk_size]
+        results, chunk_stats = await _convert(chunk)
+        stats["cache_hit"] += chunk_stats["cache_hit"]
+        stats["store_hit"] += chunk_stats["store_hit"]
+        stats["fast_path"] += chunk_stats["fast_path"]
+        stats["agent_fallback"] += chunk_stats["agent_fallback"]
+        stats["chunks"] += 1
+
+        if can_stream:
+            await ctx.report_progress(
+                progress=offset + len(chunk),
+                total=total,
+                message=json.dumps(
+                    {"schema_version": SCHEMA_VERSION, "offset": offset, "results": [to_record(r) for r in results]},
+                    ensure_ascii=False,
+                ),
+            )
+        else:
+            inline_results.extend(to_record(r) for r in results)
+
+    if can_stream:
+        return json.dumps({"schema_version": SCHEMA_VERSION, "stats": stats}, ensure_ascii=False)
+    return json.dumps({"schema_version": SCHEMA_VERSION, "results": inline_results, "stats": stats}, ensure_ascii=False)
+
+
+@mcp.tool()
+async def get_cache_stats() -> dict:
+    """
+    변환 결과 캐시의 통계(hit/miss/eviction 등)를 반환합니다.
+    영구 저장소를 사용 중이면 저장소 통계도 함께 반환합니다.
+    멀티 워커 모드에서는 워커별 상태와 캐시 통계를 반환합니다.
+    """
+    if worker_pool is not None:
+        return await worker_pool.stats()
+    return cache_stats()
 
 
 @mcp.tool()
@@ -140,10 +230,25 @@ def get_supported_patterns_tool() -> dict[str, str]:
 # 서버 실행
 # ============================================================================
 
+def _run_server(port: int | None) -> None:
+    """SSE(port 지정 시) 또는 stdio로 MCP 서버 실행"""
+    if port:
+        print(f"📡 Remote MCP Mode: Running SSE server on port {port}", file=sys.stderr)
+        mcp.settings.port = port
+        mcp.run(transport="sse")
+    else:
+        print("🔌 Local MCP Mode: Running on stdio", file=sys.stderr)
+        mcp.run()
+
+
 if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description="Code Converter MCP Server")
     parser.add_argument("--port", type=int, help="Port to run SSE server on (if not provided, runs on stdio)")
+    parser.add_argument(
+        "--workers", type=int, default=get_worker_count(),
+        help="Number of converter worker processes (0 = convert in the server process)",
+    )
     args = parser.parse_args()
 
     # print 문을 stderr로 출력 (stdio 통신 방해 방지)
@@ -151,11 +256,25 @@ if __name__ == "__main__":
     print("📋 지원 패턴:", list(CODE_MAPPING_RULES.keys()), file=sys.stderr)
     print("📚 AGENTS.md: 비즈니스 규칙 로드됨", file=sys.stderr)
     print("🎯 Skills: 재사용 가능한 지침 로드됨", file=sys.stderr)
+    print(f"⚡ Rule-first 모드: {'ON' if is_rule_first_enabled() else 'OFF'}", file=sys.stderr)
+    print(
+        f"🤖 변환 에이전트: {'시작 시 생성' if is_eager_agent_enabled() else '첫 LLM fallback에서 생성 (fast startup)'}",
+        file=sys.stderr,
+    )
+    concurrency_config = get_concurrency_config()
+    print(
+        f"🧵 Agent 동시 실행: 최대 {concurrency_config['max_concurrency']}개 "
+        f"(샤드 크기 {concurrency_config['shard_size']})",
+        file=sys.stderr,
+    )
+
+    if args.workers > 0:
+        print(f"👷 Multi-worker 모드: 워커 {args.workers}개 (least-outstanding 분배, 코드 해시 우선)", file=sys.stderr)
+        worker_pool = ConversionWorkerPool(args.workers)
+        worker_pool.start()
     
-    if args.port:
-        print(f"📡 Remote MCP Mode: Running SSE server on port {args.port}", file=sys.stderr)
-        mcp.settings.port = args.port
-        mcp.run(transport="sse")
-    else:
-        print("🔌 Local MCP Mode: Running on stdio", file=sys.stderr)
-        mcp.run()
+    try:
+        _run_server(args.port)
+    finally:
+        if worker_pool is not None:
+            worker_pool.shutdown()
@@ -0,0 +1,244 @@
+"""
+Code Converter Service
+======================
+코드 변환 실행 로직 (MCP 서버와 워커 프로세스가 공유)
+
+매핑 규칙(Fast Path) → 메모리 캐시 → 영구 저장소 → DeepAgent 순으로
+코드를 변환합니다. MCP 도구 정의는 server.py에 있습니다.
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+from agents.code_converter.config import (
+    get_model_config,
+    get_system_prompt,
+    get_agents_md_path,
+    get_skills_paths,
+    is_rule_first_enabled,
+    get_cache_config,
+    get_store_config,
+    get_concurrency_config,
+    is_eager_agent_enabled
+)
+from agents.code_converter.cache import ConversionCache
+from agents.code_converter.store import PersistentConversionStore
+from agents.code_converter.tools.lookup_code import (
+    lookup_standard_code,
+    convert_by_rule,
+    _convert_single_code,
+    rules_fingerprint
+)
+
+# ============================================================================
+# DeepAgent 설정 (코드 변환 전문가)
+# ============================================================================
+
+def create_converter_agent():
+    """코드 변환 DeepAgent 생성 (DeepAgents 표준 구조)"""
+    # LangChain/deepagents는 import에 수 초가 걸리므로 에이전트가 필요할 때만 로드
+    from langchain.chat_models import init_chat_model
+    from deepagents import create_deep_agent
+    from deepagents.backends import FilesystemBackend
+    
+    # 모델 설정 로드
+    model_config = get_model_config()
+    model = init_chat_model(**model_config)
+    
+    # System Prompt (WHO - 정체성과 절대 규칙)
+    system_prompt = get_system_prompt()
+    
+    # AGENTS.md 경로 (WHEN + WHICH - 비즈니스 규칙)
+    agents_md_path = get_agents_md_path()
+    
+    # Skills 경로 (HOW - 재사용 가능한 지침)
+    skills_paths = get_skills_paths()
+    
+    # Backend 설정 (FilesystemBackend)
+    agent_dir = Path(__file__).parent
+    backend = FilesystemBackend(root_dir=agent_dir)
+    
+    # DeepAgent 생성 (DeepAgents 표준 패턴)
+    agent = create_deep_agent(
+        model=model,
+        tools=[lookup_standard_code],
+        system_prompt=system_prompt,  # WHO
+        memory=[agents_md_path],      # WHEN + WHICH (MemoryMiddleware가 로드)
+        skills=skills_paths,           # HOW (SkillsMiddleware가 로드)
+        backend=backend,
+    )
+    
+    return agent
+
+# 전역 에이전트 인스턴스 (규칙으로 해석되지 않는 코드가 처음 들어올 때 생성)
+_converter_agent = None
+_converter_agent_lock = threading.Lock()
+
+
+def get_converter_agent():
+    """코드 변환 DeepAgent (첫 호출 시 생성)"""
+    global _converter_agent
+    with _converter_agent_lock:
+        if _converter_agent is None:
+            started = time.perf_counter()
+            _converter_agent = create_converter_agent()
+            print(f"🤖 변환 에이전트 준비 완료 ({(time.perf_counter() - started) * 1e3:.0f}ms)", file=sys.stderr)
+        return _converter_agent
+
+
+if is_eager_agent_enabled():
+    get_converter_agent()
+
+# 요청 간 공유되는 변환 결과 캐시 (규칙 테이블 변경 시 자동 무효화)
+conversion_cache = ConversionCache(**get_cache_config())
+
+# 재시작 후에도 유지되는 영구 저장소 (CODE_CONVERTER_STORE_PATH 설정 시)
+_store_config = get_store_config()
+conversion_store = PersistentConversionStore(**_store_config) if _store_config else None
+
+# 에이전트 fallback 동시 실행 제한
+_concurrency_config = get_concurrency_config()
+_agent_semaphore = asyncio.Semaphore(_concurrency_config["max_concurrency"])
+
+
+# ============================================================================
+# 변환 실행 (Rule-first Fast Path → 캐시 → Agent fallback)
+# ============================================================================
+
+def _parse_agent_records(content: str) -> list[dict]:
+    """에이전트 응답 문자열에서 JSON 변환 결과 목록을 추출합니다."""
+    text = content.strip()
+    if text.startswith("```"):
+        text = text.strip("`")
+        text = text[text.find("\n") + 1:] if "\n" in text else text
+    start, end = text.find("["), text.rfind("]")
+    if start == -1 or end <= start:
+        return []
+    try:
+        records = json.loads(text[start:end + 1])
+    except json.JSONDecodeError:
+        return []
+    return [r for r in records if isinstance(r, dict)]
+
+
+async def _invoke_agent_shard(external_codes: list[str]) -> list[dict]:
+    """
+    하나의 샤드를 DeepAgent로 변환 (동시 실행 수 제한)
+    에이전트 생성이나 호출이 실패하면(LLM/네트워크 오류 등) 빈 목록을 반환하여
+    해당 샤드의 코드만 기본 변환 결과로 채워지게 합니다.
+    """
+    try:
+        # 첫 fallback에서 에이전트를 만드는 동안 이벤트 루프를 막지 않음
+        agent = _converter_agent or await asyncio.to_thread(get_converter_agent)
+        async with _agent_semaphore:
+            result = await agent.ainvoke({
+                "messages": [
+                    {"role": "user", "content": f"다음 코드 목록을 모두 변환해줘: {external_codes}"}
+                ]
+            })
+    except Exception as e:
+        print(f"⚠️ 에이전트 변환 실패 ({len(external_codes)}건, 기본 변환으로 대체): {e!r}", file=sys.stderr)
+        return []
+    return _parse_agent_records(result["messages"][-1].content)
+
+
+async def _convert_with_agent(external_codes: list[str]) -> tuple[list[dict], list[bool]]:
+    """
+    규칙으로 해석되지 않는 코드만 모아 DeepAgent로 변환합니다.
+    코드가 많으면 샤드로 나누어 병렬로 실행하고,
+    에이전트 호출이 실패했거나 응답을 해석할 수 없는 코드는 기본 변환 결과로 채웁니다.
+
+    Returns:
+        (입력 순서대로의 변환 결과, 에이전트가 실제로 변환했는지 여부 - False는 기본 변환으로 채운 코드)
+    """
+    shard_size = _concurrency_config["shard_size"]
+    shards = [external_codes[i:i + shard_size] for i in range(0, len(external_codes), shard_size)]
+    shard_records = await asyncio.gather(*(_invoke_agent_shard(shard) for shard in shards))
+
+    by_code = {
+        str(r.get("external_code", "")).strip().upper(): r
+        for records in shard_records
+        for r in records
+    }
+    results = [by_code.get(code.strip().upper()) for code in external_codes]
+    resolved = [r is not None for r in results]
+    return [r or _convert_single_code(code) for r, code in zip(results, external_codes)], resolved
+
+
+def _store_key(external_code: str, fingerprint: str) -> str:
+    """영구 저장소 키 (규칙 해시 + 정규화된 코드)"""
+    return f"{fingerprint}:{ConversionCache.normalize(external_code)}"
+
+
+async def convert_codes(external_codes: list[str]) -> tuple[list[dict], dict[str, int]]:
+    """
+    매핑 규칙(rule-first 모드) → 메모리 캐시 → 영구 저장소 순으로 변환하고,
+    남은 코드만 하나의 배치로 에이전트에 전달합니다.
+    
+    Returns:
+        (입력 순서대로 정렬된 변환 결과 목록, 요청별 카운터)
+    """
+    fingerprint = rules_fingerprint()
+    rule_first = is_rule_first_enabled()
+
+    results: list[dict | None] = []
+    pending_indices: list[int] = []
+    cache_hits = 0
+    store_hits = 0
+    for i, code in enumerate(external_codes):
+        # 규칙 결과는 O(1)로 다시 계산할 수 있으므로 캐시를 거치지 않음
+        # (한정된 캐시 용량과 hit/miss 통계를 비싼 에이전트 결과에만 사용)
+        converted = convert_by_rule(code) if rule_first else None
+        if converted is None:
+            converted = conversion_cache.get(code, fingerprint)
+            if converted is not None:
+                cache_hits += 1
+            # 영구 저장소에는 에이전트 변환 결과만 저장됨
+            elif conversion_store is not None:
+                converted = conversion_store.get(_store_key(code, fingerprint))
+                if converted is not None:
+                    store_hits += 1
+                    conversion_cache.put(code, fingerprint, converted)
+        if converted is None:
+            pending_indices.append(i)
+        results.append(converted)
+
+    if pending_indices:
+        fallback, resolved = await _convert_with_agent([external_codes[i] for i in pending_indices])
+        for i, converted, from_agent in zip(pending_indices, fallback, resolved):
+            results[i] = converted
+            # 기본 변환으로 채운 결과는 일시적 오류일 수 있으므로 보관하지 않고 다음 요청에서 재시도
+            if not from_agent:
+                continue
+            conversion_cache.put(external_codes[i], fingerprint, converted)
+            if conversion_store is not None:
+                conversion_store.put(_store_key(external_codes[i], fingerprint), converted)
+
+    stats = {
+        "total": len(external_codes),
+        "cache_hit": cache_hits,
+        "store_hit": store_hits,
+        "fast_path": len(external_codes) - cache_hits - store_hits - len(pending_indices),
+        "agent_fallback": len(pending_indices),
+    }
+    print(
+        f"💾 Cache hit: {stats['cache_hit']}건 / 🗄️ Store hit: {stats['store_hit']}건 / ⚡ Fast path: {stats['fast_path']}건 / "
+        f"🤖 Agent fallback: {stats['agent_fallback']}건",
+        file=sys.stderr,
+    )
+    return results, stats
+
+
+def cache_stats() -> dict:
+    """
+    변환 결과 캐시의 통계를 반환합니다.
+    영구 저장소를 사용 중이면 저장소 통계도 함께 반환합니다.
+    """
+    stats = conversion_cache.stats()
+    if conversion_store is not None:
+        stats["store"] = conversion_store.stats()
+    return stats
@@ -0,0 +1,343 @@
+"""
+Persistent Conversion Store
+===========================
+재시작 후에도 유지되는 로컬 파일 기반 변환 결과 저장소
+
+구성:
+    conversions.log  append-only 로그. 한 줄에 하나의 JSON 레코드 [key, value]
+    conversions.idx  정렬된 인덱스. 헤더 + (키 해시 u64, 로그 오프셋 u64) 항목 배열
+
+조회 시 인덱스와 로그를 mmap으로 열어 이진 탐색 후 해당 레코드 한 줄만
+역직렬화합니다. 인덱스 이후에 추가된 로그(tail)는 열 때와 로그가 커진 뒤의 조회 시
+증분 스캔하여 메모리 dict로 관리하고, tail이 compact_threshold를 넘으면
+인덱스를 다시 만듭니다.
+
+동시성:
+    - 쓰기(append, 인덱스 재생성)는 로그 파일에 대한 flock으로 직렬화
+    - 인덱스는 임시 파일에 쓴 뒤 os.replace로 교체하므로, 읽기 측은 lock 없이
+      기존 mmap을 계속 사용하다가 inode 변경을 감지하면 다시 엽니다
+    - 조회할 때마다 로그 크기를 확인하여 다른 프로세스가 추가한(덮어쓴) 레코드를 먼저 반영
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 쓰기 lock 없이 동작
+    fcntl = None
+
+LOG_FILENAME = "conversions.log"
+INDEX_FILENAME = "conversions.idx"
+
+_INDEX_MAGIC = b"CCIDX001"
+_HEADER = struct.Struct("<8sQQ")   # magic, 인덱스가 포함하는 로그 크기, 항목 수
+_ENTRY = struct.Struct("<QQ")      # 키 해시, 로그 오프셋
+
+
+def _key_hash(key: str) -> int:
+    """64bit 키 해시"""
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class PersistentConversionStore:
+    """
+    append-only 로그 + mmap 정렬 인덱스 기반 변환 결과 저장소
+
+    Args:
+        directory: 저장 디렉토리 (없으면 생성)
+        compact_threshold: 인덱스에 포함되지 않은 tail 레코드가 이 수를 넘으면
+            인덱스를 재생성 (열 때와 put 이후)
+    """
+
+    def __init__(self, directory: str | Path, compact_threshold: int = 10_000):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.log_path = self.directory / LOG_FILENAME
+        self.index_path = self.directory / INDEX_FILENAME
+        self.compact_threshold = compact_threshold
+
+        self._lock = threading.Lock()
+        self._log_fd = os.open(self.log_path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        self._log_map: mmap.mmap | None = None
+        self._index_map: mmap.mmap | None = None
+        self._index_inode: int | None = None
+        self._indexed_size = 0
+        self._index_count = 0
+        self._tail: dict[str, int] = {}
+        self._scanned_size = 0
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+
+        with self._lock:
+            self._open_index()
+            self._scan_tail()
+        if len(self._tail) > self.compact_threshold:
+            self.compact()
+
+    # ------------------------------------------------------------------
+    # 파일 매핑
+    # ------------------------------------------------------------------
+
+    def _open_index(self) -> None:
+        """인덱스 파일을 mmap으로 열기 (없거나 손상되었으면 빈 인덱스)"""
+        if self._index_map is not None:
+            self._index_map.close()
+        self._index_map, self._index_inode = None, None
+        self._indexed_size, self._index_count = 0, 0
+
+        try:
+            with open(self.index_path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                if stat.st_size < _HEADER.size:
+                    return
+                index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return
+
+        magic, indexed_size, count = _HEADER.unpack_from(index_map, 0)
+        if magic != _INDEX_MAGIC or len(index_map) < _HEADER.size + count * _ENTRY.size:
+            index_map.close()
+            return
+
+        self._index_map, self._index_inode = index_map, stat.st_ino
+        self._indexed_size, self._index_count = indexed_size, count
+        # 인덱스 이후 구간만 tail로 다시 스캔
+        self._tail.clear()
+        self._scanned_size = indexed_size
+
+    def _ensure_log_mapped(self, end: int) -> mmap.mmap | None:
+        """로그의 [0, end) 구간이 매핑되어 있도록 필요 시 다시 매핑"""
+        if self._log_map is None or len(self._log_map) < end:
+            size = os.fstat(self._log_fd).st_size
+            if size == 0:
+                return None
+            if self._log_map is not None:
+                self._log_map.close()
+            self._log_map = mmap.mmap(self._log_fd, size, access=mmap.ACCESS_READ)
+        return self._log_map
+
+    def _scan_tail(self) -> None:
+        """인덱스/이전 스캔 이후 추가된 로그 레코드를 tail dict에 반영"""
+        size = os.fstat(self._log_fd).st_size
+        if size <= self._scanned_size:
+            return
+        log_map = self._ensure_log_mapped(size)
+        offset = self._scanned_size
+        while offset < size:
+            end = log_map.find(b"\n", offset, size)
+            if end == -1:
+                break  # 쓰는 중인 마지막 줄은 다음 스캔에서 처리
+            try:
+                key = json.loads(log_map[offset:end])[0]
+            except (ValueError, IndexError):
+                key = None
+            if isinstance(key, str):
+                self._tail[key] = offset
+            offset = end + 1
+        self._scanned_size = offset
+
+    def _read_record(self, offset: int) -> tuple[str, Any] | None:
+        """로그 오프셋의 레코드 한 줄만 역직렬화"""
+        log_map = self._ensure_log_mapped(offset + 1)
+        if log_map is None:
+            return None
+        end = log_map.find(b"\n", offset)
+        if end == -1:
+            return None
+        try:
+            key, value = json.loads(log_map[offset:end])
+        except ValueError:
+            return None
+        return key, value
+
+    def _index_lookup(self, key: str) -> Any | None:
+        """정렬된 인덱스에서 이진 탐색"""
+        index_map, count = self._index_map, self._index_count
+        if index_map is None or count == 0:
+            return None
+
+        target = _key_hash(key)
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry_hash, _ = _ENTRY.unpack_from(index_map, _HEADER.size + mid * _ENTRY.size)
+            if entry_hash < target:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        # 해시 충돌 대비: 같은 해시의 항목을 모두 확인
+        while lo < count:
+            entry_hash, offset = _ENTRY.unpack_from(index_map, _HEADER.size + lo * _ENTRY.size)
+            if entry_hash != target:
+                break
+            record = self._read_record(offset)
+            if record is not None and record[0] == key:
+                return record[1]
+            lo += 1
+        return None
+
+    def _refresh_index_if_replaced(self) -> None:
+        """다른 프로세스가 인덱스를 교체했으면 다시 열기"""
+        try:
+            inode = os.stat(self.index_path).st_ino
+        except FileNotFoundError:
+            return
+        if inode != self._index_inode:
+            self._open_index()
+
+    def _sync_with_log(self) -> None:
+        """
+        로그가 마지막 스캔 이후 커졌으면 (다른 프로세스의 쓰기) 공유 lock을 잡고 새 레코드를 반영
+        (lock 보유 상태에서 호출 - 로그 크기가 그대로이면 fstat 한 번으로 끝남)
+        """
+        if os.fstat(self._log_fd).st_size <= self._scanned_size:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._log_fd, fcntl.LOCK_SH)
+        try:
+            self._refresh_index_if_replaced()
+            self._scan_tail()
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._log_fd, fcntl.LOCK_UN)
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Any | None:
+        """
+        저장된 값을 조회합니다.
+
+        Args:
+            key: 레코드 키
+
+        Returns:
+            저장된 값. 없으면 None
+        """
+        with self._lock:
+            # 다른 프로세스가 같은 키를 덮어썼을 수 있으므로 조회 전에 항상 새 레코드를 반영
+            self._sync_with_log()
+            value = self._lookup(key)
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return value
+
+    def _lookup(self, key: str) -> Any | None:
+        offset = self._tail.get(key)
+        if offset is not None:
+            record = self._read_record(offset)
+            if record is not None and record[0] == key:
+                return record[1]
+        return self._index_lookup(key)
+
+    def _ends_with_newline(self, size: int) -> bool:
+        """로그의 마지막 바이트가 줄바꿈인지 (쓰기 lock 보유 상태에서 호출)"""
+        if size == 0:
+            return True
+        os.lseek(self._log_fd, size - 1, os.SEEK_SET)
+        return os.read(self._log_fd, 1) == b"\n"
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        레코드를 로그에 추가합니다 (같은 키는 마지막 기록이 우선).
+        인덱스에 포함되지 않은 tail 레코드가 compact_threshold를 넘으면 인덱스를 재생성합니다.
+        """
+        line = (json.dumps([key, value], ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            if fcntl is not None:
+                fcntl.flock(self._log_fd, fcntl.LOCK_EX)
+            try:
+                size = os.fstat(self._log_fd).st_size
+                offset = size
+                # 이전 프로세스가 쓰는 도중 종료되어 마지막 줄이 잘렸으면 줄바꿈으로 끝내고 기록
+                # (잘린 줄은 해석할 수 없는 한 줄로 남아 스캔 시 건너뜀)
+                if not self._ends_with_newline(size):
+                    line = b"\n" + line
+                    offset += 1
+                os.write(self._log_fd, line)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._log_fd, fcntl.LOCK_UN)
+            # 이 프로세스가 쓴 레코드는 즉시 tail에 반영
+            self._tail[key] = offset
+            if size == self._scanned_size:
+                self._scanned_size = size + len(line)
+            self._writes += 1
+            needs_compaction = len(self._tail) > self.compact_threshold
+        # 오래 실행되는 서버에서도 tail이 계속 커지지 않도록 임계값을 넘으면 바로 재생성
+        if needs_compaction:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        로그 전체를 포함하는 정렬 인덱스를 다시 만들어 원자적으로 교체합니다.
+        같은 키의 레코드가 여러 개면 마지막 오프셋만 인덱스에 남깁니다.
+        """
+        with self._lock:
+            if fcntl is not None:
+                fcntl.flock(self._log_fd, fcntl.LOCK_EX)
+            try:
+                latest: dict[str, int] = {}
+                size = os.fstat(self._log_fd).st_size
+                log_map = self._ensure_log_mapped(size)
+                offset = 0
+                while log_map is not None and offset < size:
+                    end = log_map.find(b"\n", offset, size)
+                    if end == -1:
+                        break
+                    try:
+                        key = json.loads(log_map[offset:end])[0]
+                    except (ValueError, IndexError):
+                        key = None
+                    if isinstance(key, str):
+                        latest[key] = offset
+                    offset = end + 1
+
+                entries = sorted((_key_hash(key), off) for key, off in latest.items())
+                tmp_path = self.index_path.with_suffix(f".tmp.{os.getpid()}")
+                with open(tmp_path, "wb") as f:
+                    f.write(_HEADER.pack(_INDEX_MAGIC, offset, len(entries)))
+                    for entry in entries:
+                        f.write(_ENTRY.pack(*entry))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.index_path)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._log_fd, fcntl.LOCK_UN)
+            self._open_index()
+            self._scan_tail()
+
+    def stats(self) -> dict[str, Any]:
+        """저장소 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "path": str(self.directory),
+                "log_bytes": os.fstat(self._log_fd).st_size,
+                "indexed_records": self._index_count,
+                "tail_records": len(self._tail),
+                "hits": self._hits,
+                "misses": self._misses,
+                "writes": self._writes,
+            }
+
+    def close(self) -> None:
+        """매핑과 파일 디스크립터 정리"""
+        with self._lock:
+            for mapped in (self._log_map, self._index_map):
+                if mapped is not None:
+                    mapped.close()
+            self._log_map, self._index_map = None, None
+            os.close(self._log_fd)
@@ -0,0 +1,143 @@
+"""
+Bulk Code Converter
+===================
+대량의 외부 코드를 열(column) 단위로 변환하는 도구
+
+코드마다 결과 딕셔너리를 만드는 대신 표준 코드 배열과 카테고리 ID 배열을
+반환합니다. 카테고리/메시지는 작은 카테고리 테이블에 한 번만 저장되고,
+중복 코드는 고유값 단위로 한 번만 변환됩니다.
+NumPy가 설치되어 있으면 NumPy 배열을, 없으면 list/array를 사용합니다.
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Any, Iterable, Sequence
+
+from agents.code_converter.tools.lookup_code import (
+    CODE_MAPPING_RULES,
+    SUCCESS_MESSAGE,
+    UNKNOWN_MESSAGE,
+    get_rule_matcher,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 없이도 동작 (순수 Python 경로)
+    np = None
+
+
+@dataclass(frozen=True)
+class CategoryTable:
+    """카테고리 ID → (카테고리, 메시지) 테이블"""
+
+    categories: tuple[str, ...]
+    messages: tuple[str, ...]
+    unknown_id: int
+
+    @classmethod
+    def from_rules(cls, rules: dict[str, dict[str, str]]) -> "CategoryTable":
+        """매핑 규칙의 카테고리 + 알 수 없는 패턴(X)으로 테이블 생성"""
+        categories = list(dict.fromkeys(rule["category"] for rule in rules.values()))
+        messages = [SUCCESS_MESSAGE] * len(categories)
+        categories.append("X")
+        messages.append(UNKNOWN_MESSAGE)
+        return cls(tuple(categories), tuple(messages), len(categories) - 1)
+
+
+@dataclass(frozen=True)
+class BulkConversionResult:
+    """
+    열 단위 변환 결과
+
+    Attributes:
+        standard_codes: 입력 순서대로의 표준 코드 배열
+        category_ids: 입력 순서대로의 카테고리 ID 배열 (table 인덱스)
+        table: 카테고리 ID → 카테고리/메시지 테이블
+    """
+
+    standard_codes: Any
+    category_ids: Any
+    table: CategoryTable
+
+    def __len__(self) -> int:
+        return len(self.standard_codes)
+
+    def categories(self) -> list[str]:
+        """입력 순서대로의 카테고리 목록"""
+        names = self.table.categories
+        return [names[i] for i in self.category_ids]
+
+    def to_records(self, external_codes: Sequence[str]) -> list[dict[str, Any]]:
+        """
+        lookup_standard_code와 같은 형식의 딕셔너리 목록으로 변환합니다.
+        (호환용 - 대량 데이터에서는 열 형식을 그대로 사용하세요)
+        """
+        table = self.table
+        return [
+            {
+                "external_code": str(code).strip().upper(),
+                "standard_code": str(std),
+                "category": table.categories[cid],
+                "success": True,
+                "message": table.messages[cid],
+            }
+            for code, std, cid in zip(external_codes, self.standard_codes, self.category_ids)
+        ]
+
+
+def _convert_unique(codes: Iterable[str], table: CategoryTable) -> tuple[list[str], list[int]]:
+    """고유 코드 목록을 (표준 코드, 카테고리 ID) 목록으로 변환"""
+    matcher = get_rule_matcher()
+    category_ids = {category: i for i, category in enumerate(table.categories[:table.unknown_id])}
+    standard_codes: list[str] = []
+    ids: list[int] = []
+    for code in codes:
+        rule, code_num = matcher.match(str(code).strip().upper())
+        if rule is None:
+            standard_codes.append(f"STD-{code_num.zfill(3)}-X")
+            ids.append(table.unknown_id)
+        else:
+            standard_codes.append(f"{rule['prefix']}-{code_num.zfill(3)}-{rule['category']}")
+            ids.append(category_ids[rule["category"]])
+    return standard_codes, ids
+
+
+def bulk_convert_codes(external_codes: Sequence[str] | Any) -> BulkConversionResult:
+    """
+    대량의 외부 코드를 열 형식으로 변환합니다.
+
+    Args:
+        external_codes: 외부 코드 시퀀스 또는 NumPy 문자열 배열
+
+    Returns:
+        표준 코드 배열 + 카테고리 ID 배열 + 카테고리 테이블
+    """
+    table = CategoryTable.from_rules(CODE_MAPPING_RULES)
+    id_dtype = "B" if len(table.categories) <= 256 else "H"
+
+    if np is not None:
+        codes = np.asarray(external_codes)
+        if codes.size == 0:
+            return BulkConversionResult(np.array([], dtype=str), np.array([], dtype=id_dtype), table)
+
+        # 고유 코드만 변환한 뒤 inverse 인덱스로 원래 순서에 펼침
+        unique_codes, inverse = np.unique(codes.ravel(), return_inverse=True)
+        standard_codes, ids = _convert_unique(unique_codes.tolist(), table)
+        return BulkConversionResult(
+            standard_codes=np.asarray(standard_codes)[inverse],
+            category_ids=np.asarray(ids, dtype=id_dtype)[inverse],
+            table=table,
+        )
+
+    # 순수 Python 경로: 고유 코드별 결과를 메모이제이션
+    memo: dict[str, tuple[str, int]] = {}
+    standard_codes: list[str] = []
+    ids = array(id_dtype)
+    for code in external_codes:
+        hit = memo.get(code)
+        if hit is None:
+            converted, converted_ids = _convert_unique([code], table)
+            hit = memo[code] = (converted[0], converted_ids[0])
+        standard_codes.append(hit[0])
+        ids.append(hit[1])
+    return BulkConversionResult(standard_codes, ids, table)
@@ -4,24 +4,119 @@ Code Converter Tools
 외부 코드를 내부 표준 코드로 변환하는 도구 모음
 """
 
-import re
-from typing import Any
+import hashlib
+import json
+from types import MappingProxyType
+from typing import Any, Mapping
 
+from agents.code_converter.tools.matcher import RuleMatcher
 
-# 외부 코드 패턴별 매핑 규칙
-CODE_MAPPING_RULES = {
-    "EXT-PROD": {"prefix": "STD", "category": "A"},  # 외부 제품
-    "EXT-SVC": {"prefix": "STD", "category": "B"},   # 외부 서비스
-    "EXT-MAT": {"prefix": "STD", "category": "C"},   # 외부 자재
-    "VENDOR": {"prefix": "STD", "category": "V"},    # 벤더 코드
-    "PARTNER": {"prefix": "STD", "category": "P"},   # 파트너 코드
+
+# 외부 코드 패턴별 매핑 규칙 (원본 - 변경은 update_mapping_rules로만)
+_mapping_rules: dict[str, Mapping[str, str]] = {
+    "EXT-PROD": MappingProxyType({"prefix": "STD", "category": "A"}),  # 외부 제품
+    "EXT-SVC": MappingProxyType({"prefix": "STD", "category": "B"}),   # 외부 서비스
+    "EXT-MAT": MappingProxyType({"prefix": "STD", "category": "C"}),   # 외부 자재
+    "VENDOR": MappingProxyType({"prefix": "STD", "category": "V"}),    # 벤더 코드
+    "PARTNER": MappingProxyType({"prefix": "STD", "category": "P"}),   # 파트너 코드
 }
 
+# 읽기 전용 뷰: 규칙을 직접 수정하면 TypeError가 발생하므로
+# 모든 변경이 _rules_version을 올리고 컴파일된 매처/해시가 항상 최신 상태로 유지됨
+CODE_MAPPING_RULES: Mapping[str, Mapping[str, str]] = MappingProxyType(_mapping_rules)
+
+# 변환 결과 메시지
+SUCCESS_MESSAGE = "코드가 성공적으로 변환되었습니다."
+UNKNOWN_MESSAGE = "알 수 없는 패턴입니다. 기본 카테고리(X)로 변환되었습니다."
+
+
+# 규칙 테이블 변경 감지를 위한 버전 (update_mapping_rules 호출 시 증가)
+_rules_version = 0
+
+# 컴파일된 매처 캐시: 규칙 버전 → RuleMatcher
+_matcher_cache: tuple[int, RuleMatcher] | None = None
+
+# 규칙 해시 캐시: 규칙 버전 → 해시 (변환 요청/청크마다 규칙 테이블 전체를 직렬화하지 않도록)
+_fingerprint_cache: tuple[int, str] | None = None
+
+
+def update_mapping_rules(rules: dict[str, dict[str, str]]) -> None:
+    """
+    매핑 규칙을 추가/변경하고 컴파일된 매처를 무효화합니다.
+    규칙 테이블을 바꾸는 유일한 방법입니다 (CODE_MAPPING_RULES는 읽기 전용).
+    
+    Args:
+        rules: 추가하거나 덮어쓸 prefix → 규칙 딕셔너리
+    """
+    global _rules_version
+    _mapping_rules.update({pattern: MappingProxyType(dict(rule)) for pattern, rule in rules.items()})
+    _rules_version += 1
+
 
-def _extract_code_number(external_code: str) -> str:
-    """외부 코드에서 숫자 부분 추출"""
-    match = re.search(r'(\d+)', external_code)
-    return match.group(1) if match else "000"
+def rules_fingerprint() -> str:
+    """
+    현재 매핑 규칙 테이블의 내용 해시를 반환합니다.
+    규칙 버전이 바뀐 경우(update_mapping_rules 호출)에만 다시 계산합니다.
+    """
+    global _fingerprint_cache
+    if _fingerprint_cache is None or _fingerprint_cache[0] != _rules_version:
+        payload = json.dumps(
+            {pattern: dict(rule) for pattern, rule in _mapping_rules.items()},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        _fingerprint_cache = (_rules_version, hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16])
+    return _fingerprint_cache[1]
+
+
+def get_rule_matcher() -> RuleMatcher:
+    """
+    현재 매핑 규칙에 대한 컴파일된 매처를 반환합니다.
+    규칙 테이블이 바뀐 경우(update_mapping_rules 호출)에만 다시 컴파일합니다.
+    """
+    global _matcher_cache
+    if _matcher_cache is None or _matcher_cache[0] != _rules_version:
+        _matcher_cache = (_rules_version, RuleMatcher(CODE_MAPPING_RULES))
+    return _matcher_cache[1]
+
+
+def _build_result(external_code: str, rule: dict[str, str] | None, code_num: str) -> dict[str, Any]:
+    """매칭 결과로 변환 결과 딕셔너리 생성"""
+    if rule is None:
+        # 알 수 없는 패턴인 경우 기본 변환
+        return {
+            "external_code": external_code,
+            "standard_code": f"STD-{code_num.zfill(3)}-X",
+            "category": "X",
+            "success": True,
+            "message": UNKNOWN_MESSAGE
+        }
+
+    standard_code = f"{rule['prefix']}-{code_num.zfill(3)}-{rule['category']}"
+    return {
+        "external_code": external_code,
+        "standard_code": standard_code,
+        "category": rule["category"],
+        "success": True,
+        "message": SUCCESS_MESSAGE
+    }
+
+
+def convert_by_rule(external_code: str) -> dict[str, Any] | None:
+    """
+    매핑 규칙에 일치하는 코드만 결정적으로 변환합니다 (Fast Path).
+    
+    Args:
+        external_code: 외부 시스템의 코드 (예: EXT-PROD-001)
+        
+    Returns:
+        변환 결과 딕셔너리. 일치하는 규칙이 없으면 None
+    """
+    external_code = external_code.strip().upper()
+    rule, code_num = get_rule_matcher().match(external_code)
+    if rule is None:
+        return None
+    return _build_result(external_code, rule, code_num)
 
 
 def _convert_single_code(external_code: str) -> dict[str, Any]:
@@ -36,29 +131,9 @@ def _convert_single_code(external_code: str) -> dict[str, Any]:
     """
     external_code = external_code.strip().upper()
     
-    # 매핑 규칙 찾기
-    for pattern, rule in CODE_MAPPING_RULES.items():
-        if external_code.startswith(pattern):
-            code_num = _extract_code_number(external_code)
-            standard_code = f"{rule['prefix']}-{code_num.zfill(3)}-{rule['category']}"
-            return {
-                "external_code": external_code,
-                "standard_code": standard_code,
-                "category": rule["category"],
-                "success": True,
-                "message": f"코드가 성공적으로 변환되었습니다."
-            }
-    
-    # 알 수 없는 패턴인 경우 기본 변환
-    code_num = _extract_code_number(external_code)
-    standard_code = f"STD-{code_num.zfill(3)}-X"
-    return {
-        "external_code": external_code,
-        "standard_code": standard_code,
-        "category": "X",
-        "success": True,
-        "message": "알 수 없는 패턴입니다. 기본 카테고리(X)로 변환되었습니다."
-    }
+    # 매핑 규칙과 숫자 그룹을 한 번에 찾기
+    rule, code_num = get_rule_matcher().match(external_code)
+    return _build_result(external_code, rule, code_num)
 
 
 def lookup_standard_code(external_code: str) -> dict[str, Any]:
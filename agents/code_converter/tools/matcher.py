@@ -0,0 +1,81 @@
+"""
+Code Mapping Rule Matcher
+=========================
+매핑 규칙 테이블을 하나의 정규식으로 컴파일하는 매처
+
+규칙 prefix들로 trie를 만든 뒤 이를 단일 정규식으로 렌더링합니다.
+trie 구조 덕분에 규칙 수와 무관하게 코드 길이에 비례하는 시간으로
+가장 긴 prefix와 숫자 그룹을 한 번의 매칭으로 찾습니다.
+"""
+
+import re
+from typing import Any
+
+# trie 노드에서 prefix 종료를 나타내는 키 (문자 키와 충돌하지 않음)
+_END = ""
+
+
+def _build_trie(patterns: list[str]) -> dict[str, Any]:
+    """prefix 목록으로 문자 단위 trie 생성"""
+    root: dict[str, Any] = {}
+    for pattern in patterns:
+        node = root
+        for ch in pattern:
+            node = node.setdefault(ch, {})
+        node[_END] = True
+    return root
+
+
+def _render_trie(node: dict[str, Any]) -> str:
+    """
+    trie를 정규식 문자열로 렌더링합니다.
+
+    각 분기는 서로 다른 문자로 시작하므로 순서와 무관하게 배타적이고,
+    종료 노드 뒤의 자식 패턴은 greedy `?`로 감싸 가장 긴 prefix를 우선합니다.
+    """
+    alternatives = [
+        re.escape(ch) + _render_trie(child)
+        for ch, child in sorted(node.items())
+        if ch != _END
+    ]
+    if not alternatives:
+        return ""
+
+    body = alternatives[0] if len(alternatives) == 1 else f"(?:{'|'.join(alternatives)})"
+    if _END in node:
+        body = f"(?:{body})?"
+    return body
+
+
+class RuleMatcher:
+    """
+    매핑 규칙 테이블로부터 컴파일된 prefix 매처
+
+    Args:
+        rules: 외부 코드 prefix → 규칙 딕셔너리 (CODE_MAPPING_RULES 형식)
+    """
+
+    def __init__(self, rules: dict[str, dict[str, str]]):
+        self.rules = dict(rules)
+        patterns = [p for p in self.rules if p]
+        trie = _render_trie(_build_trie(patterns)) if patterns else ""
+
+        # 1) lookahead로 가장 긴 prefix를 캡처하되 위치는 소비하지 않고
+        # 2) 코드 처음부터 첫 번째 숫자 그룹을 찾습니다 (re.search(r'\d+')와 동일)
+        prefix_group = f"(?:(?=({trie})))?" if trie else "()"
+        self._pattern = re.compile(rf"{prefix_group}\D*(\d*)")
+
+    def match(self, external_code: str) -> tuple[dict[str, str] | None, str]:
+        """
+        정규화된 외부 코드에 대해 규칙과 숫자 그룹을 한 번에 찾습니다.
+
+        Args:
+            external_code: 정규화된(strip/upper) 외부 코드
+
+        Returns:
+            (일치한 규칙 또는 None, 숫자 문자열 - 숫자가 없으면 "000")
+        """
+        m = self._pattern.match(external_code)
+        prefix, digits = m.group(1), m.group(2)
+        rule = self.rules.get(prefix) if prefix else None
+        return rule, digits or "000"
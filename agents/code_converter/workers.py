@@ -0,0 +1,404 @@
+"""
+Code Converter Worker Pool
+==========================
+여러 워커 프로세스에 코드 변환을 분산하는 로컬 디스패처
+
+MCP 엔드포인트(SSE/stdio)는 메인 프로세스 하나가 담당하고, 실제 변환
+(규칙 매칭, 캐시, 에이전트 실행)은 N개의 워커 프로세스가 수행합니다.
+
+분배:
+    처리 중인 코드 수가 가장 적은 워커(least-outstanding-work)에 전달하는 것이 기본입니다.
+    워커마다 변환 캐시가 따로 있으므로, 변환 요청의 코드는 정규화된 코드의 해시로
+    담당 워커를 정해 나누고, 담당 워커에 밀린 코드 수가 가장 한가한 워커보다
+    spill_threshold 넘게 많지 않을 때만 담당 워커에 보냅니다. 특정 워커로 몰리는 입력은 한계를 넘는
+    청크부터 한가한 워커로 넘어가므로 (해당 코드는 그 워커에서 캐시 miss) 부하가 고르게 유지됩니다.
+
+장애 처리:
+    죽은 워커는 지수 백오프로 재시작되고 처리 중이던 요청은 다른 워커로 재전송됩니다.
+    연속으로 max_restarts번 실패한 워커(예: import 시점 오류)는 더 이상 재시작하지 않고
+    degraded로 표시되며, 해당 워커의 코드는 살아 있는 다른 워커가 처리합니다.
+"""
+
+import asyncio
+import itertools
+import multiprocessing as mp
+import queue
+import signal
+import sys
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Any
+
+# 워커가 죽었을 때 같은 요청을 다시 보낼 최대 횟수
+MAX_REDISPATCH = 1
+
+# 이 시간(초) 이상 실행된 뒤 종료된 워커는 연속 실패 횟수를 초기화
+STABLE_UPTIME = 60.0
+
+
+def _worker_main(worker_id: int, requests: Any, responses: Any) -> None:
+    """워커 프로세스 진입점: 요청 큐를 읽어 변환 후 응답 큐에 결과 전달"""
+    # 종료 신호는 부모 프로세스가 처리 (Ctrl+C 시 워커가 먼저 죽어 재시작되지 않도록)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    from agents.code_converter.service import convert_codes, cache_stats
+
+    async def handle(request_id: int, kind: str, payload: Any) -> None:
+        try:
+            if kind == "convert":
+                result = await convert_codes(payload)
+            elif kind == "stats":
+                result = cache_stats()
+            else:
+                raise ValueError(f"알 수 없는 요청 종류: {kind}")
+            responses.put((worker_id, request_id, result, None))
+        except Exception as e:
+            responses.put((worker_id, request_id, None, repr(e)))
+
+    async def serve() -> None:
+        loop = asyncio.get_running_loop()
+        tasks: set[asyncio.Task] = set()
+        while True:
+            message = await loop.run_in_executor(None, requests.get)
+            if message is None:
+                break
+            task = asyncio.create_task(handle(*message))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    print(f"👷 Converter worker #{worker_id} 준비 완료", file=sys.stderr)
+    asyncio.run(serve())
+
+
+@dataclass
+class _PendingRequest:
+    """워커에 전달된 요청 (재전송을 위해 내용 보관)"""
+
+    future: asyncio.Future
+    kind: str
+    payload: Any
+    weight: int
+    attempts: int = 0
+
+
+@dataclass
+class _WorkerSlot:
+    """워커 프로세스 하나의 상태"""
+
+    worker_id: int
+    process: Any = None
+    requests: Any = None
+    outstanding: int = 0
+    inflight: dict[int, _PendingRequest] = field(default_factory=dict)
+    restarts: int = 0
+    started_at: float = 0.0
+    # 연속 실패 횟수와 다음 재시작 시각 (재시작 대기 중에는 process가 죽어 있음)
+    failures: int = 0
+    restart_at: float | None = None
+    # 재시작 한도를 넘어 더 이상 재시작하지 않는 워커
+    degraded: bool = False
+
+    @property
+    def available(self) -> bool:
+        return not self.degraded and self.restart_at is None and self.process.is_alive()
+
+
+class ConversionWorkerPool:
+    """
+    코드 변환 워커 프로세스 풀
+
+    Args:
+        num_workers: 워커 프로세스 수
+        dispatch_chunk_size: 워커 하나에 한 번에 보낼 최대 코드 수
+        health_interval: 워커 생존 확인 주기(초)
+        max_restarts: 연속 실패가 이 횟수를 넘으면 워커를 degraded로 표시하고 재시작 중단
+        restart_backoff: 첫 재시작 대기 시간(초) - 연속 실패마다 두 배
+        max_restart_backoff: 재시작 대기 시간 상한(초)
+        spill_threshold: 담당 워커의 처리 중 코드 수가 가장 한가한 워커보다 이 값보다 많으면
+            한가한 워커로 보냄 (None이면 dispatch_chunk_size, 0이면 항상 least-outstanding)
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        dispatch_chunk_size: int = 1000,
+        health_interval: float = 1.0,
+        max_restarts: int = 5,
+        restart_backoff: float = 1.0,
+        max_restart_backoff: float = 60.0,
+        spill_threshold: int | None = None,
+    ):
+        self.num_workers = max(1, num_workers)
+        self.dispatch_chunk_size = max(1, dispatch_chunk_size)
+        self.health_interval = health_interval
+        self.max_restarts = max_restarts
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+        self.spill_threshold = self.dispatch_chunk_size if spill_threshold is None else max(0, spill_threshold)
+
+        self._ctx = mp.get_context("spawn")
+        self._responses = self._ctx.Queue()
+        self._slots = [_WorkerSlot(worker_id=i) for i in range(self.num_workers)]
+        self._request_ids = itertools.count()
+        # 사용 가능한 워커가 없을 때 재시작을 기다리는 요청
+        self._backlog: list[tuple[int, _PendingRequest]] = []
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """워커 프로세스와 응답 수신/상태 확인 스레드 시작"""
+        for slot in self._slots:
+            self._spawn(slot)
+        for target in (self._receive_loop, self._monitor_loop):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """워커에 종료 요청 후 정리"""
+        self._closed.set()
+        with self._lock:
+            slots = list(self._slots)
+        for slot in slots:
+            try:
+                slot.requests.put(None)
+            except Exception:
+                pass
+        for slot in slots:
+            slot.process.join(timeout)
+            if slot.process.is_alive():
+                slot.process.terminate()
+
+    def _spawn(self, slot: _WorkerSlot) -> None:
+        """슬롯에 새 워커 프로세스 생성 (lock 보유 상태 또는 시작 시 호출)"""
+        slot.requests = self._ctx.Queue()
+        slot.process = self._ctx.Process(
+            target=_worker_main,
+            args=(slot.worker_id, slot.requests, self._responses),
+            name=f"code-converter-worker-{slot.worker_id}",
+            daemon=True,
+        )
+        slot.process.start()
+        slot.started_at = time.monotonic()
+        slot.restart_at = None
+
+    @property
+    def degraded(self) -> bool:
+        """재시작 한도를 넘은 워커가 있는지"""
+        return any(slot.degraded for slot in self._slots)
+
+    # ------------------------------------------------------------------
+    # 디스패치
+    # ------------------------------------------------------------------
+
+    def _dispatch(self, request_id: int, pending: _PendingRequest, worker_id: int | None = None) -> None:
+        """
+        처리 중인 작업량이 가장 적은 워커에 요청 전달 (lock 보유 상태에서 호출)
+        worker_id를 지정하면 그 워커를 우선하되, 변환 요청은 지정한 워커가 가장 한가한 워커보다
+        spill_threshold 넘게 밀려 있으면 한가한 워커로 보냅니다.
+        """
+        available = [slot for slot in self._slots if slot.available]
+        least = min(available, key=lambda s: s.outstanding) if available else None
+        preferred = self._slots[worker_id] if worker_id is not None else None
+        if preferred is not None and preferred.available and not (
+            pending.kind == "convert" and preferred.outstanding > least.outstanding + self.spill_threshold
+        ):
+            slot = preferred
+        elif least is not None:
+            slot = least
+        elif not all(slot.degraded for slot in self._slots):
+            # 모든 워커가 재시작 대기 중이면 재시작 후 전달
+            self._backlog.append((request_id, pending))
+            return
+        else:
+            _resolve(pending.future, None, "사용 가능한 converter 워커가 없습니다 (모든 워커 degraded)")
+            return
+        pending.attempts += 1
+        slot.inflight[request_id] = pending
+        slot.outstanding += pending.weight
+        slot.requests.put((request_id, pending.kind, pending.payload))
+
+    async def submit(self, kind: str, payload: Any, weight: int = 1, worker_id: int | None = None) -> Any:
+        """
+        워커 하나에 요청을 보내고 결과를 기다립니다.
+
+        Args:
+            kind: 요청 종류 ("convert" 또는 "stats")
+            payload: 요청 데이터
+            weight: 작업량 (least-outstanding 계산에 사용, 보통 코드 수)
+            worker_id: 우선할 워커 (None이거나 사용할 수 없으면 least-outstanding 워커,
+                변환 요청은 밀려 있으면 spill_threshold 기준으로 다른 워커)
+        """
+        future = asyncio.get_running_loop().create_future()
+        pending = _PendingRequest(future=future, kind=kind, payload=payload, weight=max(1, weight))
+        with self._lock:
+            self._dispatch(next(self._request_ids), pending, worker_id)
+        return await future
+
+    def _route(self, external_code: str) -> int:
+        """코드 해시로 담당 워커 결정 (부하가 고르면 같은 코드는 같은 워커의 캐시를 사용)"""
+        normalized = external_code.strip().upper().encode("utf-8")
+        return zlib.crc32(normalized) % self.num_workers
+
+    async def convert(self, external_codes: list[str]) -> tuple[list[dict], dict[str, int]]:
+        """
+        코드를 담당 워커별로 나누어(dispatch_chunk_size 단위) 병렬로 변환합니다.
+        담당 워커가 밀려 있는 청크는 처리 중인 작업량이 가장 적은 워커가 변환합니다.
+
+        Returns:
+            (입력 순서대로 정렬된 변환 결과 목록, 합산된 카운터)
+        """
+        if not external_codes:
+            return [], {"total": 0, "cache_hit": 0, "store_hit": 0, "fast_path": 0, "agent_fallback": 0}
+
+        by_worker: dict[int, list[int]] = {}
+        for i, code in enumerate(external_codes):
+            by_worker.setdefault(self._route(code), []).append(i)
+
+        size = self.dispatch_chunk_size
+        batches = [
+            (worker_id, indices[start:start + size])
+            for worker_id, indices in by_worker.items()
+            for start in range(0, len(indices), size)
+        ]
+        parts = await asyncio.gather(*(
+            self.submit("convert", [external_codes[i] for i in indices], len(indices), worker_id)
+            for worker_id, indices in batches
+        ))
+
+        results: list[dict | None] = [None] * len(external_codes)
+        stats: dict[str, int] = {}
+        for (_, indices), (part_results, part_stats) in zip(batches, parts):
+            for i, converted in zip(indices, part_results):
+                results[i] = converted
+            for key, value in part_stats.items():
+                stats[key] = stats.get(key, 0) + value
+        return results, stats
+
+    async def stats(self) -> dict[str, Any]:
+        """워커별 상태와 캐시 통계"""
+        with self._lock:
+            pool = [
+                {
+                    "worker_id": slot.worker_id,
+                    "pid": slot.process.pid,
+                    "alive": slot.process.is_alive(),
+                    "outstanding": slot.outstanding,
+                    "restarts": slot.restarts,
+                    "consecutive_failures": slot.failures,
+                    "degraded": slot.degraded,
+                }
+                for slot in self._slots
+            ]
+            available = {slot.worker_id for slot in self._slots if slot.available}
+        caches = await asyncio.gather(
+            *(self.submit("stats", None, worker_id=worker["worker_id"]) for worker in pool
+              if worker["worker_id"] in available),
+            return_exceptions=True,
+        )
+        for worker in pool:
+            worker["cache"] = {"error": "worker unavailable"}
+        for worker, cache in zip((w for w in pool if w["worker_id"] in available), caches):
+            worker["cache"] = cache if not isinstance(cache, BaseException) else {"error": str(cache)}
+        return {"degraded": any(worker["degraded"] for worker in pool), "workers": pool}
+
+    # ------------------------------------------------------------------
+    # 백그라운드 스레드
+    # ------------------------------------------------------------------
+
+    def _receive_loop(self) -> None:
+        """응답 큐를 읽어 해당 요청의 future 완료"""
+        while not self._closed.is_set():
+            try:
+                worker_id, request_id, result, error = self._responses.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                break
+
+            with self._lock:
+                slot = self._slots[worker_id]
+                pending = slot.inflight.pop(request_id, None)
+                if pending is not None:
+                    slot.outstanding -= pending.weight
+            if pending is not None:
+                _resolve(pending.future, result, error)
+
+    def _monitor_loop(self) -> None:
+        """
+        죽은 워커를 백오프 후 재시작하고 처리 중이던 요청을 다른 워커로 재전송
+        (연속 실패가 max_restarts를 넘으면 degraded로 표시하고 재시작하지 않음)
+        """
+        while not self._closed.wait(self.health_interval):
+            with self._lock:
+                now = time.monotonic()
+                for slot in self._slots:
+                    if slot.degraded:
+                        continue
+                    if slot.restart_at is not None:
+                        if now >= slot.restart_at:
+                            slot.restarts += 1
+                            self._spawn(slot)
+                            backlog, self._backlog = self._backlog, []
+                            for request_id, pending in backlog:
+                                self._dispatch(request_id, pending)
+                        continue
+                    if slot.process.is_alive():
+                        continue
+
+                    exitcode = slot.process.exitcode
+                    orphaned = slot.inflight
+                    slot.inflight, slot.outstanding = {}, 0
+                    slot.failures = 1 if now - slot.started_at >= STABLE_UPTIME else slot.failures + 1
+                    if slot.failures > self.max_restarts:
+                        slot.degraded = True
+                        print(
+                            f"🛑 Converter worker #{slot.worker_id} 연속 {slot.failures}회 종료 (exit={exitcode}), "
+                            f"재시작을 중단합니다 (degraded)",
+                            file=sys.stderr,
+                        )
+                    else:
+                        delay = min(self.restart_backoff * 2 ** (slot.failures - 1), self.max_restart_backoff)
+                        slot.restart_at = now + delay
+                        print(
+                            f"♻️ Converter worker #{slot.worker_id} 종료 감지 (exit={exitcode}), "
+                            f"{delay:.1f}초 후 재시작합니다 ({slot.failures}/{self.max_restarts})",
+                            file=sys.stderr,
+                        )
+
+                    for request_id, pending in orphaned.items():
+                        if pending.attempts > MAX_REDISPATCH:
+                            _resolve(pending.future, None, f"worker #{slot.worker_id} crashed (exit={exitcode})")
+                        else:
+                            self._dispatch(request_id, pending)
+
+                # 마지막 워커까지 degraded가 되면 기다리던 요청은 실패 처리
+                if self._backlog and all(slot.degraded for slot in self._slots):
+                    backlog, self._backlog = self._backlog, []
+                    for _, pending in backlog:
+                        _resolve(pending.future, None, "사용 가능한 converter 워커가 없습니다 (모든 워커 degraded)")
+
+
+def _resolve(future: asyncio.Future, result: Any, error: str | None) -> None:
+    """다른 스레드에서 future를 안전하게 완료"""
+    def _set() -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(RuntimeError(error))
+        else:
+            future.set_result(result)
+
+    try:
+        future.get_loop().call_soon_threadsafe(_set)
+    except RuntimeError:
+        pass  # 이벤트 루프가 이미 종료됨
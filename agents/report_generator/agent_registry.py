@@ -0,0 +1,125 @@
+"""
+Report Agent Registry
+=====================
+컴파일된 리포트 DeepAgent를 재사용하기 위한 레지스트리
+
+요청마다 MCP 도구 목록을 다시 받아오고 create_deep_agent로 그래프를 새로
+만드는 대신, 서버 시작 시 한 번 컴파일한 그래프를 interrupt_on 설정별로
+캐시합니다. MCP 도구 목록은 refresh_interval마다 확인하며, 실제로 목록이
+바뀐 경우에만 그래프를 다시 만듭니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, Awaitable, Callable
+
+from langchain_core.tools import BaseTool
+
+
+def _tools_signature(tools: list[BaseTool]) -> str:
+    """도구 이름/설명/인자 스키마로 만든 도구 목록 해시"""
+    described = [
+        {
+            "name": tool.name,
+            "description": tool.description,
+            "args": tool.args,
+        }
+        for tool in tools
+    ]
+    payload = json.dumps(described, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _interrupt_key(interrupt_on: dict[str, Any]) -> str:
+    """interrupt_on 설정을 캐시 키로 변환"""
+    return json.dumps(interrupt_on, sort_keys=True, default=str)
+
+
+class ReportAgentRegistry:
+    """
+    interrupt_on 설정별 컴파일된 에이전트 캐시
+
+    Args:
+        load_tools: MCP 도구 목록을 반환하는 비동기 함수
+        build_agent: (MCP 도구 목록, interrupt_on) → 컴파일된 에이전트
+        refresh_interval: MCP 도구 목록 변경 확인 주기(초). 0 이하이면 확인하지 않음
+    """
+
+    def __init__(
+        self,
+        load_tools: Callable[[], Awaitable[list[BaseTool]]],
+        build_agent: Callable[[list[BaseTool], dict[str, Any]], Any],
+        refresh_interval: float = 300.0,
+    ):
+        self._load_tools = load_tools
+        self._build_agent = build_agent
+        self.refresh_interval = refresh_interval
+
+        self._tools: list[BaseTool] | None = None
+        self._signature: str | None = None
+        self._checked_at = 0.0
+        self._agents: dict[str, Any] = {}
+        self._lock = asyncio.Lock()
+        self.builds = 0
+
+    async def start(self, *interrupt_variants: dict[str, Any]) -> None:
+        """도구 목록을 불러오고 주어진 interrupt_on 변형들을 미리 컴파일합니다."""
+        async with self._lock:
+            await self._reload_tools()
+            for interrupt_on in interrupt_variants:
+                self._get_or_build(interrupt_on)
+
+    async def get(self, interrupt_on: dict[str, Any]) -> Any:
+        """
+        interrupt_on 설정에 맞는 컴파일된 에이전트를 반환합니다.
+
+        Args:
+            interrupt_on: HITL 인터럽트 설정
+
+        Returns:
+            컴파일된 DeepAgent 그래프
+        """
+        if self._tools is not None and not self._refresh_due():
+            agent = self._agents.get(_interrupt_key(interrupt_on))
+            if agent is not None:
+                return agent
+
+        async with self._lock:
+            if self._tools is None or self._refresh_due():
+                await self._reload_tools()
+            return self._get_or_build(interrupt_on)
+
+    async def refresh(self) -> bool:
+        """
+        MCP 도구 목록을 즉시 다시 확인합니다.
+
+        Returns:
+            도구 목록이 바뀌어 에이전트가 무효화되었으면 True
+        """
+        async with self._lock:
+            return await self._reload_tools()
+
+    def _refresh_due(self) -> bool:
+        return self.refresh_interval > 0 and time.monotonic() - self._checked_at > self.refresh_interval
+
+    async def _reload_tools(self) -> bool:
+        """도구 목록을 다시 받아오고, 바뀐 경우에만 캐시된 에이전트를 비움"""
+        tools = await self._load_tools()
+        self._checked_at = time.monotonic()
+        signature = _tools_signature(tools)
+        if signature == self._signature:
+            return False
+
+        self._tools, self._signature = tools, signature
+        self._agents.clear()
+        return True
+
+    def _get_or_build(self, interrupt_on: dict[str, Any]) -> Any:
+        key = _interrupt_key(interrupt_on)
+        agent = self._agents.get(key)
+        if agent is None:
+            agent = self._agents[key] = self._build_agent(self._tools, dict(interrupt_on))
+            self.builds += 1
+        return agent
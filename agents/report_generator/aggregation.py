@@ -0,0 +1,365 @@
+"""
+Aggregation Engine
+==================
+열(column) 단위 입력을 그룹별로 집계하는 엔진 (aggregate_by_standard_code의 백엔드)
+
+- 입력: 표준 코드 배열, 수량 배열, (선택) 카테고리 배열
+  각 키 열은 문자열 목록이거나 이미 정수 ID로 인코딩된 EncodedColumn입니다.
+- 집계: 그룹별 sum / count / min / max
+  키 열이 모두 EncodedColumn이고 행이 많으면 NumPy(np.add.at / np.bincount / np.minimum.at 등)로
+  벡터화하고, 그 밖에는 순수 Python 루프로 같은 결과를 계산합니다.
+- 결과(GroupAggregate)는 서로 병합할 수 있으므로 청크 단위 스트리밍 집계에 사용할 수 있습니다.
+- GroupAggregate는 JSON으로 저장/로드할 수 있고, 새 행은 merge, 취소된 행은 retract로
+  반영하므로 누적 데이터의 리포트를 O(전체)가 아닌 O(변경분)으로 갱신할 수 있습니다.
+
+문자열 키를 정수 ID로 바꾸는 인코딩(factorize)이 가장 비싼 단계라서 문자열 열을 인코딩한 뒤
+벡터화하면 dict 루프 한 번보다 느립니다. 따라서 문자열/레코드 입력은 항상 순수 Python으로 집계하고,
+bulk_convert_codes의 category_ids처럼 이미 인코딩된 열만 NumPy로 집계합니다.
+"""
+
+import json
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 없이도 동작 (순수 Python 경로)
+    np = None
+
+GROUP_KEYS = ("standard_code", "category")
+
+# 카테고리/표준 코드가 없는 변환 결과의 키
+UNKNOWN_KEY = "UNKNOWN"
+
+# 다중 키의 조합 수가 이 값 이하이면 np.unique 대신 조합 공간 전체를 직접 사용
+_DENSE_COMBINATION_LIMIT = 1 << 22
+
+# 인코딩된 열이라도 이보다 적은 행은 배열 변환 비용이 더 크므로 순수 Python으로 집계
+_VECTORIZE_MIN_ROWS = 20_000
+
+# 저장 형식 버전
+STATE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class EncodedColumn:
+    """
+    정수 ID로 인코딩된 키 열
+
+    Attributes:
+        ids: 행별 라벨 인덱스 (정수 배열 또는 목록)
+        labels: ID → 라벨 테이블
+    """
+
+    ids: Any
+    labels: Sequence[str]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def factorize(values: Sequence[str]) -> EncodedColumn:
+    """문자열 열을 처음 등장한 순서의 정수 ID로 인코딩"""
+    index: dict[str, int] = {}
+    ids = [index.setdefault(value, len(index)) for value in values]
+    return EncodedColumn(ids, tuple(index))
+
+
+def _decode(column: Sequence[str] | EncodedColumn) -> Sequence[str]:
+    if not isinstance(column, EncodedColumn):
+        return column
+    ids = column.ids.tolist() if hasattr(column.ids, "tolist") else column.ids
+    return [column.labels[i] for i in ids]
+
+
+@dataclass
+class GroupAggregate:
+    """
+    그룹별 부분 집계 (병합 가능)
+
+    Attributes:
+        by: 그룹 키 이름 (예: ("standard_code",), ("standard_code", "category"))
+        groups: 그룹 키 튜플 → [sum, count, min, max]
+            (retract 이후 정확히 알 수 없게 된 min/max는 None)
+        rows: 반영된 행 수 (병합한 행 - 취소한 행)
+    """
+
+    by: tuple[str, ...] = ("standard_code",)
+    groups: dict[tuple[str, ...], list[Any]] = field(default_factory=dict)
+    rows: int = 0
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def _check_compatible(self, other: "GroupAggregate") -> None:
+        if other.by != self.by:
+            raise ValueError(f"그룹 키가 다른 집계는 병합할 수 없습니다: {self.by} != {other.by}")
+
+    def merge(self, other: "GroupAggregate") -> "GroupAggregate":
+        """다른 부분 집계를 이 집계에 합칩니다 (같은 그룹 키여야 함)."""
+        self._check_compatible(other)
+        for key, (total, count, low, high) in other.groups.items():
+            stats = self.groups.get(key)
+            if stats is None:
+                self.groups[key] = [total, count, low, high]
+            else:
+                stats[0] += total
+                stats[1] += count
+                stats[2] = None if stats[2] is None or low is None else min(stats[2], low)
+                stats[3] = None if stats[3] is None or high is None else max(stats[3], high)
+        self.rows += other.rows
+        return self
+
+    def retract(self, other: "GroupAggregate") -> "GroupAggregate":
+        """
+        이전에 병합한 행들(의 집계)을 이 집계에서 뺍니다.
+
+        sum/count는 정확히 유지됩니다. 취소된 행이 현재 min/max와 같은 값을 포함하면
+        남은 행의 min/max를 알 수 없으므로 해당 값은 None이 됩니다.
+
+        Raises:
+            ValueError: 집계되지 않은 그룹이나 집계된 것보다 많은 행을 취소하는 경우
+        """
+        self._check_compatible(other)
+        for key, (total, count, low, high) in other.groups.items():
+            stats = self.groups.get(key)
+            if stats is None or count > stats[1]:
+                raise ValueError(f"집계된 것보다 많은 행을 취소할 수 없습니다: {key}")
+            if count == stats[1]:
+                del self.groups[key]
+                continue
+            stats[0] -= total
+            stats[1] -= count
+            if stats[2] is not None and (low is None or low <= stats[2]):
+                stats[2] = None
+            if stats[3] is not None and (high is None or high >= stats[3]):
+                stats[3] = None
+        self.rows -= other.rows
+        return self
+
+    def sums(self) -> dict[Any, int]:
+        """그룹별 합계 (그룹 키가 하나이면 키 값, 여러 개이면 키 튜플로 색인)"""
+        if len(self.by) == 1:
+            return {key[0]: stats[0] for key, stats in self.groups.items()}
+        return {key: stats[0] for key, stats in self.groups.items()}
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """그룹별 통계 레코드 목록"""
+        return [
+            {**dict(zip(self.by, key)), "sum": total, "count": count, "min": low, "max": high}
+            for key, (total, count, low, high) in self.groups.items()
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        """저장용 압축 표현 (그룹당 [키..., sum, count, min, max] 한 줄)"""
+        return {
+            "version": STATE_VERSION,
+            "by": list(self.by),
+            "rows": self.rows,
+            "groups": [[*key, *stats] for key, stats in self.groups.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "GroupAggregate":
+        if data.get("version") != STATE_VERSION:
+            raise ValueError(f"지원하지 않는 집계 상태 버전입니다: {data.get('version')}")
+        by = tuple(data["by"])
+        width = len(by)
+        groups = {tuple(row[:width]): list(row[width:]) for row in data["groups"]}
+        return cls(by, groups, data["rows"])
+
+    def save(self, path: str | Path) -> None:
+        """JSON 파일로 저장 (임시 파일에 쓴 뒤 교체하므로 중간 상태가 남지 않음)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".tmp.{os.getpid()}")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path, by: Sequence[str] = ("standard_code",)) -> "GroupAggregate":
+        """JSON 파일에서 로드 (파일이 없으면 빈 집계)"""
+        path = Path(path)
+        if not path.exists():
+            return cls(tuple(by))
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def aggregate_columns(
+    standard_codes: Sequence[str] | EncodedColumn,
+    quantities: Sequence[int],
+    categories: Sequence[str] | EncodedColumn | None = None,
+    by: Sequence[str] = ("standard_code",),
+) -> GroupAggregate:
+    """
+    열 단위 입력을 그룹별로 집계합니다.
+
+    Args:
+        standard_codes: 행별 표준 코드 (문자열 목록 또는 EncodedColumn)
+        quantities: 행별 수량
+        categories: 행별 카테고리 (category로 그룹화할 때 필요)
+        by: 그룹 키 ("standard_code" 및/또는 "category")
+
+    Raises:
+        ValueError: 열 길이가 다르거나 그룹 키가 잘못된 경우
+    """
+    by = _check_group_keys(by)
+    columns = {"standard_code": standard_codes, "category": categories}
+    if "category" in by and categories is None:
+        raise ValueError("category로 그룹화하려면 categories가 필요합니다")
+
+    size = len(quantities)
+    for key in by:
+        _check_length(key, len(columns[key]), size)
+
+    # 문자열 열을 인코딩해서 벡터화하면 dict 루프보다 느리므로 이미 인코딩된 열만 NumPy로 집계
+    encoded = all(isinstance(columns[key], EncodedColumn) for key in by)
+    if np is not None and encoded and size >= _VECTORIZE_MIN_ROWS:
+        aggregate = _aggregate_numpy(by, [columns[key] for key in by], quantities)
+    else:
+        decoded = [_decode(columns[key]) for key in by]
+        aggregate = _aggregate_python(by, decoded[0] if len(by) == 1 else zip(*decoded), quantities)
+    aggregate.rows = size
+    return aggregate
+
+
+def _check_group_keys(by: Sequence[str]) -> tuple[str, ...]:
+    by = tuple(by)
+    if not by or any(key not in GROUP_KEYS for key in by):
+        raise ValueError(f"그룹 키는 {GROUP_KEYS} 중에서 선택해야 합니다: {by}")
+    return by
+
+
+def _check_length(key: str, length: int, size: int) -> None:
+    if length != size:
+        raise ValueError(f"{key}({length}개)와 수량({size}개)의 개수가 다릅니다")
+
+
+def _aggregate_numpy(by: tuple[str, ...], encoded: list[EncodedColumn], quantities: Sequence[int]) -> GroupAggregate:
+    """벡터화 집계: 키 조합을 하나의 정수 그룹 ID로 만든 뒤 ufunc로 축약"""
+    values = np.asarray(quantities, dtype=np.int64)
+    if len(values) == 0:
+        return GroupAggregate(by)
+
+    # 키 열들을 하나의 그룹 ID로 결합 (혼합 기수)
+    combined = np.asarray(encoded[0].ids, dtype=np.int64)
+    space = len(encoded[0].labels)
+    for column in encoded[1:]:
+        combined = combined * len(column.labels) + np.asarray(column.ids, dtype=np.int64)
+        space *= len(column.labels)
+
+    if len(encoded) == 1 or space <= _DENSE_COMBINATION_LIMIT:
+        group_ids, num_groups = combined, space
+        group_codes = None
+    else:
+        group_codes, group_ids = np.unique(combined, return_inverse=True)
+        num_groups = len(group_codes)
+
+    counts = np.bincount(group_ids, minlength=num_groups)
+    sums = np.zeros(num_groups, dtype=np.int64)
+    np.add.at(sums, group_ids, values)
+    lows = np.full(num_groups, np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(lows, group_ids, values)
+    highs = np.full(num_groups, np.iinfo(np.int64).min, dtype=np.int64)
+    np.maximum.at(highs, group_ids, values)
+
+    # 그룹은 처음 등장한 순서로 정렬 (순수 Python 경로 및 기존 defaultdict 결과와 동일)
+    present = np.flatnonzero(counts)
+    present = present[np.argsort(_first_seen(group_ids, num_groups)[present], kind="stable")]
+
+    aggregate = GroupAggregate(by)
+    for group in present.tolist():
+        code = int(group_codes[group]) if group_codes is not None else group
+        key = []
+        for column in reversed(encoded):
+            code, label_id = divmod(code, len(column.labels))
+            key.append(column.labels[label_id])
+        aggregate.groups[tuple(reversed(key))] = [
+            int(sums[group]), int(counts[group]), int(lows[group]), int(highs[group])
+        ]
+    return aggregate
+
+
+def _first_seen(group_ids: Any, num_groups: int) -> Any:
+    """그룹별 첫 등장 행 번호"""
+    first = np.full(num_groups, len(group_ids), dtype=np.int64)
+    np.minimum.at(first, group_ids, np.arange(len(group_ids), dtype=np.int64))
+    return first
+
+
+def _aggregate_python(by: tuple[str, ...], keys: Iterable[Any], quantities: Sequence[int]) -> GroupAggregate:
+    """
+    순수 Python 집계 (문자열 입력, 작은 입력 또는 NumPy 미설치 시)
+
+    Args:
+        keys: 행별 그룹 키 (그룹 키가 하나이면 키 값, 여러 개이면 키 튜플)
+    """
+    if hasattr(quantities, "tolist"):
+        quantities = quantities.tolist()
+    values: defaultdict[Any, list[int]] = defaultdict(list)
+    for key, quantity in zip(keys, quantities):
+        values[key].append(quantity)
+    return _reduce_groups(by, values)
+
+
+def _reduce_groups(by: tuple[str, ...], values: dict[Any, list[int]]) -> GroupAggregate:
+    """
+    그룹별 수량 목록을 통계로 축약
+    (행마다 통계 4개를 갱신하는 대신 그룹마다 내장 함수 sum/min/max로 한 번에 계산)
+    """
+    single = len(by) == 1
+    return GroupAggregate(by, {
+        (key,) if single else key: (
+            # 행이 하나인 그룹(고유 코드가 많은 작은 입력에서 흔함)은 함수 호출 없이 구성
+            [group[0], 1, group[0], group[0]] if len(group) == 1
+            else [sum(group), len(group), min(group), max(group)]
+        )
+        for key, group in values.items()
+    })
+
+
+def aggregate_conversions(
+    conversions: list[dict],
+    quantities: Sequence[int],
+    by: Sequence[str] = ("standard_code",),
+) -> GroupAggregate:
+    """
+    코드 변환 결과(레코드 목록)를 집계합니다.
+    열 목록을 따로 만들지 않고 레코드에서 바로 그룹 키를 읽어 한 번의 루프로 집계합니다.
+
+    Raises:
+        ValueError: 변환 결과와 수량의 개수가 다르거나 그룹 키가 잘못된 경우
+    """
+    by = _check_group_keys(by)
+    _check_length("변환 결과", len(conversions), len(quantities))
+
+    if hasattr(quantities, "tolist"):
+        quantities = quantities.tolist()
+    values: defaultdict[Any, list[int]] = defaultdict(list)
+    if len(by) == 1:
+        # 가장 흔한 경우(표준 코드별)는 키 튜플 없이 레코드에서 바로 그룹화
+        [key] = by
+        for conv, quantity in zip(conversions, quantities):
+            values[conv.get(key, UNKNOWN_KEY)].append(quantity)
+    else:
+        for conv, quantity in zip(conversions, quantities):
+            values[tuple(conv.get(key, UNKNOWN_KEY) for key in by)].append(quantity)
+    aggregate = _reduce_groups(by, values)
+    aggregate.rows = len(conversions)
+    return aggregate
+
+
+def aggregate_stream(
+    chunks: Iterable[tuple[list[dict], Sequence[int]]],
+    by: Sequence[str] = ("standard_code",),
+) -> GroupAggregate:
+    """(변환 결과, 수량) 청크를 차례로 집계하여 병합"""
+    total = GroupAggregate(tuple(by))
+    for conversions, quantities in chunks:
+        total.merge(aggregate_conversions(conversions, quantities, by))
+    return total
@@ -0,0 +1,274 @@
+"""
+Report Artifact Store
+=====================
+도구가 만든 큰 결과(변환 목록, 집계, 리포트)를 스레드별로 보관하는 저장소
+
+큰 결과를 ToolMessage에 그대로 담으면 에이전트가 매 단계 모델에 다시 보내는
+메시지 기록이 데이터 크기만큼 커집니다. 도구는 inline_limit을 넘는 결과를 이 저장소에
+쓰고 짧은 핸들("art_...")과 요약만 돌려주며, 다음 도구는 핸들을 받아 저장소에서 읽습니다.
+
+백엔드:
+    filesystem - deepagents FilesystemBackend (root_dir/<thread_id>/<handle>.json, 첫 put/get에서 생성)
+    memory     - 프로세스 메모리
+
+스레드가 삭제될 때(ThreadRegistry.evict) 해당 스레드의 아티팩트도 함께 삭제됩니다.
+config에 thread_id가 없는 호출(파이프라인, 직접 호출 등)은 결과를 저장하지 않고 그대로 반환합니다.
+"""
+
+import asyncio
+import json
+import re
+import secrets
+import shutil
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from langchain_core.runnables import ensure_config
+from mcp.types import CallToolResult, TextContent
+
+from agents.report_generator.config import get_artifact_config
+
+ARTIFACT_PREFIX = "art_"
+
+# 스레드 ID와 핸들은 경로로 사용되므로 안전한 문자만 허용
+_KEY_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
+
+# 스레드 밖(직접 호출 등)에서 만든 아티팩트의 스레드 ID
+DEFAULT_THREAD_ID = "default"
+
+
+def is_artifact_handle(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith(ARTIFACT_PREFIX)
+
+
+def thread_id_from_config(config: dict | None) -> str:
+    """RunnableConfig에서 thread_id를 꺼냄 (없으면 DEFAULT_THREAD_ID)"""
+    configurable = (config or {}).get("configurable") or {}
+    return str(configurable.get("thread_id") or DEFAULT_THREAD_ID)
+
+
+def has_thread_id(config: dict | None) -> bool:
+    """
+    RunnableConfig에 실제 thread_id가 있는지 확인
+    (없으면 아티팩트를 정리할 스레드가 없으므로 도구는 결과를 offload하지 않음)
+    """
+    configurable = (config or {}).get("configurable") or {}
+    return bool(configurable.get("thread_id"))
+
+
+def _check_key(name: str, value: str) -> str:
+    if not _KEY_PATTERN.match(value):
+        raise ValueError(f"잘못된 {name}입니다: {value!r}")
+    return value
+
+
+def _summarize(kind: str, value: Any, preview_size: int) -> dict[str, Any]:
+    """아티팩트 종류별 요약 (에이전트가 다음 단계를 결정하는 데 필요한 정보만)"""
+    if kind == "conversions":
+        categories = Counter(str(r.get("category")) for r in value)
+        return {
+            "total": len(value),
+            "success": sum(1 for r in value if r.get("success", True)),
+            "failed": sum(1 for r in value if not r.get("success", True)),
+            "categories": dict(sorted(categories.items())),
+            "preview": value[:preview_size],
+        }
+    if kind == "aggregated":
+        return {
+            "total_items": len(value),
+            "total_quantity": sum(value.values()),
+            "preview": dict(list(value.items())[:preview_size]),
+        }
+    if kind == "report":
+        lines = value.splitlines()
+        return {"lines": len(lines), "chars": len(value), "preview": "\n".join(lines[:preview_size])}
+    return {"total": len(value), "preview": value[:preview_size]}
+
+
+class ArtifactStore:
+    """
+    스레드별 아티팩트 저장소
+
+    Args:
+        backend: "filesystem" 또는 "memory"
+        root_dir: filesystem 백엔드의 저장 경로
+        inline_limit: 도구 결과에 직접 포함할 최대 항목 수 (초과 시 offload가 핸들 반환)
+        preview_size: 요약에 포함할 미리보기 항목 수
+    """
+
+    def __init__(
+        self,
+        backend: str = "filesystem",
+        root_dir: str | Path | None = None,
+        inline_limit: int = 50,
+        preview_size: int = 5,
+    ):
+        if backend not in ("filesystem", "memory"):
+            raise ValueError(f"지원하지 않는 아티팩트 백엔드입니다: {backend}")
+        self.backend = backend
+        self.inline_limit = inline_limit
+        self.preview_size = preview_size
+        self._root_dir = Path(root_dir) if root_dir else None
+        # filesystem 백엔드는 첫 put/get에서 생성 (서버 시작 시 deepagents를 import하지 않도록)
+        self._backend = None
+        # 메모리 백엔드: thread_id → {handle: value}
+        self._memory: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _files(self):
+        """filesystem 백엔드 (처음 호출 시 생성)"""
+        with self._lock:
+            if self._backend is None:
+                from deepagents.backends import FilesystemBackend  # deepagents 패키지 import가 느림
+
+                self._backend = FilesystemBackend(root_dir=self._root_dir, virtual_mode=True)
+            return self._backend
+
+    # ------------------------------------------------------------------
+    # 저장/조회
+    # ------------------------------------------------------------------
+
+    def put(self, thread_id: str, kind: str, value: Any) -> str:
+        """값을 저장하고 핸들을 반환합니다."""
+        _check_key("thread_id", thread_id)
+        handle = f"{ARTIFACT_PREFIX}{kind}_{secrets.token_hex(8)}"
+        if self.backend == "memory":
+            with self._lock:
+                self._memory.setdefault(thread_id, {})[handle] = value
+            return handle
+
+        payload = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        [response] = self._files().upload_files([(f"/{thread_id}/{handle}.json", payload)])
+        if response.error:
+            raise RuntimeError(f"아티팩트 저장 실패 ({handle}): {response.error}")
+        return handle
+
+    def get(self, thread_id: str, handle: str) -> Any:
+        """
+        핸들로 값을 조회합니다.
+
+        Raises:
+            ValueError: 잘못되었거나 없는 핸들 (다른 스레드의 핸들 포함)
+        """
+        _check_key("thread_id", thread_id)
+        _check_key("아티팩트 핸들", handle)
+        if self.backend == "memory":
+            with self._lock:
+                values = self._memory.get(thread_id, {})
+                if handle in values:
+                    return values[handle]
+        else:
+            [response] = self._files().download_files([f"/{thread_id}/{handle}.json"])
+            if response.error is None:
+                return json.loads(response.content)
+        raise ValueError(f"아티팩트를 찾을 수 없습니다: {handle}")
+
+    def resolve(self, thread_id: str, value: Any) -> Any:
+        """값이 아티팩트 핸들이면 저장된 값으로, 아니면 그대로 반환"""
+        return self.get(thread_id, value) if is_artifact_handle(value) else value
+
+    def offload(self, thread_id: str, kind: str, value: Any, force: bool = False) -> Any:
+        """
+        값이 inline_limit을 넘으면(또는 force) 저장하고 핸들 + 요약을, 아니면 값을 그대로 반환합니다.
+
+        Returns:
+            값 또는 {"artifact": 핸들, "kind": 종류, ...요약}
+        """
+        size = len(value.splitlines()) if isinstance(value, str) else len(value)
+        if not force and size <= self.inline_limit:
+            return value
+        handle = self.put(thread_id, kind, value)
+        return {"artifact": handle, "kind": kind, **_summarize(kind, value, self.preview_size)}
+
+    def delete_thread(self, thread_id: str) -> None:
+        """스레드의 모든 아티팩트 삭제"""
+        if not _KEY_PATTERN.match(thread_id):
+            return
+        if self.backend == "memory":
+            with self._lock:
+                self._memory.pop(thread_id, None)
+        elif self._root_dir is not None:
+            # FilesystemBackend는 디렉토리 삭제를 지원하지 않으므로 직접 삭제
+            shutil.rmtree(self._root_dir / thread_id, ignore_errors=True)
+
+
+# ============================================================================
+# 전역 저장소 (도구와 서버가 공유)
+# ============================================================================
+
+_store: ArtifactStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """설정에 맞는 전역 아티팩트 저장소 (처음 호출 시 생성)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            config = get_artifact_config()
+            _store = ArtifactStore(
+                backend=config["backend"],
+                root_dir=config["root_dir"],
+                inline_limit=config["inline_limit"],
+                preview_size=config["preview_size"],
+            )
+        return _store
+
+
+# ============================================================================
+# MCP 도구 결과 인터셉터
+# ============================================================================
+
+class ConversionArtifactInterceptor:
+    """
+    batch_convert_codes 호출을 가로채 입력 핸들을 풀고 중간 크기 결과를 아티팩트로 보관하는 MCP 인터셉터
+
+    - external_codes가 아티팩트 핸들 하나만 담은 목록(["art_..."])이면 저장된 코드 목록으로 바꿔 호출합니다.
+    - 응답에 결과가 직접 담겼고 결과 수가 inline_limit을 넘으면 결과를 아티팩트로 저장한 뒤 핸들 + 요약만 돌려줍니다.
+    - 결과가 MCP 서버의 inline_limit보다 커서 결과 핸들("res_...")로 돌아오면 그대로 전달하며,
+      에이전트가 fetch_conversion_results로 페이지 단위로 조회합니다.
+    """
+
+    tool_name = "batch_convert_codes"
+
+    def __init__(self, store: ArtifactStore | None = None):
+        self._store = store
+
+    @property
+    def store(self) -> ArtifactStore:
+        return self._store or get_artifact_store()
+
+    async def __call__(self, request, handler):
+        if request.name != self.tool_name:
+            return await handler(request)
+
+        # 그래프 밖에서 호출되면 runtime이 없으므로 현재 실행 컨텍스트의 config 사용
+        config = getattr(request.runtime, "config", None) or ensure_config()
+        # 스레드 밖의 호출은 결과를 보관해도 정리되지 않으므로 그대로 전달
+        if not has_thread_id(config):
+            return await handler(request)
+        store = self.store
+        thread_id = thread_id_from_config(config)
+
+        codes = request.args.get("external_codes")
+        if isinstance(codes, list) and len(codes) == 1 and is_artifact_handle(codes[0]):
+            try:
+                codes = await asyncio.to_thread(store.get, thread_id, codes[0])
+            except ValueError as e:
+                return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
+            request = request.override(args={**request.args, "external_codes": codes})
+
+        result = await handler(request)
+        if result.isError:
+            return result
+        payload = result.structuredContent or json.loads("".join(getattr(b, "text", "") for b in result.content))
+        results = payload.get("results")
+        if not isinstance(results, list) or len(results) <= store.inline_limit:
+            return result
+
+        summary = await asyncio.to_thread(store.offload, thread_id, "conversions", results, True)
+        summary["stats"] = payload.get("stats")
+        text = json.dumps(summary, ensure_ascii=False, separators=(",", ":"))
+        return CallToolResult(content=[TextContent(type="text", text=text)], structuredContent=summary)
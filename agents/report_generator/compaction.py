@@ -0,0 +1,172 @@
+"""
+History Compaction Middleware
+=============================
+긴 리포트 스레드의 메시지 기록을 토큰 예산 안으로 줄이는 에이전트 미들웨어
+
+모델 호출 전에 메시지 기록의 토큰 수(근사치)를 세고, 예산을 넘으면 오래된 것부터
+- 큰 ToolMessage 본문을 다이제스트(요약 + 아티팩트 핸들)로 바꾸고
+- 이미 결과를 받은 도구 호출의 큰 인자를 아티팩트 핸들로 바꿉니다.
+
+원본은 스레드의 아티팩트 저장소에 보관되므로 핸들을 다음 도구에 그대로 전달할 수 있고,
+바뀐 메시지는 같은 ID로 상태에 기록되어 /report/resume으로 재개할 때도 줄어든 기록을 사용합니다.
+결과를 기다리는 도구 호출(HITL 인터럽트 대상)과 최근 keep_recent개의 도구 결과는 건드리지 않습니다.
+"""
+
+import json
+import sys
+from typing import Any
+
+from langchain.agents.middleware import AgentMiddleware
+from langchain_core.callbacks import dispatch_custom_event
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately
+from langgraph.config import get_config
+
+from agents.report_generator.artifacts import get_artifact_store, thread_id_from_config
+
+# 압축 결과 이벤트 이름 (astream_events의 on_custom_event)
+COMPACTION_EVENT = "compaction"
+
+
+def _parse(content: Any) -> Any:
+    """도구 결과 본문을 JSON 값으로 해석 (JSON이 아니면 문자열 그대로)"""
+    if not isinstance(content, str):
+        return content
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        return content
+
+
+def _artifact_value(tool_name: str, value: Any) -> tuple[str, Any]:
+    """보관할 (아티팩트 종류, 값) - 변환 결과는 다음 도구가 바로 읽을 수 있는 형태로 보관"""
+    if isinstance(value, dict) and isinstance(value.get("results"), list):
+        return "conversions", value["results"]
+    if tool_name == "generate_markdown_report" and isinstance(value, str):
+        return "report", value
+    return "tool_output", value
+
+
+def _describe(value: Any) -> str:
+    """값의 모양을 한 줄로 설명"""
+    if isinstance(value, list):
+        return f"list[{len(value)}]"
+    if isinstance(value, dict):
+        keys = list(value)[:8]
+        return f"dict(keys={keys}{'…' if len(value) > 8 else ''})"
+    text = str(value)
+    return f"text({len(text)} chars): {text[:200]}{'…' if len(text) > 200 else ''}"
+
+
+class HistoryCompactionMiddleware(AgentMiddleware):
+    """
+    토큰 예산을 넘는 메시지 기록을 다이제스트로 압축하는 미들웨어
+
+    Args:
+        token_budget: 모델 호출 전 메시지 기록의 목표 토큰 수 (근사치)
+        min_tokens: 이보다 작은 메시지/인자는 압축하지 않음
+        keep_recent: 압축하지 않을 최근 도구 결과 수
+    """
+
+    def __init__(self, token_budget: int = 8000, min_tokens: int = 500, keep_recent: int = 2):
+        super().__init__()
+        self.token_budget = token_budget
+        self.min_tokens = min_tokens
+        self.keep_recent = keep_recent
+
+    def before_model(self, state: dict[str, Any], runtime) -> dict[str, Any] | None:
+        messages = state["messages"]
+        before = count_tokens_approximately(messages)
+        if before <= self.token_budget:
+            return None
+
+        thread_id = thread_id_from_config(get_config())
+        answered = {m.tool_call_id for m in messages if isinstance(m, ToolMessage)}
+        tool_indices = [i for i, m in enumerate(messages) if isinstance(m, ToolMessage)]
+        protected = set(tool_indices[-self.keep_recent:]) if self.keep_recent > 0 else set()
+
+        updated: dict[int, Any] = {}
+        remaining = before
+        for i, message in enumerate(messages):
+            if remaining <= self.token_budget:
+                break
+            if i in protected:
+                continue
+            if isinstance(message, ToolMessage):
+                compacted = self._compact_tool_message(message, thread_id)
+            elif isinstance(message, AIMessage) and message.tool_calls:
+                compacted = self._compact_tool_calls(message, answered, thread_id)
+            else:
+                compacted = None
+            if compacted is not None:
+                remaining -= count_tokens_approximately([message]) - count_tokens_approximately([compacted])
+                updated[i] = compacted
+
+        if not updated:
+            return None
+
+        after = count_tokens_approximately([updated.get(i, m) for i, m in enumerate(messages)])
+        stats = {
+            "thread_id": thread_id,
+            "messages": len(updated),
+            "tokens_before": before,
+            "tokens_after": after,
+            "tokens_saved": before - after,
+        }
+        print(
+            f"🗜️ 컨텍스트 압축: 메시지 {stats['messages']}개, "
+            f"{before} → {after} 토큰 (-{stats['tokens_saved']})",
+            file=sys.stderr,
+        )
+        dispatch_custom_event(COMPACTION_EVENT, stats)
+        # 같은 ID의 메시지는 add_messages 리듀서가 교체
+        return {"messages": list(updated.values())}
+
+    def _compact_tool_message(self, message: ToolMessage, thread_id: str) -> ToolMessage | None:
+        if message.response_metadata.get("compaction") or message.status == "error":
+            return None
+        original_tokens = count_tokens_approximately([message])
+        value = _parse(message.content)
+        if original_tokens < self.min_tokens or (isinstance(value, dict) and "artifact" in value):
+            return None
+
+        kind, stored = _artifact_value(message.name or "", value)
+        handle = get_artifact_store().put(thread_id, kind, stored)
+        digest = {
+            "compacted": True,
+            "tool": message.name,
+            "artifact": handle,
+            "kind": kind,
+            "original_tokens": original_tokens,
+            "shape": _describe(stored),
+        }
+        if isinstance(value, dict) and "stats" in value:
+            digest["stats"] = value["stats"]
+        return message.model_copy(update={
+            "content": json.dumps(digest, ensure_ascii=False),
+            "artifact": None,
+            "response_metadata": {**message.response_metadata, "compaction": {"artifact": handle}},
+        })
+
+    def _compact_tool_calls(self, message: AIMessage, answered: set[str], thread_id: str) -> AIMessage | None:
+        # 결과를 기다리는 도구 호출은 재개에 필요하므로 그대로 둠
+        if message.response_metadata.get("compaction") or any(c["id"] not in answered for c in message.tool_calls):
+            return None
+
+        store = get_artifact_store()
+        tool_calls, changed = [], False
+        for call in message.tool_calls:
+            args = dict(call["args"])
+            for key, value in call["args"].items():
+                if isinstance(value, (list, dict)) and count_tokens_approximately([json.dumps(value)]) >= self.min_tokens:
+                    args[key] = store.put(thread_id, "tool_input", value)
+                    changed = True
+            tool_calls.append({**call, "args": args})
+        if not changed:
+            return None
+        return message.model_copy(update={
+            "tool_calls": tool_calls,
+            # 원본 인자가 남아 있는 provider 형식 필드는 제거
+            "additional_kwargs": {k: v for k, v in message.additional_kwargs.items() if k != "tool_calls"},
+            "response_metadata": {**message.response_metadata, "compaction": {"tool_inputs": True}},
+        })
@@ -51,6 +51,7 @@ def get_system_prompt() -> str:
 2. **데이터 정확성**: 각 단계의 결과를 다음 단계의 입력으로 정확히 전달
 3. **실패 시에도 리포트**: 변환 실패 항목이 있어도 가능한 범위 내에서 리포트 작성
 4. **사용자 선호도 기억**: 특정 형식 요청 시 `/memories/user_preferences.md`에 저장
+5. **아티팩트 핸들 전달**: 도구 결과가 아티팩트 핸들("art_...")과 요약이면 데이터를 옮겨 적지 말고 핸들을 다음 도구에 전달
 """
 
 
@@ -106,3 +107,164 @@ def get_mcp_server_config() -> dict:
                 "transport": "stdio",
             }
         }
+
+
+def get_conversion_stream_config() -> dict:
+    """
+    스트리밍 코드 변환 설정을 반환합니다.
+    window_size는 MCP 호출 1회에 보내는 코드 수, chunk_size는 서버가 한 번에 변환하여
+    progress notification으로 돌려주는 코드 수입니다.
+    
+    Returns:
+        스트리밍 변환 설정 딕셔너리
+    """
+    return {
+        "server_name": "code_converter",
+        "window_size": int(os.getenv("CONVERSION_WINDOW_SIZE", "10000")),
+        "chunk_size": int(os.getenv("CONVERSION_CHUNK_SIZE", "500")),
+    }
+
+
+def get_tools_refresh_interval() -> float:
+    """
+    MCP 도구 목록 변경 확인 주기(초)를 반환합니다.
+    0 이하이면 서버 시작 시 한 번만 도구 목록을 불러옵니다.
+    
+    Returns:
+        REPORT_TOOLS_REFRESH_SECONDS 환경변수 값 (기본값: 300)
+    """
+    return float(os.getenv("REPORT_TOOLS_REFRESH_SECONDS", "300"))
+
+
+def get_exchange_rate_cache_config() -> dict:
+    """
+    환율 캐시 설정을 반환합니다.
+    ttl_seconds 동안은 캐시 값을 그대로 사용하고, 이후 stale_seconds 동안은
+    이전 값을 즉시 반환하면서 백그라운드에서 갱신합니다 (stale-while-revalidate).
+    
+    Returns:
+        환율 캐시 설정 딕셔너리
+    """
+    return {
+        "ttl_seconds": float(os.getenv("EXCHANGE_RATE_TTL", "60")),
+        "stale_seconds": float(os.getenv("EXCHANGE_RATE_STALE_TTL", "600")),
+    }
+
+
+def get_checkpointer_config() -> dict:
+    """
+    체크포인터(대화 상태 저장소) 설정을 반환합니다.
+    기본값은 SQLite 파일이며, REPORT_CHECKPOINTER=memory이면 메모리에 저장합니다.
+    
+    Returns:
+        체크포인터 설정 딕셔너리
+    """
+    return {
+        "backend": os.getenv("REPORT_CHECKPOINTER", "sqlite").lower(),
+        "path": os.getenv("REPORT_CHECKPOINT_DB", str(AGENT_DIR / "checkpoints.db")),
+        # 마지막 활동 이후 이 시간이 지난 스레드는 삭제 (인터럽트 후 방치된 스레드 포함)
+        "retention_seconds": float(os.getenv("REPORT_THREAD_RETENTION_SECONDS", "86400")),
+        # 스레드당 유지할 최신 체크포인트 수 (0 이하이면 제한 없음)
+        "max_checkpoints_per_thread": int(os.getenv("REPORT_MAX_CHECKPOINTS_PER_THREAD", "10")),
+        # 완료된 스레드를 즉시 삭제할지 여부
+        "evict_completed": os.getenv("REPORT_EVICT_COMPLETED", "true").lower() not in ("0", "false", "no"),
+        # 만료 스레드 정리 주기(초)
+        "sweep_interval": float(os.getenv("REPORT_RETENTION_SWEEP_SECONDS", "300")),
+        # 지정 시 만료 스레드를 삭제 전에 JSONL로 보관
+        "archive_dir": os.getenv("REPORT_THREAD_ARCHIVE_DIR") or None,
+    }
+
+
+def get_batch_config() -> dict:
+    """
+    /report/batch 설정을 반환합니다.
+    
+    Returns:
+        배치 리포트 설정 딕셔너리
+    """
+    return {
+        # 동시에 렌더링(또는 에이전트로 실행)할 최대 리포트 수
+        "max_concurrency": int(os.getenv("REPORT_BATCH_CONCURRENCY", "8")),
+    }
+
+
+def get_aggregate_state_dir() -> Path:
+    """
+    누적 집계 상태(aggregate_by_standard_code의 state_key) 저장 경로를 반환합니다.
+    
+    Returns:
+        집계 상태 디렉토리 경로
+    """
+    return Path(os.getenv("REPORT_AGGREGATE_STATE_DIR", str(AGENT_DIR / "aggregates")))
+
+
+def get_artifact_config() -> dict:
+    """
+    도구 결과 아티팩트 저장소 설정을 반환합니다.
+    
+    Returns:
+        backend: "filesystem" 또는 "memory" (REPORT_ARTIFACT_BACKEND)
+        root_dir: filesystem 백엔드의 저장 경로
+        inline_limit: 도구 결과에 직접 포함할 최대 항목 수 (초과 시 아티팩트 핸들 반환)
+        preview_size: 핸들과 함께 돌려줄 미리보기 항목 수
+    """
+    return {
+        "backend": os.getenv("REPORT_ARTIFACT_BACKEND", "filesystem").lower(),
+        "root_dir": os.getenv("REPORT_ARTIFACT_DIR", str(AGENT_DIR / "artifacts")),
+        "inline_limit": max(0, int(os.getenv("REPORT_ARTIFACT_INLINE_LIMIT", "50"))),
+        "preview_size": max(0, int(os.getenv("REPORT_ARTIFACT_PREVIEW", "5"))),
+    }
+
+
+def get_compaction_config() -> dict | None:
+    """
+    메시지 기록 압축(HistoryCompactionMiddleware) 설정을 반환합니다.
+    REPORT_COMPACTION이 false이면 압축하지 않습니다.
+    
+    Returns:
+        token_budget: 모델 호출 전 메시지 기록의 목표 토큰 수 (근사치)
+        min_tokens: 이보다 작은 도구 결과/인자는 압축하지 않음
+        keep_recent: 압축하지 않을 최근 도구 결과 수
+        (비활성화 시 None)
+    """
+    if os.getenv("REPORT_COMPACTION", "true").lower() in ("0", "false", "no"):
+        return None
+    return {
+        "token_budget": int(os.getenv("REPORT_CONTEXT_TOKEN_BUDGET", "8000")),
+        "min_tokens": int(os.getenv("REPORT_COMPACT_MIN_TOKENS", "500")),
+        "keep_recent": max(0, int(os.getenv("REPORT_COMPACT_KEEP_RECENT", "2"))),
+    }
+
+
+def get_mcp_pool_config() -> dict:
+    """
+    MCP 세션 풀 설정을 반환합니다.
+    size가 0이면 풀 없이 호출마다 세션을 새로 만듭니다 (MultiServerMCPClient 기본 동작).
+    
+    Returns:
+        size: 서버별로 유지할 세션 수
+        max_uses: 세션을 교체하기 전까지의 최대 호출 수 (0 이하이면 교체하지 않음)
+        ping_interval: 이 시간(초) 이상 쉬었던 세션은 사용 전에 ping으로 확인
+        ping_timeout: ping 응답 대기 시간(초)
+        connect_timeout: 세션 연결 대기 시간(초)
+    """
+    return {
+        "size": max(0, int(os.getenv("REPORT_MCP_POOL_SIZE", "2"))),
+        "max_uses": int(os.getenv("REPORT_MCP_SESSION_MAX_USES", "1000")),
+        "ping_interval": float(os.getenv("REPORT_MCP_PING_INTERVAL", "30")),
+        "ping_timeout": float(os.getenv("REPORT_MCP_PING_TIMEOUT", "5")),
+        "connect_timeout": float(os.getenv("REPORT_MCP_CONNECT_TIMEOUT", "60")),
+    }
+
+
+def is_fast_startup_enabled() -> bool:
+    """
+    Fast startup 모드 사용 여부를 반환합니다.
+    활성화되면 서버 시작 시 에이전트 그래프를 컴파일하지 않으므로 LangChain 모델 통합과
+    deepagents를 import하지 않고 바로 요청을 받으며(파이프라인 요청은 즉시 처리),
+    에이전트는 첫 에이전트 요청에서 컴파일됩니다.
+    
+    Returns:
+        REPORT_FAST_STARTUP 환경변수 값 (기본값: False)
+    """
+    return os.getenv("REPORT_FAST_STARTUP", "false").lower() in ("1", "true", "yes")
@@ -0,0 +1,82 @@
+"""
+Streaming Code Conversion Client
+=================================
+Code Converter MCP 서버의 stream_convert_codes 도구를 호출하여
+변환 결과를 청크 단위로 받아오는 클라이언트 헬퍼
+
+입력은 window_size 단위로 나누어 전송하고, 각 호출의 결과는 progress
+notification으로 chunk_size 단위씩 도착하는 즉시 yield됩니다.
+따라서 호출자는 전체 변환이 끝나기 전에 집계를 시작할 수 있습니다.
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator
+
+from agents.report_generator.config import get_conversion_stream_config
+
+STREAM_TOOL_NAME = "stream_convert_codes"
+
+
+def _result_payload(result: Any) -> dict:
+    """CallToolResult의 텍스트 콘텐츠를 JSON으로 해석"""
+    text = "".join(getattr(block, "text", "") for block in result.content)
+    if result.isError:
+        raise RuntimeError(f"{STREAM_TOOL_NAME} 호출 실패: {text}")
+    return json.loads(text) if text else {}
+
+
+async def iter_converted_chunks(
+    mcp_client,
+    external_codes: list[str],
+    window_size: int | None = None,
+    chunk_size: int | None = None,
+) -> AsyncIterator[tuple[int, list[dict]]]:
+    """
+    외부 코드 목록을 스트리밍으로 변환합니다.
+
+    Args:
+        mcp_client: MultiServerMCPClient 또는 MCPSessionPools (session(name)을 제공하는 객체)
+        external_codes: 외부 코드 목록
+        window_size: MCP 호출 1회에 보낼 코드 수 (기본값: 설정값)
+        chunk_size: 서버가 한 번에 돌려줄 코드 수 (기본값: 설정값)
+
+    Yields:
+        (입력 목록 기준 시작 인덱스, 해당 청크의 변환 결과 목록)
+    """
+    config = get_conversion_stream_config()
+    window_size = max(1, window_size or config["window_size"])
+    chunk_size = max(1, chunk_size or config["chunk_size"])
+
+    async with mcp_client.session(config["server_name"]) as session:
+        for window_offset in range(0, len(external_codes), window_size):
+            window = external_codes[window_offset:window_offset + window_size]
+            queue: asyncio.Queue[tuple[int, list[dict]]] = asyncio.Queue()
+
+            async def on_progress(progress: float, total: float | None, message: str | None) -> None:
+                if message:
+                    payload = json.loads(message)
+                    await queue.put((window_offset + payload["offset"], payload["results"]))
+
+            call = asyncio.create_task(session.call_tool(
+                STREAM_TOOL_NAME,
+                {"external_codes": window, "chunk_size": chunk_size},
+                progress_callback=on_progress,
+            ))
+            try:
+                # 호출이 끝날 때까지 도착하는 청크를 즉시 전달
+                while not call.done() or not queue.empty():
+                    getter = asyncio.ensure_future(queue.get())
+                    done, _ = await asyncio.wait({getter, call}, return_when=asyncio.FIRST_COMPLETED)
+                    if getter in done:
+                        yield getter.result()
+                    else:
+                        getter.cancel()
+            finally:
+                if not call.done():
+                    call.cancel()
+
+            # progress notification을 지원하지 않는 경우 결과가 응답에 포함됨
+            payload = _result_payload(call.result())
+            if "results" in payload:
+                yield window_offset, payload["results"]
@@ -0,0 +1,290 @@
+"""
+MCP Session Pool
+================
+MCP 서버별로 미리 연결해 둔 세션을 재사용하는 세션 풀
+
+MultiServerMCPClient는 도구 호출마다 새 세션을 만들기 때문에 stdio 모드에서는
+호출마다 코드 변환 서버 프로세스를 띄우고(LangChain/deepagents import 포함) 초기화해야 합니다.
+MCPSessionPools는 서버 시작(lifespan) 시 서버별로 size개의 세션을 미리 열어 두고,
+- 오래 쉬었거나 직전 호출이 실패한 세션은 ping으로 상태를 확인하고
+- max_uses번 사용한 세션은 새 세션으로 교체(recycle)합니다.
+
+stdio/SSE 연결 모두 langchain_mcp_adapters.sessions.create_session으로 열며,
+세션의 연결 컨텍스트는 세션마다 전용 태스크에서 열고 닫습니다 (anyio cancel scope 제약).
+
+MCPSessionPools는 MultiServerMCPClient와 같은 session(name) / get_tools() 인터페이스를
+제공하므로 파이프라인과 에이전트 레지스트리에 그대로 전달할 수 있습니다.
+"""
+
+import asyncio
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from langchain_core.tools import BaseTool
+from langchain_mcp_adapters.sessions import create_session
+from langchain_mcp_adapters.tools import load_mcp_tools
+from mcp import ClientSession
+
+
+class _PooledSession:
+    """전용 태스크가 연결을 유지하는 MCP 세션 하나"""
+
+    def __init__(self, connection: dict[str, Any]):
+        self.connection = connection
+        self.session: ClientSession | None = None
+        self.uses = 0
+        self.last_used = time.monotonic()
+        # 직전 호출이 실패했으면 다음 사용 전에 상태 확인
+        self.suspect = False
+        self._ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        try:
+            async with create_session(self.connection) as session:
+                await session.initialize()
+                self.session = session
+                self._ready.set_result(None)
+                await self._closing.wait()
+        except BaseException as e:
+            if not self._ready.done():
+                self._ready.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            self.session = None
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and not self._task.done()
+
+    async def wait_ready(self, timeout: float) -> None:
+        await asyncio.wait_for(asyncio.shield(self._ready), timeout)
+
+    async def ping(self, timeout: float) -> bool:
+        if not self.alive:
+            return False
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout)
+            return True
+        except Exception:
+            return False
+
+    async def close(self) -> None:
+        self._closing.set()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+
+class MCPSessionPool:
+    """
+    MCP 서버 하나의 세션 풀 (세션은 한 번에 한 호출만 사용)
+
+    langchain_mcp_adapters가 세션에 요구하는 list_tools/call_tool을 제공하므로
+    load_mcp_tools(pool)로 만든 도구는 호출마다 풀의 세션을 빌려 씁니다.
+
+    Args:
+        server_name: MCP 서버 이름
+        connection: MCP 연결 설정 (stdio 또는 sse)
+        size: 유지할 세션 수
+        max_uses: 세션을 교체하기 전까지의 최대 호출 수 (0 이하이면 교체하지 않음)
+        ping_interval: 이 시간(초) 이상 쉬었던 세션은 사용 전에 ping으로 확인
+        ping_timeout: ping 응답 대기 시간(초)
+        connect_timeout: 세션 연결(프로세스 시작 + initialize) 대기 시간(초)
+    """
+
+    def __init__(
+        self,
+        server_name: str,
+        connection: dict[str, Any],
+        size: int = 2,
+        max_uses: int = 1000,
+        ping_interval: float = 30.0,
+        ping_timeout: float = 5.0,
+        connect_timeout: float = 60.0,
+    ):
+        self.server_name = server_name
+        self.connection = connection
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.connect_timeout = connect_timeout
+
+        self._idle: asyncio.Queue[_PooledSession] = asyncio.Queue()
+        self._closing_tasks: set[asyncio.Task] = set()
+        self._started = False
+        self.created = 0
+        self.recycled = 0
+        self.failed_checks = 0
+        self.calls = 0
+
+    async def _open(self) -> _PooledSession:
+        pooled = _PooledSession(self.connection)
+        self.created += 1
+        try:
+            await pooled.wait_ready(self.connect_timeout)
+        except BaseException:
+            await pooled.close()
+            raise
+        return pooled
+
+    async def start(self) -> None:
+        """세션을 미리 열어 둡니다 (pre-warm)."""
+        if self._started:
+            return
+        sessions = await asyncio.gather(*(self._open() for _ in range(self.size)), return_exceptions=True)
+        errors = [s for s in sessions if isinstance(s, BaseException)]
+        for pooled in sessions:
+            if not isinstance(pooled, BaseException):
+                self._idle.put_nowait(pooled)
+        if errors:
+            await self.aclose()
+            raise errors[0]
+        self._started = True
+
+    async def aclose(self) -> None:
+        """모든 세션을 닫습니다."""
+        sessions = []
+        while not self._idle.empty():
+            sessions.append(self._idle.get_nowait())
+        await asyncio.gather(*(pooled.close() for pooled in sessions), *self._closing_tasks, return_exceptions=True)
+        self._started = False
+
+    def _retire(self, pooled: _PooledSession) -> None:
+        """요청을 기다리게 하지 않도록 오래된 세션은 백그라운드에서 닫음"""
+        task = asyncio.create_task(pooled.close())
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+
+    async def _checkout(self) -> _PooledSession:
+        if not self._started:
+            await self.start()
+        pooled = await self._idle.get()
+        try:
+            recycle = not pooled.alive or (self.max_uses > 0 and pooled.uses >= self.max_uses)
+            if not recycle and (pooled.suspect or time.monotonic() - pooled.last_used > self.ping_interval):
+                if await pooled.ping(self.ping_timeout):
+                    pooled.suspect = False
+                else:
+                    self.failed_checks += 1
+                    recycle = True
+            if recycle:
+                self._retire(pooled)
+                self.recycled += 1
+                pooled = await self._open()
+        except BaseException:
+            # 자리를 잃지 않도록 반환 (다음 사용 시 다시 교체 시도)
+            self._idle.put_nowait(pooled)
+            raise
+        return pooled
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[ClientSession]:
+        """풀에서 세션을 빌려 사용한 뒤 반환합니다."""
+        pooled = await self._checkout()
+        try:
+            yield pooled.session
+        except BaseException:
+            pooled.suspect = True
+            raise
+        finally:
+            pooled.uses += 1
+            pooled.last_used = time.monotonic()
+            self.calls += 1
+            self._idle.put_nowait(pooled)
+
+    # langchain_mcp_adapters가 사용하는 ClientSession 인터페이스
+    async def list_tools(self, *args, **kwargs):
+        async with self.session() as session:
+            return await session.list_tools(*args, **kwargs)
+
+    async def call_tool(self, *args, **kwargs):
+        async with self.session() as session:
+            return await session.call_tool(*args, **kwargs)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "transport": self.connection.get("transport"),
+            "size": self.size,
+            "idle": self._idle.qsize(),
+            "max_uses": self.max_uses,
+            "created": self.created,
+            "recycled": self.recycled,
+            "failed_health_checks": self.failed_checks,
+            "calls": self.calls,
+        }
+
+
+class MCPSessionPools:
+    """
+    MCP 서버별 세션 풀 (MultiServerMCPClient 대체)
+
+    Args:
+        connections: MCP 서버 설정 (get_mcp_server_config())
+        pool_config: 풀 설정 (get_mcp_pool_config())
+        tool_interceptors: get_tools()로 만든 도구에 적용할 인터셉터
+    """
+
+    def __init__(
+        self,
+        connections: dict[str, dict[str, Any]],
+        pool_config: dict[str, Any],
+        tool_interceptors: list | None = None,
+    ):
+        self.pools = {
+            name: MCPSessionPool(
+                name,
+                connection,
+                size=pool_config["size"],
+                max_uses=pool_config["max_uses"],
+                ping_interval=pool_config["ping_interval"],
+                ping_timeout=pool_config["ping_timeout"],
+                connect_timeout=pool_config["connect_timeout"],
+            )
+            for name, connection in connections.items()
+        }
+        self.tool_interceptors = tool_interceptors
+
+    def _pool(self, server_name: str) -> MCPSessionPool:
+        if server_name not in self.pools:
+            raise ValueError(f"MCP 서버를 찾을 수 없습니다: {server_name} (설정: {list(self.pools)})")
+        return self.pools[server_name]
+
+    async def start(self) -> None:
+        """모든 서버의 세션을 미리 엽니다."""
+        started = time.perf_counter()
+        await asyncio.gather(*(pool.start() for pool in self.pools.values()))
+        print(
+            f"🔥 MCP 세션 풀 준비 완료: "
+            + ", ".join(f"{name}×{pool.size}" for name, pool in self.pools.items())
+            + f" ({(time.perf_counter() - started) * 1e3:.0f}ms)",
+            file=sys.stderr,
+        )
+
+    async def aclose(self) -> None:
+        await asyncio.gather(*(pool.aclose() for pool in self.pools.values()), return_exceptions=True)
+
+    @asynccontextmanager
+    async def session(self, server_name: str) -> AsyncIterator[ClientSession]:
+        """MultiServerMCPClient.session()과 같은 방식으로 풀의 세션을 빌림"""
+        async with self._pool(server_name).session() as session:
+            yield session
+
+    async def get_tools(self, *, server_name: str | None = None) -> list[BaseTool]:
+        """풀의 세션을 사용하는 LangChain 도구 목록"""
+        names = [server_name] if server_name is not None else list(self.pools)
+        tool_lists = await asyncio.gather(*(
+            load_mcp_tools(
+                self._pool(name),
+                server_name=name,
+                tool_interceptors=self.tool_interceptors,
+            )
+            for name in names
+        ))
+        return [tool for tools in tool_lists for tool in tools]
+
+    def stats(self) -> dict[str, Any]:
+        return {name: pool.stats() for name, pool in self.pools.items()}
@@ -0,0 +1,364 @@
+"""
+Report Checkpoint Persistence
+=============================
+리포트 에이전트의 체크포인터(스레드별 대화 상태) 생성 및 스레드 수명 관리
+
+- 기본 백엔드는 SQLite 파일이므로 서버를 재시작해도 인터럽트된 스레드를
+  /report/resume으로 이어서 실행할 수 있습니다.
+- ThreadRegistry가 스레드별 상태(running/interrupted/completed/failed),
+  생성·마지막 활동 시각, 체크포인트 크기(bytes)를 기록합니다.
+- 스레드당 최신 체크포인트 N개만 유지하여 스레드별 메모리/디스크 사용량을 제한합니다.
+- 완료된 스레드는 즉시 삭제하고, 보존 기간이 지난 스레드(재개되지 않은 HITL 세션 등)는
+  주기적으로 보관(선택) 후 삭제합니다. 스레드의 아티팩트도 함께 삭제됩니다.
+"""
+
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable
+
+from langchain_core.load import dumpd
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+
+from agents.report_generator.artifacts import ArtifactStore
+
+# 스레드 레지스트리 테이블 (SQLite 백엔드에서 체크포인트와 같은 DB에 저장)
+_THREADS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS report_threads (
+    thread_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    size_bytes INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+THREAD_STATUSES = ("running", "interrupted", "completed", "failed")
+
+
+@asynccontextmanager
+async def open_checkpointer(config: dict) -> AsyncIterator[BaseCheckpointSaver]:
+    """
+    설정에 맞는 체크포인터를 열고 종료 시 정리합니다.
+
+    Args:
+        config: get_checkpointer_config() 결과
+    """
+    if config["backend"] == "memory":
+        yield MemorySaver()
+        return
+
+    if config["backend"] != "sqlite":
+        raise ValueError(f"지원하지 않는 체크포인터 백엔드입니다: {config['backend']}")
+
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+    async with AsyncSqliteSaver.from_conn_string(config["path"]) as saver:
+        await saver.setup()
+        async with saver.lock:
+            await saver.conn.execute(_THREADS_TABLE_SQL)
+            await saver.conn.commit()
+        yield saver
+
+
+@dataclass
+class ThreadRecord:
+    """레지스트리에 기록된 스레드 하나의 상태"""
+
+    thread_id: str
+    status: str
+    created_at: float
+    updated_at: float
+    size_bytes: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class ThreadRegistry:
+    """
+    스레드 수명 관리자 (상태 기록, 체크포인트 정리, 만료 스레드 삭제)
+
+    Args:
+        checkpointer: open_checkpointer()로 연 체크포인터
+        retention_seconds: 마지막 활동 이후 스레드를 보존할 시간(초)
+        max_checkpoints_per_thread: 스레드당 유지할 최신 체크포인트 수 (0 이하이면 제한 없음)
+        evict_completed: 완료된 스레드를 즉시 삭제할지 여부
+        archive_dir: 지정 시 만료 스레드의 최신 상태를 삭제 전에 JSONL로 보관
+        artifacts: 아티팩트 저장소를 반환하는 함수. 지정 시 스레드 삭제와 함께 해당 스레드의
+            아티팩트도 삭제 (저장소는 첫 삭제 시 가져오므로 서버 시작 시 생성되지 않음)
+    """
+
+    def __init__(
+        self,
+        checkpointer: BaseCheckpointSaver,
+        retention_seconds: float = 86400.0,
+        max_checkpoints_per_thread: int = 10,
+        evict_completed: bool = True,
+        archive_dir: str | Path | None = None,
+        artifacts: Callable[[], ArtifactStore] | None = None,
+    ):
+        self.checkpointer = checkpointer
+        self.retention_seconds = retention_seconds
+        self.max_checkpoints_per_thread = max_checkpoints_per_thread
+        self.evict_completed = evict_completed
+        self.archive_dir = Path(archive_dir) if archive_dir else None
+        self.artifacts = artifacts
+        # 메모리 백엔드용 레지스트리: thread_id → ThreadRecord
+        self._threads: dict[str, ThreadRecord] = {}
+
+    @property
+    def _is_sqlite(self) -> bool:
+        return hasattr(self.checkpointer, "conn")
+
+    # ------------------------------------------------------------------
+    # 상태 기록
+    # ------------------------------------------------------------------
+
+    async def mark_running(self, thread_id: str) -> None:
+        """에이전트 실행(또는 재개) 시작 시 호출합니다."""
+        await self._upsert(thread_id, "running")
+
+    async def on_run_finished(self, thread_id: str, status: str) -> None:
+        """
+        에이전트 실행(또는 재개)이 끝날 때 호출합니다.
+
+        Args:
+            thread_id: 스레드 ID
+            status: "interrupted" | "completed" | "failed"
+        """
+        if status == "completed" and self.evict_completed:
+            await self.evict(thread_id)
+            return
+
+        if self.max_checkpoints_per_thread > 0:
+            await self._prune(thread_id, self.max_checkpoints_per_thread)
+        await self._upsert(thread_id, status, await self._measure(thread_id))
+
+    async def _upsert(self, thread_id: str, status: str, size_bytes: int | None = None) -> None:
+        """스레드 상태와 마지막 활동 시각 기록 (size_bytes가 None이면 기존 값 유지)"""
+        now = time.time()
+        if self._is_sqlite:
+            async with self.checkpointer.lock:
+                await self.checkpointer.conn.execute(
+                    """
+                    INSERT INTO report_threads (thread_id, status, created_at, updated_at, size_bytes)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(thread_id) DO UPDATE SET
+                        status = excluded.status,
+                        updated_at = excluded.updated_at,
+                        size_bytes = COALESCE(?, report_threads.size_bytes)
+                    """,
+                    (thread_id, status, now, now, size_bytes or 0, size_bytes),
+                )
+                await self.checkpointer.conn.commit()
+            return
+
+        record = self._threads.get(thread_id)
+        if record is None:
+            record = self._threads[thread_id] = ThreadRecord(thread_id, status, now, now)
+        record.status, record.updated_at = status, now
+        if size_bytes is not None:
+            record.size_bytes = size_bytes
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    async def list_threads(self, limit: int = 20, status: str | None = None) -> list[ThreadRecord]:
+        """
+        크기가 큰 순서로 스레드 목록을 반환합니다.
+
+        Args:
+            limit: 최대 개수
+            status: 지정 시 해당 상태의 스레드만 반환
+        """
+        if self._is_sqlite:
+            query = "SELECT thread_id, status, created_at, updated_at, size_bytes FROM report_threads"
+            params: tuple = ()
+            if status is not None:
+                query += " WHERE status = ?"
+                params = (status,)
+            query += " ORDER BY size_bytes DESC, updated_at ASC LIMIT ?"
+            async with self.checkpointer.lock:
+                async with self.checkpointer.conn.execute(query, params + (limit,)) as cursor:
+                    return [ThreadRecord(*row) for row in await cursor.fetchall()]
+
+        records = [r for r in self._threads.values() if status is None or r.status == status]
+        records.sort(key=lambda r: (-r.size_bytes, r.updated_at))
+        return records[:limit]
+
+    async def summary(self) -> dict[str, Any]:
+        """상태별 스레드 수와 전체 크기"""
+        counts = dict.fromkeys(THREAD_STATUSES, 0)
+        if self._is_sqlite:
+            async with self.checkpointer.lock:
+                async with self.checkpointer.conn.execute(
+                    "SELECT status, COUNT(*), COALESCE(SUM(size_bytes), 0) FROM report_threads GROUP BY status"
+                ) as cursor:
+                    rows = await cursor.fetchall()
+        else:
+            rows = []
+            for status in {r.status for r in self._threads.values()}:
+                members = [r for r in self._threads.values() if r.status == status]
+                rows.append((status, len(members), sum(r.size_bytes for r in members)))
+
+        total_bytes = 0
+        for status, count, size_bytes in rows:
+            counts[status] = count
+            total_bytes += size_bytes
+        return {"threads": sum(counts.values()), "by_status": counts, "total_bytes": total_bytes}
+
+    # ------------------------------------------------------------------
+    # 삭제 및 정리
+    # ------------------------------------------------------------------
+
+    async def evict(self, thread_id: str) -> None:
+        """스레드의 모든 체크포인트와 레지스트리 기록 삭제"""
+        await self.checkpointer.adelete_thread(thread_id)
+        if self._is_sqlite:
+            async with self.checkpointer.lock:
+                await self.checkpointer.conn.execute(
+                    "DELETE FROM report_threads WHERE thread_id = ?", (thread_id,)
+                )
+                await self.checkpointer.conn.commit()
+        else:
+            self._threads.pop(thread_id, None)
+        if self.artifacts is not None:
+            await asyncio.to_thread(lambda: self.artifacts().delete_thread(thread_id))
+
+    async def sweep(self) -> list[str]:
+        """
+        보존 기간이 지난 스레드를 보관(archive_dir 지정 시) 후 삭제합니다.
+
+        Returns:
+            삭제된 스레드 ID 목록
+        """
+        cutoff = time.time() - self.retention_seconds
+        if self._is_sqlite:
+            async with self.checkpointer.lock:
+                async with self.checkpointer.conn.execute(
+                    "SELECT thread_id, status, created_at, updated_at, size_bytes "
+                    "FROM report_threads WHERE updated_at < ?",
+                    (cutoff,),
+                ) as cursor:
+                    expired = [ThreadRecord(*row) for row in await cursor.fetchall()]
+        else:
+            expired = [r for r in self._threads.values() if r.updated_at < cutoff]
+
+        for record in expired:
+            if self.archive_dir is not None:
+                await self._archive(record)
+            await self.evict(record.thread_id)
+        return [record.thread_id for record in expired]
+
+    async def run_periodically(self, interval: float) -> None:
+        """interval마다 sweep 실행 (lifespan에서 백그라운드 태스크로 사용)"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                expired = await self.sweep()
+                if expired:
+                    print(f"🧹 만료된 스레드 {len(expired)}개 정리")
+            except Exception as e:
+                print(f"⚠️ 스레드 정리 중 오류 발생: {e}")
+
+    async def _archive(self, record: ThreadRecord) -> None:
+        """스레드의 최신 체크포인트 상태를 날짜별 JSONL 파일에 추가"""
+        checkpoint = await self.checkpointer.aget_tuple({"configurable": {"thread_id": record.thread_id}})
+        entry = record.to_dict()
+        entry["archived_at"] = time.time()
+        entry["values"] = checkpoint.checkpoint["channel_values"] if checkpoint else None
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        path = self.archive_dir / f"threads-{time.strftime('%Y%m%d')}.jsonl"
+        line = json.dumps(entry, ensure_ascii=False, default=dumpd)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    async def _measure(self, thread_id: str) -> int:
+        """스레드가 체크포인터에서 차지하는 직렬화 크기(bytes)"""
+        if self._is_sqlite:
+            async with self.checkpointer.lock:
+                async with self.checkpointer.conn.execute(
+                    """
+                    SELECT
+                        (SELECT COALESCE(SUM(LENGTH(checkpoint) + LENGTH(metadata)), 0)
+                         FROM checkpoints WHERE thread_id = ?)
+                      + (SELECT COALESCE(SUM(LENGTH(value)), 0)
+                         FROM writes WHERE thread_id = ?)
+                    """,
+                    (thread_id, thread_id),
+                ) as cursor:
+                    row = await cursor.fetchone()
+            return int(row[0] or 0)
+
+        storage: Any = getattr(self.checkpointer, "storage", None)
+        if storage is None:
+            return 0
+        size = 0
+        for checkpoints in storage.get(thread_id, {}).values():
+            for (_, checkpoint), (_, metadata), _ in checkpoints.values():
+                size += len(checkpoint) + len(metadata)
+        for (write_thread, _, _), writes in self.checkpointer.writes.items():
+            if write_thread == thread_id:
+                size += sum(len(value) for _, _, (_, value), _ in writes.values())
+        for (blob_thread, _, _, _), (_, value) in self.checkpointer.blobs.items():
+            if blob_thread == thread_id:
+                size += len(value)
+        return size
+
+    async def _prune(self, thread_id: str, keep: int) -> None:
+        """루트 네임스페이스에서 최신 체크포인트 keep개만 남기고 삭제"""
+        if self._is_sqlite:
+            async with self.checkpointer.lock:
+                conn = self.checkpointer.conn
+                await conn.execute(
+                    """
+                    DELETE FROM checkpoints
+                    WHERE thread_id = ? AND checkpoint_ns = '' AND checkpoint_id NOT IN (
+                        SELECT checkpoint_id FROM checkpoints
+                        WHERE thread_id = ? AND checkpoint_ns = ''
+                        ORDER BY checkpoint_id DESC LIMIT ?
+                    )
+                    """,
+                    (thread_id, thread_id, keep),
+                )
+                await conn.execute(
+                    """
+                    DELETE FROM writes
+                    WHERE thread_id = ? AND checkpoint_ns = '' AND checkpoint_id NOT IN (
+                        SELECT checkpoint_id FROM checkpoints
+                        WHERE thread_id = ? AND checkpoint_ns = ''
+                    )
+                    """,
+                    (thread_id, thread_id),
+                )
+                await conn.commit()
+            return
+
+        storage: Any = getattr(self.checkpointer, "storage", None)
+        if storage is None:
+            return
+        checkpoints = storage.get(thread_id, {}).get("", {})
+        pruned = sorted(checkpoints, reverse=True)[keep:]
+        if not pruned:
+            return
+        for checkpoint_id in pruned:
+            del checkpoints[checkpoint_id]
+            self.checkpointer.writes.pop((thread_id, "", checkpoint_id), None)
+
+        # 채널 값(blob)은 버전별로 따로 저장되므로, 남은 체크포인트가 참조하지 않는 버전을 삭제
+        serde = self.checkpointer.serde
+        referenced = {
+            (channel, version)
+            for serialized, _, _ in checkpoints.values()
+            for channel, version in serde.loads_typed(serialized)["channel_versions"].items()
+        }
+        blobs = self.checkpointer.blobs
+        for key in [k for k in blobs if k[0] == thread_id and k[1] == "" and (k[2], k[3]) not in referenced]:
+            del blobs[key]
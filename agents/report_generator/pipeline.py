@@ -0,0 +1,203 @@
+"""
+Deterministic Report Pipeline
+=============================
+LLM 없이 리포트를 생성하는 인프로세스 파이프라인 (ReportInput.mode="pipeline")
+
+시스템 프롬프트가 고정한 도구 순서를 그대로 직접 실행합니다:
+    stream_convert_codes(MCP) → 집계(aggregate_conversions) → 리포트 렌더러 (render_report)
+
+에이전트 도구(aggregate_by_standard_code, generate_markdown_report)와 같은 집계 엔진과 렌더러를
+직접 사용하므로 결과 형식은 동일하지만(아티팩트 offload 없이 항상 전체 결과),
+모델이 도구를 고르거나 큰 JSON을 메시지로 옮겨 적는 비용과 수량 전사 오류가 없습니다.
+
+여러 리포트를 한 번에 처리할 때(iter_batch_reports)는 모든 리포트의 외부 코드를
+중복 제거하여 한 번만 변환하고, 리포트별 집계/렌더링은 동시에 실행합니다.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from itertools import repeat
+from typing import AsyncIterator, Iterator
+
+from agents.report_generator.aggregation import GroupAggregate, aggregate_conversions
+from agents.report_generator.conversion_stream import iter_converted_chunks
+from agents.report_generator.rendering import ReportData, render_report
+from agents.report_generator.schemas import ReportInput
+
+
+@dataclass
+class PipelineResult:
+    """파이프라인 실행 결과"""
+
+    conversions: list[dict]
+    aggregated: dict[str, int]
+    report: str
+    # 단계별 소요 시간(ms)
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+def uses_pipeline(input_data: ReportInput) -> bool:
+    """
+    파이프라인으로 처리할 요청인지 판단
+    (자유 형식 지침이 있으면 에이전트 사용, 마크다운 이외의 형식은 모델 없이 집계에서 직접 생성 -
+    지침과 마크다운 이외의 형식을 함께 요청하면 ReportInput 검증에서 거부됨)
+    """
+    if input_data.instruction:
+        return False
+    return input_data.mode == "pipeline" or input_data.format != "markdown"
+
+
+async def convert_codes(mcp_client, external_codes: list[str]) -> list[dict]:
+    """1단계: MCP 스트리밍 변환 결과를 입력 순서대로 수집"""
+    conversions: list[dict] = [{}] * len(external_codes)
+    async for offset, results in iter_converted_chunks(mcp_client, external_codes):
+        conversions[offset:offset + len(results)] = results
+    return conversions
+
+
+async def convert_and_aggregate(
+    mcp_client,
+    external_codes: list[str],
+    quantities: list[int],
+    keep_offset: int = 0,
+    keep_limit: int | None = None,
+) -> tuple[list[dict], GroupAggregate, float]:
+    """
+    1~2단계: 변환 청크가 도착하는 즉시 해당 행을 집계에 병합합니다.
+    나머지 청크를 변환하는 동안 앞 청크의 집계가 끝나므로 변환과 집계가 겹쳐 실행됩니다.
+
+    변환 결과는 [keep_offset, keep_offset + keep_limit) 구간만 보관하므로,
+    keep_limit을 지정하면 메모리 사용량이 전체 행 수가 아니라 그룹 수 + 구간 크기에 비례합니다.
+
+    Returns:
+        (보관한 구간의 변환 결과, 표준 코드별 집계, 집계에 쓴 시간(ms))
+    """
+    start = min(max(0, keep_offset), len(external_codes))
+    stop = len(external_codes) if keep_limit is None else min(len(external_codes), start + max(0, keep_limit))
+    kept: list[dict] = [{}] * (stop - start)
+    aggregate = GroupAggregate()
+    aggregate_seconds = 0.0
+    async for offset, results in iter_converted_chunks(mcp_client, external_codes):
+        low, high = max(offset, start), min(offset + len(results), stop)
+        if low < high:
+            kept[low - start:high - start] = results[low - offset:high - offset]
+        started = time.perf_counter()
+        aggregate.merge(aggregate_conversions(results, quantities[offset:offset + len(results)]))
+        aggregate_seconds += time.perf_counter() - started
+    return kept, aggregate, aggregate_seconds * 1000
+
+
+def iter_detail_window(kept: list[dict], offset: int, total: int) -> Iterator[dict]:
+    """
+    보관한 구간을 전체 변환 내역 위치에 놓은 이터레이터
+    렌더러는 구간 밖의 행을 건너뛰거나 세기만 하므로 빈 레코드로 채웁니다.
+    """
+    offset = min(max(0, offset), total)
+    yield from repeat({}, offset)
+    yield from kept
+    yield from repeat({}, total - offset - len(kept))
+
+
+def build_report(
+    input_data: ReportInput,
+    conversions: list[dict],
+    convert_ms: float,
+    aggregate: GroupAggregate | None = None,
+    aggregate_ms: float = 0.0,
+) -> PipelineResult:
+    """
+    2~3단계: 변환 결과로 집계 및 리포트 생성 (input_data.format 형식)
+    변환 중에 이미 집계했으면(convert_and_aggregate) aggregate로 전달받아 렌더링만 합니다.
+    """
+    timings = {"convert_ms": convert_ms}
+
+    if aggregate is not None:
+        aggregated = aggregate.sums()
+        timings["aggregate_ms"] = aggregate_ms
+    else:
+        started = time.perf_counter()
+        aggregated = aggregate_conversions(conversions, input_data.quantities).sums()
+        timings["aggregate_ms"] = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    report = render_report(ReportData(aggregated, conversions), input_data.format)
+    timings["render_ms"] = (time.perf_counter() - started) * 1000
+
+    return PipelineResult(conversions=conversions, aggregated=aggregated, report=report, timings=timings)
+
+
+async def prepare_report(
+    mcp_client,
+    input_data: ReportInput,
+    detail_offset: int = 0,
+    detail_limit: int | None = None,
+) -> ReportData:
+    """
+    변환과 집계만 실행합니다 (렌더링은 호출자가 스트리밍으로 수행).
+
+    집계 섹션이 변환 내역보다 먼저 출력되므로 렌더링은 모든 변환이 끝난 뒤 시작됩니다.
+    대신 변환 내역은 렌더링할 페이지(detail_offset/detail_limit)만 보관하므로
+    detail_limit을 지정하면 최대 메모리가 행 수와 무관합니다 (요청 본문의 코드/수량 목록 제외).
+    detail_limit이 없으면 detail_offset 이후의 변환 결과를 모두 보관합니다.
+
+    Returns:
+        렌더러 입력 (conversion_details는 전체 행 위치를 유지하는 이터레이터)
+    """
+    kept, aggregate, _ = await convert_and_aggregate(
+        mcp_client, input_data.external_codes, input_data.quantities, detail_offset, detail_limit
+    )
+    total = len(input_data.external_codes)
+    return ReportData(aggregate.sums(), iter_detail_window(kept, detail_offset, total))
+
+
+async def run_report_pipeline(mcp_client, input_data: ReportInput) -> PipelineResult:
+    """
+    변환 → 집계 → 마크다운 리포트 생성을 모델 없이 실행합니다.
+    (집계는 변환 청크가 도착할 때마다 진행되므로 timings의 convert_ms에 aggregate_ms가 포함됩니다)
+    """
+    started = time.perf_counter()
+    conversions, aggregate, aggregate_ms = await convert_and_aggregate(
+        mcp_client, input_data.external_codes, input_data.quantities
+    )
+    convert_ms = (time.perf_counter() - started) * 1000
+    return build_report(input_data, conversions, convert_ms, aggregate, aggregate_ms)
+
+
+async def iter_batch_reports(
+    mcp_client,
+    items: list[tuple[int, ReportInput]],
+    max_concurrency: int,
+) -> AsyncIterator[tuple[int, PipelineResult | Exception]]:
+    """
+    여러 리포트를 공유 변환으로 생성하고, 완료되는 순서대로 전달합니다.
+
+    Args:
+        mcp_client: MultiServerMCPClient 또는 MCPSessionPools (session(name)을 제공하는 객체)
+        items: (요청 내 인덱스, 리포트 입력) 목록
+        max_concurrency: 동시에 렌더링할 최대 리포트 수
+
+    Yields:
+        (인덱스, PipelineResult 또는 해당 리포트의 오류)
+    """
+    if not items:
+        return
+
+    # 전체 리포트의 외부 코드를 중복 제거하여 한 번만 변환
+    unique_codes = list(dict.fromkeys(code for _, input_data in items for code in input_data.external_codes))
+    started = time.perf_counter()
+    converted = dict(zip(unique_codes, await convert_codes(mcp_client, unique_codes)))
+    convert_ms = (time.perf_counter() - started) * 1000
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def render(index: int, input_data: ReportInput) -> tuple[int, PipelineResult | Exception]:
+        async with semaphore:
+            conversions = [converted[code] for code in input_data.external_codes]
+            try:
+                return index, await asyncio.to_thread(build_report, input_data, conversions, convert_ms)
+            except Exception as e:
+                return index, e
+
+    for finished in asyncio.as_completed([render(index, input_data) for index, input_data in items]):
+        yield await finished
@@ -0,0 +1,241 @@
+"""
+Report Rendering
+================
+같은 집계 구조(ReportData)에서 여러 형식의 리포트를 생성하는 렌더러
+
+지원 형식:
+    markdown - 사람이 읽는 리포트 (generate_markdown_report와 동일한 출력)
+    csv      - 표준 코드별 집계 (standard_code,total_quantity) - 변환 내역이 없으므로 페이지 인자는 무시
+    jsonl    - 한 줄에 레코드 하나 (currency / aggregate / summary / conversion)
+    html     - 독립 실행형 HTML 문서
+
+행 템플릿은 모듈 로드 시 한 번만 준비(str.format 바인딩, string.Template)되고,
+모든 렌더러는 청크 제너레이터이므로 StreamingResponse로 바로 전송할 수 있습니다.
+기계 소비자는 CSV/JSONL을 집계에서 바로 받으므로 마크다운을 다시 파싱할 필요가 없습니다.
+"""
+
+import csv
+import html
+import io
+import json
+from dataclasses import dataclass
+from itertools import islice
+from string import Template
+from typing import Callable, Iterable, Iterator
+
+from agents.report_generator.tools.markdown import DEFAULT_CHUNK_LINES, iter_markdown_report
+
+REPORT_FORMATS = ("markdown", "csv", "jsonl", "html")
+
+MEDIA_TYPES = {
+    "markdown": "text/markdown; charset=utf-8",
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson",
+    "html": "text/html; charset=utf-8",
+}
+
+
+@dataclass
+class ReportData:
+    """
+    렌더러 공통 입력
+
+    Attributes:
+        aggregated: 표준 코드별 총 수량
+        conversion_details: 변환 상세 내역 (목록 또는 이터레이터)
+        currency_info: (선택) 환율 정보
+    """
+
+    aggregated: dict[str, int]
+    conversion_details: Iterable[dict]
+    currency_info: dict | None = None
+
+    def sorted_aggregates(self) -> list[tuple[str, int]]:
+        return sorted(self.aggregated.items())
+
+    def currency(self) -> dict | None:
+        """표시할 환율 정보 (조회 실패 시 None)"""
+        if self.currency_info and self.currency_info.get("success", True):
+            return self.currency_info
+        return None
+
+
+def _chunked(lines: Iterator[str], chunk_lines: int, terminator: str = "") -> Iterator[str]:
+    """줄 이터레이터를 청크로 묶음 (terminator는 각 줄 끝에 붙일 문자열)"""
+    chunk_lines = max(1, chunk_lines)
+    while batch := list(islice(lines, chunk_lines)):
+        yield "".join(line + terminator for line in batch)
+
+
+def _page(details: Iterable[dict], offset: int, limit: int | None) -> Iterator[dict]:
+    return islice(details, max(0, offset), None if limit is None else max(0, offset) + max(0, limit))
+
+
+# ============================================================================
+# CSV
+# ============================================================================
+
+CSV_HEADER = ("standard_code", "total_quantity")
+
+
+def _iter_csv(data: ReportData, detail_offset: int, detail_limit: int | None, chunk_lines: int) -> Iterator[str]:
+    """표준 코드별 집계 CSV (변환 내역을 포함하지 않으므로 detail_offset/detail_limit은 사용하지 않음)"""
+    rows = iter([CSV_HEADER, *data.sorted_aggregates()])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    while batch := list(islice(rows, max(1, chunk_lines))):
+        writer.writerows(batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+# ============================================================================
+# JSON Lines
+# ============================================================================
+
+_encode_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _iter_jsonl_lines(data: ReportData, detail_offset: int, detail_limit: int | None) -> Iterator[str]:
+    currency = data.currency()
+    if currency:
+        yield _encode_json({
+            "type": "currency",
+            "base_currency": currency.get("base_currency", "USD"),
+            "target_currency": currency.get("target_currency", "KRW"),
+            "rate": currency.get("rate", 0),
+        })
+
+    total_qty = 0
+    for code, qty in data.sorted_aggregates():
+        total_qty += qty
+        yield _encode_json({"type": "aggregate", "standard_code": code, "total_quantity": qty})
+    yield _encode_json({"type": "summary", "total_items": len(data.aggregated), "total_quantity": total_qty})
+
+    for detail in _page(data.conversion_details, detail_offset, detail_limit):
+        yield _encode_json({
+            "type": "conversion",
+            "external_code": detail.get("external_code"),
+            "standard_code": detail.get("standard_code"),
+            "category": detail.get("category"),
+        })
+
+
+def _iter_jsonl(data: ReportData, detail_offset: int, detail_limit: int | None, chunk_lines: int) -> Iterator[str]:
+    return _chunked(_iter_jsonl_lines(data, detail_offset, detail_limit), chunk_lines, "\n")
+
+
+# ============================================================================
+# HTML
+# ============================================================================
+
+_HTML_HEAD = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>$title</title>
+<style>
+body { font-family: sans-serif; margin: 2rem; }
+table { border-collapse: collapse; margin-bottom: 1.5rem; }
+th, td { border: 1px solid #ccc; padding: 0.25rem 0.75rem; }
+td.num { text-align: right; }
+</style>
+</head>
+<body>
+<h1>$title</h1>""")
+_HTML_CURRENCY = Template("<h2>💱 환율 정보</h2>\n<p>기준: 1 $base = $rate $target</p>")
+_HTML_AGGREGATE_HEAD = "<h2>집계 결과</h2>\n<table>\n<thead><tr><th>표준 코드</th><th>총 수량</th></tr></thead>\n<tbody>"
+_HTML_AGGREGATE_ROW = '<tr><td>{0}</td><td class="num">{1}</td></tr>'.format
+_HTML_SUMMARY = Template(
+    "</tbody>\n</table>\n<p><strong>총 항목 수</strong>: ${items}개<br><strong>총 수량</strong>: $quantity</p>"
+)
+_HTML_DETAIL_HEAD = (
+    "<h2>변환 내역</h2>\n<table>\n"
+    "<thead><tr><th>외부 코드</th><th>표준 코드</th><th>카테고리</th></tr></thead>\n<tbody>"
+)
+_HTML_DETAIL_ROW = "<tr><td>{0}</td><td>{1}</td><td>{2}</td></tr>".format
+_HTML_TAIL = "</tbody>\n</table>\n</body>\n</html>"
+
+
+def _iter_html_lines(data: ReportData, detail_offset: int, detail_limit: int | None) -> Iterator[str]:
+    escape = html.escape
+    yield _HTML_HEAD.substitute(title="📊 표준 코드 집계 리포트")
+
+    currency = data.currency()
+    if currency:
+        yield _HTML_CURRENCY.substitute(
+            base=escape(str(currency.get("base_currency", "USD"))),
+            rate=f"{currency.get('rate', 0):,.2f}",
+            target=escape(str(currency.get("target_currency", "KRW"))),
+        )
+
+    yield _HTML_AGGREGATE_HEAD
+    total_qty = 0
+    for code, qty in data.sorted_aggregates():
+        total_qty += qty
+        yield _HTML_AGGREGATE_ROW(escape(str(code)), qty)
+    yield _HTML_SUMMARY.substitute(items=len(data.aggregated), quantity=total_qty)
+
+    yield _HTML_DETAIL_HEAD
+    for detail in _page(data.conversion_details, detail_offset, detail_limit):
+        yield _HTML_DETAIL_ROW(
+            escape(str(detail.get("external_code", "N/A"))),
+            escape(str(detail.get("standard_code", "N/A"))),
+            escape(str(detail.get("category", "N/A"))),
+        )
+    yield _HTML_TAIL
+
+
+def _iter_html(data: ReportData, detail_offset: int, detail_limit: int | None, chunk_lines: int) -> Iterator[str]:
+    return _chunked(_iter_html_lines(data, detail_offset, detail_limit), chunk_lines, "\n")
+
+
+# ============================================================================
+# Markdown
+# ============================================================================
+
+def _iter_markdown(data: ReportData, detail_offset: int, detail_limit: int | None, chunk_lines: int) -> Iterator[str]:
+    return iter_markdown_report(
+        data.aggregated, data.conversion_details, data.currency_info,
+        detail_offset=detail_offset, detail_limit=detail_limit, chunk_lines=chunk_lines,
+    )
+
+
+_RENDERERS: dict[str, Callable[[ReportData, int, int | None, int], Iterator[str]]] = {
+    "markdown": _iter_markdown,
+    "csv": _iter_csv,
+    "jsonl": _iter_jsonl,
+    "html": _iter_html,
+}
+
+
+def iter_report(
+    data: ReportData,
+    format: str = "markdown",
+    detail_offset: int = 0,
+    detail_limit: int | None = None,
+    chunk_lines: int = DEFAULT_CHUNK_LINES,
+) -> Iterator[str]:
+    """
+    리포트를 지정한 형식의 청크로 생성합니다.
+
+    Args:
+        data: 집계 구조
+        format: 출력 형식 (REPORT_FORMATS 중 하나)
+        detail_offset: 변환 내역에서 건너뛸 행 수 (CSV는 변환 내역을 포함하지 않음)
+        detail_limit: 변환 내역의 최대 행 수 (None이면 전체)
+        chunk_lines: 청크당 줄 수
+
+    Raises:
+        ValueError: 지원하지 않는 형식인 경우
+    """
+    renderer = _RENDERERS.get(format)
+    if renderer is None:
+        raise ValueError(f"지원하지 않는 리포트 형식입니다: {format} (지원: {', '.join(REPORT_FORMATS)})")
+    return renderer(data, detail_offset, detail_limit, chunk_lines)
+
+
+def render_report(data: ReportData, format: str = "markdown") -> str:
+    """리포트 전체를 문자열로 생성"""
+    return "".join(iter_report(data, format))
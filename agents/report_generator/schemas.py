@@ -4,8 +4,8 @@ Report Generator Input/Output Schemas
 리포트 생성 요청 및 응답 스키마
 """
 
-from typing import Any
-from pydantic import BaseModel, Field
+from typing import Any, Literal
+from pydantic import BaseModel, Field, model_validator
 
 
 class ReportInput(BaseModel):
@@ -18,6 +18,42 @@ class ReportInput(BaseModel):
         description="각 코드에 해당하는 수량 목록"
     )
     instruction: str | None = None  # 사용자 추가 지침
+    # agent: DeepAgent가 도구를 선택해 실행 (기본값)
+    # pipeline: 변환 → 집계 → 리포트를 모델 없이 직접 실행 (instruction이 있으면 agent로 처리)
+    mode: Literal["agent", "pipeline"] = "agent"
+    # 리포트 출력 형식 (markdown 이외의 형식은 pipeline으로 처리 - instruction과 함께 쓸 수 없음)
+    format: Literal["markdown", "csv", "jsonl", "html"] = "markdown"
+
+    @model_validator(mode="after")
+    def _check_lengths(self) -> "ReportInput":
+        # 모든 경로(/report/invoke, /report/stream, /report/render 등)에서 422로 거부
+        if len(self.external_codes) != len(self.quantities):
+            raise ValueError(
+                f"외부 코드({len(self.external_codes)}개)와 "
+                f"수량({len(self.quantities)}개)의 개수가 다릅니다"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def _check_format(self) -> "ReportInput":
+        # instruction이 있으면 에이전트가 마크다운 리포트를 만들므로 다른 형식을 지원하지 않음
+        if self.instruction and self.format != "markdown":
+            raise ValueError(
+                f"instruction이 있는 요청은 markdown 형식만 지원합니다 (요청 형식: {self.format})"
+            )
+        return self
+
+
+class BatchReportInput(BaseModel):
+    """여러 리포트 생성 요청 (/report/batch)"""
+
+    reports: list[ReportInput] = Field(
+        description="리포트 입력 목록 (instruction이 없는 리포트는 공유 변환 파이프라인으로 처리)"
+    )
+    max_concurrency: int | None = Field(
+        default=None,
+        description="동시에 처리할 최대 리포트 수 (기본값: REPORT_BATCH_CONCURRENCY)"
+    )
 
 
 class ReportOutput(BaseModel):
@@ -7,18 +7,19 @@ Usage:
     python -m agents.report_generator.server
 """
 
+import asyncio
+import json
 import sys
 from pathlib import Path
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-from langchain.chat_models import init_chat_model
 from langchain_core.runnables import RunnableLambda
 from langserve import add_routes
-from deepagents import create_deep_agent
-from deepagents.backends import FilesystemBackend
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from langgraph.types import Command
 
@@ -31,37 +32,63 @@ from agents.report_generator.config import (
     get_system_prompt,
     get_agents_md_path,
     get_skills_paths,
-    get_mcp_server_config
+    get_mcp_server_config,
+    get_tools_refresh_interval,
+    get_checkpointer_config,
+    get_batch_config,
+    get_compaction_config,
+    get_mcp_pool_config,
+    is_fast_startup_enabled
 )
-from agents.report_generator.schemas import ReportInput, ReportOutput
+from agents.report_generator.agent_registry import ReportAgentRegistry
+from agents.report_generator.artifacts import ConversionArtifactInterceptor, get_artifact_store
+from agents.report_generator.compaction import COMPACTION_EVENT, HistoryCompactionMiddleware
+from agents.report_generator.mcp_pool import MCPSessionPools
+from agents.report_generator.persistence import ThreadRegistry, open_checkpointer
+from agents.report_generator.pipeline import (
+    PipelineResult,
+    iter_batch_reports,
+    prepare_report,
+    run_report_pipeline,
+    uses_pipeline
+)
+from agents.report_generator.schemas import BatchReportInput, ReportInput, ReportOutput
 from agents.report_generator.tools.aggregate import aggregate_by_standard_code
+from agents.report_generator.rendering import MEDIA_TYPES, iter_report
 from agents.report_generator.tools.markdown import generate_markdown_report
 from agents.report_generator.tools.finance import get_exchange_rate
+from agents.report_generator.tools.rates import get_exchange_rates
 from agents.report_generator.tools.memory import save_user_preference
 
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.store.memory import InMemoryStore
 
-# 전역 MCP 클라이언트
-mcp_client = None
+# 전역 MCP 클라이언트 (세션 풀 사용 시 MCPSessionPools - session()/get_tools() 인터페이스 동일)
+mcp_client: MCPSessionPools | MultiServerMCPClient | None = None
+
+# 컴파일된 에이전트 레지스트리 (lifespan에서 초기화)
+agent_registry: ReportAgentRegistry | None = None
 
 # HITL 및 Long-term Memory를 위한 전역 저장소
-checkpointer = MemorySaver()
+# (체크포인터는 lifespan에서 설정에 맞게 열림 - 기본값 SQLite로 재시작 후에도 resume 가능)
+checkpointer: BaseCheckpointSaver | None = None
+thread_registry: ThreadRegistry | None = None
 store = InMemoryStore()
 
 class ResumeInput(BaseModel):
     thread_id: str
     decision: str  # approve, reject, edit
     edited_args: dict | None = None
+    tool_name: str = "get_exchange_rate"  # edit 대상 도구 (인터럽트된 action의 name)
 
 
 # ============================================================================
 # DeepAgent 설정 (리포트 생성 전문가)
 # ============================================================================
 
-# 모델 설정 로드
+# 모델 설정 로드 (모델과 deepagents는 첫 에이전트 컴파일 시 import - 서버 시작 시간 단축)
 model_config = get_model_config()
-model = init_chat_model(**model_config)
+_model = None
 
 # System Prompt (WHO - 정체성과 절대 규칙)
 system_prompt = get_system_prompt()
@@ -72,44 +99,199 @@ agents_md_path = get_agents_md_path()
 # Skills 경로 (HOW - 재사용 가능한 지침)
 skills_paths = get_skills_paths()
 
-# Backend 설정 (FilesystemBackend)
+# Backend 설정 (FilesystemBackend - build_report_agent에서 생성)
 agent_dir = Path(__file__).parent
-backend = FilesystemBackend(root_dir=agent_dir)
 
-
-async def process_report_request(input_data: ReportInput) -> dict:
-    """리포트 생성 요청 처리 (DeepAgent 사용)"""
-    
-    global mcp_client
-
-    # MCP 도구 가져오기 (비동기 그대로 사용)
-    mcp_tools = await mcp_client.get_tools()
-    
-    # 로컬 도구와 MCP 도구 결합
-    all_tools = [
-        aggregate_by_standard_code,
-        generate_markdown_report,
-        get_exchange_rate,
-        save_user_preference
-    ] + mcp_tools
-    
-    # DeepAgent 생성 (DeepAgents 표준 패턴)
-    agent = create_deep_agent(
-        model=model,
-        tools=all_tools,
+# 로컬 도구 (MCP 도구와 결합하여 사용)
+local_tools = [
+    aggregate_by_standard_code,
+    generate_markdown_report,
+    get_exchange_rate,
+    get_exchange_rates,
+    save_user_preference
+]
+
+# 기본 인터럽트 설정 (환율 조회 시 인터럽트)
+RATE_TOOLS = ("get_exchange_rate", "get_exchange_rates")
+DEFAULT_INTERRUPT_ON = {name: True for name in RATE_TOOLS}
+
+# 토큰 예산을 넘는 메시지 기록 압축 (HITL 재개 시에도 줄어든 기록 사용)
+compaction_config = get_compaction_config()
+middleware = [HistoryCompactionMiddleware(**compaction_config)] if compaction_config else []
+
+
+def build_report_agent(mcp_tools: list, interrupt_on: dict):
+    """리포트 DeepAgent 생성 (DeepAgents 표준 패턴) - 레지스트리가 설정별로 한 번만 호출"""
+    from langchain.chat_models import init_chat_model
+    from deepagents import create_deep_agent
+    from deepagents.backends import FilesystemBackend
+
+    global _model
+    if _model is None:
+        _model = init_chat_model(**model_config)
+    return create_deep_agent(
+        model=_model,
+        tools=local_tools + mcp_tools,
         system_prompt=system_prompt,  # WHO
+        middleware=middleware,         # 메시지 기록 압축
         memory=[agents_md_path],      # WHEN + WHICH (MemoryMiddleware가 로드)
         skills=skills_paths,           # HOW (SkillsMiddleware가 로드)
-        backend=backend,
+        backend=FilesystemBackend(root_dir=agent_dir),
         checkpointer=checkpointer,     # Required for HITL
-        interrupt_on={"get_exchange_rate": True}  # 환율 조회 시 인터럽트
+        interrupt_on=interrupt_on
     )
+
+
+# 스트리밍 이벤트에 포함할 도구 결과 미리보기 최대 길이
+TOOL_OUTPUT_PREVIEW_CHARS = 2000
+
+
+def _jsonable(value):
+    """스트리밍 이벤트에 담을 수 있도록 JSON 호환 값으로 변환"""
+    value = getattr(value, "content", value)  # ToolMessage → content
+    return json.loads(json.dumps(value, ensure_ascii=False, default=str))
+
+
+def _preview(value) -> str:
+    """도구 결과 미리보기 문자열 (너무 길면 자름)"""
+    value = _jsonable(value)
+    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+    if len(text) > TOOL_OUTPUT_PREVIEW_CHARS:
+        return text[:TOOL_OUTPUT_PREVIEW_CHARS] + "…"
+    return text
+
+
+async def stream_agent_run(agent, agent_input, thread_id: str) -> AsyncIterator[dict]:
+    """
+    에이전트 실행을 이벤트 스트림으로 변환합니다.
+
+    이벤트 종류:
+        start       - 실행 시작 (즉시 전송)
+        token       - LLM 출력 토큰 ({"content": ...})
+        tool_start  - 도구 호출 시작 ({"name", "input"})
+        tool_end    - 도구 호출 종료 ({"name", "output"} - 미리보기)
+        compaction  - 메시지 기록 압축 ({"messages", "tokens_before", "tokens_after", "tokens_saved"})
+        interrupt   - HITL 인터럽트 (마지막 이벤트, status="interrupted")
+        result      - 최종 결과 (마지막 이벤트, status="completed")
+    """
+    config = {"configurable": {"thread_id": thread_id}}
+    await thread_registry.mark_running(thread_id)
+    yield {"type": "start", "thread_id": thread_id}
+
+    try:
+        async for event in agent.astream_events(agent_input, config=config, version="v2"):
+            kind = event["event"]
+            if kind == "on_chat_model_stream":
+                text = event["data"]["chunk"].text
+                if text:
+                    yield {"type": "token", "content": text}
+            elif kind == "on_tool_start":
+                yield {"type": "tool_start", "name": event["name"], "input": _jsonable(event["data"].get("input"))}
+            elif kind == "on_tool_end":
+                yield {"type": "tool_end", "name": event["name"], "output": _preview(event["data"].get("output"))}
+            elif kind == "on_custom_event" and event["name"] == COMPACTION_EVENT:
+                yield {"type": "compaction", **event["data"]}
+        state = await agent.aget_state(config)
+    except Exception:
+        await thread_registry.on_run_finished(thread_id, "failed")
+        raise
+
+    messages = state.values.get("messages", [])
+    if state.interrupts:
+        print("⏸️ 인터럽트 감지됨")
+        await thread_registry.on_run_finished(thread_id, "interrupted")
+        yield {
+            "type": "interrupt",
+            "status": "interrupted",
+            "thread_id": thread_id,
+            "interrupts": state.interrupts[0].value,
+            "messages": [m.content for m in messages]
+        }
+        return
+
+    # 스레드 삭제 전에 아티팩트로 보관된 리포트를 읽어 둠
+    report = await asyncio.to_thread(_report_from_artifacts, messages, thread_id)
+    await thread_registry.on_run_finished(thread_id, "completed")
+    yield {
+        "type": "result",
+        "status": "completed",
+        "thread_id": thread_id,
+        "report": report if report is not None else messages[-1].content
+    }
+
+
+def _report_from_artifacts(messages: list, thread_id: str) -> str | None:
+    """마지막 generate_markdown_report 결과가 아티팩트 핸들이면 저장된 리포트를 반환"""
+    for message in reversed(messages):
+        if getattr(message, "type", None) != "tool" or message.name != generate_markdown_report.name:
+            continue
+        try:
+            output = json.loads(message.content) if isinstance(message.content, str) else None
+        except json.JSONDecodeError:
+            return None  # 리포트가 본문으로 반환된 경우
+        if isinstance(output, dict) and output.get("kind") == "report":
+            return get_artifact_store().get(thread_id, output["artifact"])
+        return None
+    return None
+
+
+def _pipeline_response(input_data: ReportInput, result: PipelineResult) -> dict:
+    """파이프라인 결과를 에이전트 모드와 같은 응답 형식으로 변환"""
+    return {
+        "type": "result",
+        "status": "completed",
+        "thread_id": None,
+        "report": result.report,
+        "summary": {
+            "input_codes": input_data.external_codes,
+            "input_quantities": input_data.quantities,
+            "total_items": len(input_data.external_codes),
+            "mode": "pipeline",
+            "format": input_data.format,
+            "timings": result.timings,
+        }
+    }
+
+
+async def stream_pipeline_request(input_data: ReportInput) -> AsyncIterator[dict]:
+    """리포트 생성 요청 처리 (파이프라인 모드 - LLM 없이 도구 함수를 직접 실행)"""
+    yield {"type": "start", "thread_id": None}
+
+    print("⚡ 파이프라인 모드로 리포트 생성")
+    result = await run_report_pipeline(mcp_client, input_data)
+    yield _pipeline_response(input_data, result)
+
+
+async def stream_report_request(input_data: ReportInput) -> AsyncIterator[dict]:
+    """리포트 생성 요청 처리 (DeepAgent 사용) - 실행 이벤트를 순서대로 전달"""
     
+    # 자유 형식 지침이 없는 pipeline 요청은 모델 없이 처리
+    if uses_pipeline(input_data):
+        async for event in stream_pipeline_request(input_data):
+            yield event
+        return
+
+    # 미리 컴파일된 에이전트 사용
+    agent = await agent_registry.get(DEFAULT_INTERRUPT_ON)
+
+    import uuid
+    thread_id = str(uuid.uuid4())
+
+    # 입력이 크면 목록 대신 아티팩트 핸들을 전달 (메시지 기록이 입력 크기만큼 커지지 않도록)
+    artifacts = get_artifact_store()
+    codes = await asyncio.to_thread(artifacts.offload, thread_id, "codes", input_data.external_codes)
+    quantities = await asyncio.to_thread(artifacts.offload, thread_id, "quantities", input_data.quantities)
+    if isinstance(codes, dict):
+        # batch_convert_codes의 external_codes는 목록이므로 핸들 하나를 담은 목록으로 전달
+        codes = f"{json.dumps([codes['artifact']])} (아티팩트 핸들 목록, {codes['total']}개)"
+    if isinstance(quantities, dict):
+        quantities = f"{quantities['artifact']} (아티팩트, {quantities['total']}개)"
+
     # 사용자 메시지 구성
     user_message = f"""다음 데이터를 처리하여 리포트를 생성해주세요:
 
-외부 코드 목록: {input_data.external_codes}
-수량 목록: {input_data.quantities}
+외부 코드 목록: {codes}
+수량 목록: {quantities}
 """
 
     if input_data.instruction:
@@ -117,59 +299,47 @@ async def process_report_request(input_data: ReportInput) -> dict:
 
     user_message += """
 1. 먼저 batch_convert_codes 도구로 외부 코드를 변환하세요.
+   외부 코드 목록이 ["art_..."] 형태이면 그 목록을 external_codes에 그대로 전달하세요.
+   (결과에 handle("res_...")이 있으면 fetch_conversion_results로 next_offset이 null이 될 때까지 전체 결과를 가져오세요.)
+   도구 결과나 수량 목록이 아티팩트 핸들("art_...")이면 목록 대신 핸들을 다음 도구에 그대로 전달하세요.
 2. 그 다음 aggregate_by_standard_code로 수량을 집계하세요.
 3. 마지막으로 generate_markdown_report로 리포트를 생성하세요."""
     
     # DeepAgent 실행 (thread_id 포함)
-    import uuid
-    thread_id = str(uuid.uuid4())
-    config = {"configurable": {"thread_id": thread_id}}
-
     print(f"🔄 리포트 요청 처리 시작 (Thread ID: {thread_id})")
     
     print("🤖 에이전트 실행 시작...")
     try:
-        # 비동기 실행 (ainvoke 사용)
-        result = await agent.ainvoke(
+        async for event in stream_agent_run(
+            agent,
             {
                 "messages": [
                     {"role": "user", "content": user_message}
                 ]
             },
-            config=config
-        )
+            thread_id
+        ):
+            if event["type"] == "result":
+                print("🎉 최종 결과 반환")
+                event["summary"] = {
+                    "input_codes": input_data.external_codes,
+                    "input_quantities": input_data.quantities,
+                    "total_items": len(input_data.external_codes),
+                }
+            yield event
     except Exception as e:
         print(f"❌ 에이전트 실행 중 오류 발생: {e}")
         import traceback
         traceback.print_exc()
         raise e
-        
-    print("✅ 에이전트 실행 완료")
-    
-    # 인터럽트 처리
-    if result.get("__interrupt__"):
-        print("⏸️ 인터럽트 감지됨")
-        return {
-            "status": "interrupted",
-            "thread_id": thread_id,
-            "interrupts": result["__interrupt__"][0].value,
-            "messages": [m.content for m in result["messages"]]
-        }
-    
-    print("🎉 최종 결과 반환")
-    # 결과에서 최종 응답 추출
-    final_message = result["messages"][-1].content
-    
-    return {
-        "status": "completed",
-        "thread_id": thread_id,
-        "report": final_message,
-        "summary": {
-            "input_codes": input_data.external_codes,
-            "input_quantities": input_data.quantities,
-            "total_items": len(input_data.external_codes),
-        }
-    }
+
+
+async def process_report_request(input_data: ReportInput) -> dict:
+    """리포트 생성 요청 처리 - 최종 결과(result/interrupt 이벤트)만 반환"""
+    result = None
+    async for event in stream_report_request(input_data):
+        result = event
+    return result
 
 
 # ============================================================================
@@ -183,17 +353,58 @@ async def lifespan(app: FastAPI):
     print(" AGENTS.md: 비즈니스 규칙 로드됨")
     print("🎯 Skills: 재사용 가능한 지침 로드됨")
     
-    global mcp_client
+    global mcp_client, agent_registry, checkpointer, thread_registry
     mcp_server_config = get_mcp_server_config()
     print(f"📋 MCP 서버 설정: {list(mcp_server_config.keys())}")
     
-    mcp_client = MultiServerMCPClient(mcp_server_config)
+    # 큰 변환 결과는 인터셉터가 아티팩트로 보관하고 핸들만 에이전트에 전달
+    tool_interceptors = [ConversionArtifactInterceptor()]
+    pool_config = get_mcp_pool_config()
+    if pool_config["size"] > 0:
+        # 미리 연결한 세션을 재사용 (stdio 모드에서 호출마다 서버 프로세스를 띄우지 않음)
+        mcp_client = MCPSessionPools(mcp_server_config, pool_config, tool_interceptors=tool_interceptors)
+        await mcp_client.start()
+    else:
+        mcp_client = MultiServerMCPClient(mcp_server_config, tool_interceptors=tool_interceptors)
+
+    # 체크포인터 열기 (에이전트 컴파일 전에 필요)
+    resources = AsyncExitStack()
+    checkpoint_config = get_checkpointer_config()
+    checkpointer = await resources.enter_async_context(open_checkpointer(checkpoint_config))
+    thread_registry = ThreadRegistry(
+        checkpointer,
+        retention_seconds=checkpoint_config["retention_seconds"],
+        max_checkpoints_per_thread=checkpoint_config["max_checkpoints_per_thread"],
+        evict_completed=checkpoint_config["evict_completed"],
+        archive_dir=checkpoint_config["archive_dir"],
+        artifacts=get_artifact_store,
+    )
+    expired = await thread_registry.sweep()
+    sweeper = asyncio.create_task(thread_registry.run_periodically(checkpoint_config["sweep_interval"]))
+    print(f"💾 체크포인터: {checkpoint_config['backend']} (만료 스레드 {len(expired)}개 정리)")
+
+    # 에이전트 그래프를 한 번만 컴파일 (기본 설정 + edit 재개용 설정)
+    agent_registry = ReportAgentRegistry(
+        load_tools=mcp_client.get_tools,
+        build_agent=build_report_agent,
+        refresh_interval=get_tools_refresh_interval(),
+    )
+    if is_fast_startup_enabled():
+        # 첫 에이전트 요청에서 도구 목록을 불러오고 컴파일 (파이프라인 요청은 바로 처리)
+        print("⚡ Fast startup: 에이전트 그래프는 첫 에이전트 요청에서 컴파일")
+    else:
+        await agent_registry.start(DEFAULT_INTERRUPT_ON, _resume_interrupt_on("edit"))
+        print(f"🧩 에이전트 그래프 컴파일 완료 ({agent_registry.builds}개 변형)")
 
     yield
     
     print("👋 서버 종료")
+    sweeper.cancel()
+    await resources.aclose()
     # MCP Client Cleanup
-    if mcp_client:
+    if isinstance(mcp_client, MCPSessionPools):
+        await mcp_client.aclose()
+    elif mcp_client:
         try:
             await mcp_client.__aexit__(None, None, None)
         except Exception:
@@ -212,42 +423,20 @@ static_dir = Path(__file__).parent / "static"
 static_dir.mkdir(exist_ok=True)
 app.mount("/ui", StaticFiles(directory=str(static_dir), html=True), name="ui")
 
-@app.post("/report/resume")
-async def resume_report(input_data: ResumeInput):
-    """중단된 리포트 생성 재개"""
-    global mcp_client
-    
-    # 도구 및 에이전트 재구성 (동일한 설정 필요)
-    mcp_tools = await mcp_client.get_tools()
-    all_tools = [
-        aggregate_by_standard_code,
-        generate_markdown_report,
-        get_exchange_rate,
-        save_user_preference
-    ] + mcp_tools
-    
-    # 인터럽트 설정
-    interrupt_on = {"get_exchange_rate": True}
+def _resume_interrupt_on(decision: str) -> dict:
+    """재개 결정에 따른 인터럽트 설정"""
+    interrupt_on = dict(DEFAULT_INTERRUPT_ON)
     
     # 수정(edit) 결정인 경우, 해당 도구의 인터럽트를 비활성화하여 무한 루프 방지
-    if input_data.decision == "edit":
-        # 현재 코드에서는 get_exchange_rate만 인터럽트 대상이므로 이를 수정 중이라면 제외
-        if "get_exchange_rate" in interrupt_on:
-             del interrupt_on["get_exchange_rate"]
-
-    agent = create_deep_agent(
-        model=model,
-        tools=all_tools,
-        system_prompt=system_prompt,
-        memory=[agents_md_path],
-        skills=skills_paths,
-        backend=backend,
-        checkpointer=checkpointer,
-        interrupt_on=interrupt_on
-    )
-    
-    config = {"configurable": {"thread_id": input_data.thread_id}}
-    
+    if decision == "edit":
+        # 현재 코드에서는 환율 도구만 인터럽트 대상이므로 이를 수정 중이라면 제외
+        for name in RATE_TOOLS:
+            interrupt_on.pop(name, None)
+    return interrupt_on
+
+
+def _resume_command(input_data: ResumeInput) -> Command:
+    """재개 결정을 에이전트 재개 명령으로 변환"""
     # 결정 구성
     decisions = []
     if input_data.decision == "approve":
@@ -259,41 +448,180 @@ async def resume_report(input_data: ResumeInput):
         decisions = [{
             "type": "edit",
             "edited_action": {
-                "name": "get_exchange_rate",
+                "name": input_data.tool_name,
                 "args": input_data.edited_args
             }
         }]
-    
-    
-    # 재개 (ainvoke 사용)
+    return Command(resume={"decisions": decisions})
+
+
+async def stream_resume(input_data: ResumeInput) -> AsyncIterator[dict]:
+    """중단된 리포트 생성 재개 - 실행 이벤트를 순서대로 전달 (오류는 error 이벤트)"""
+    # 결정에 맞는 인터럽트 설정의 컴파일된 에이전트 사용 (동일한 도구 구성)
+    agent = await agent_registry.get(_resume_interrupt_on(input_data.decision))
     try:
-        result = await agent.ainvoke(
-            Command(resume={"decisions": decisions}),
-            config=config
-        )
+        async for event in stream_agent_run(agent, _resume_command(input_data), input_data.thread_id):
+            yield event
     except Exception as e:
-        return {"error": str(e)}
-    
-    # 결과 처리
-    if result.get("__interrupt__"):
-        return {
-            "status": "interrupted",
-            "thread_id": input_data.thread_id,
-            "interrupts": result["__interrupt__"][0].value,
-            "messages": [m.content for m in result["messages"]]
-        }
+        yield {"type": "error", "error": str(e)}
 
-    final_message = result["messages"][-1].content
-    
+
+@app.post("/report/resume")
+async def resume_report(input_data: ResumeInput):
+    """중단된 리포트 생성 재개"""
+    result = None
+    async for event in stream_resume(input_data):
+        result = event
+    if result.get("type") == "error":
+        return {"error": result["error"]}
+    return result
+
+
+@app.post("/report/resume/stream")
+async def resume_report_stream(input_data: ResumeInput):
+    """중단된 리포트 생성 재개 (SSE 스트리밍 - /report/stream과 같은 형식)"""
+    return StreamingResponse(_sse(stream_resume(input_data)), media_type="text/event-stream")
+
+
+async def _sse(events: AsyncIterator[dict]) -> AsyncIterator[str]:
+    """이벤트를 LangServe /stream과 같은 SSE 형식으로 직렬화"""
+    async for event in events:
+        yield f"event: data\r\ndata: {json.dumps(event, ensure_ascii=False)}\r\n\r\n"
+    yield "event: end\r\n\r\n"
+
+
+async def stream_batch_reports(batch: BatchReportInput) -> AsyncIterator[dict]:
+    """
+    여러 리포트를 생성하고 완료되는 순서대로 결과를 전달합니다.
+
+    instruction이 없는 리포트는 외부 코드를 중복 제거해 한 번만 변환하는 공유 파이프라인으로,
+    instruction이 있는 리포트는 에이전트로 처리합니다. 마지막 이벤트는 배치 요약입니다.
+    """
+    max_concurrency = max(1, batch.max_concurrency or get_batch_config()["max_concurrency"])
+    pipeline_items = [(i, r) for i, r in enumerate(batch.reports) if not r.instruction]
+    agent_items = [(i, r) for i, r in enumerate(batch.reports) if r.instruction]
+    unique_codes = {code for _, r in pipeline_items for code in r.external_codes}
+    print(f"📦 배치 리포트 {len(batch.reports)}개 (파이프라인 {len(pipeline_items)}개, 고유 코드 {len(unique_codes)}개)")
+
+    queue: asyncio.Queue[dict] = asyncio.Queue()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_pipelines() -> None:
+        async for index, result in iter_batch_reports(mcp_client, pipeline_items, max_concurrency):
+            if isinstance(result, Exception):
+                await queue.put({"index": index, "status": "failed", "error": str(result)})
+            else:
+                await queue.put({"index": index, **_pipeline_response(batch.reports[index], result)})
+
+    async def run_agent(index: int, input_data: ReportInput) -> None:
+        async with semaphore:
+            try:
+                result = await process_report_request(input_data)
+            except Exception as e:
+                result = {"status": "failed", "error": str(e)}
+        await queue.put({"index": index, **result})
+
+    tasks = [asyncio.create_task(run_pipelines())]
+    tasks += [asyncio.create_task(run_agent(index, input_data)) for index, input_data in agent_items]
+    try:
+        pending = set(tasks)
+        while pending or not queue.empty():
+            getter = asyncio.ensure_future(queue.get())
+            done, pending = await asyncio.wait(pending | {getter}, return_when=asyncio.FIRST_COMPLETED)
+            pending.discard(getter)
+            if getter in done:
+                yield getter.result()
+            else:
+                getter.cancel()
+            for task in done - {getter}:
+                task.result()  # 파이프라인 자체의 오류(MCP 연결 등)는 전파
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    yield {
+        "type": "batch_summary",
+        "reports": len(batch.reports),
+        "pipeline_reports": len(pipeline_items),
+        "agent_reports": len(agent_items),
+        "total_codes": sum(len(r.external_codes) for _, r in pipeline_items),
+        "unique_codes": len(unique_codes),
+    }
+
+
+@app.post("/report/batch")
+async def batch_reports(batch: BatchReportInput):
+    """여러 리포트 생성 (NDJSON 스트리밍 - 리포트가 완료될 때마다 한 줄씩 전송)"""
+    async def lines() -> AsyncIterator[str]:
+        async for event in stream_batch_reports(batch):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+async def _stream_rendered_report(
+    input_data: ReportInput,
+    format: str,
+    detail_offset: int,
+    detail_limit: int | None,
+) -> StreamingResponse:
+    """
+    파이프라인으로 변환/집계 후 리포트를 청크 단위로 전송
+
+    변환 결과는 요청한 페이지(detail_offset/detail_limit)만 보관하므로 detail_limit을 지정하면
+    서버 메모리가 행 수가 아닌 집계 그룹 수 + 페이지 크기에 비례합니다. 다만 집계가 먼저
+    출력되므로 첫 바이트는 모든 변환이 끝난 뒤 전송됩니다.
+    """
+    # CSV는 변환 내역을 포함하지 않으므로 변환 결과를 보관하지 않음
+    keep_limit = 0 if format == "csv" else detail_limit
+    data = await prepare_report(mcp_client, input_data, detail_offset, keep_limit)
+
+    chunks = iter_report(data, format, detail_offset=detail_offset, detail_limit=detail_limit)
+    return StreamingResponse(chunks, media_type=MEDIA_TYPES[format])
+
+
+@app.post("/report/render")
+async def render_report_endpoint(input_data: ReportInput, detail_offset: int = 0, detail_limit: int | None = None):
+    """
+    파이프라인 모드 리포트를 input_data.format 형식(markdown/csv/jsonl/html)으로 스트리밍합니다.
+    detail_offset/detail_limit로 변환 내역을 잘라 페이지 단위로 조회할 수 있습니다.
+    CSV는 표준 코드별 집계만 포함하므로 detail_offset/detail_limit을 사용하지 않습니다.
+    """
+    return await _stream_rendered_report(input_data, input_data.format, detail_offset, detail_limit)
+
+
+@app.post("/report/markdown")
+async def markdown_report(input_data: ReportInput, detail_offset: int = 0, detail_limit: int | None = None):
+    """
+    파이프라인 모드 리포트를 마크다운 스트림으로 전송합니다.
+    리포트 문자열 전체를 만들지 않고 섹션/행 단위로 전송하며,
+    detail_offset/detail_limit로 변환 내역 표를 잘라 페이지 단위로 조회할 수 있습니다.
+    """
+    return await _stream_rendered_report(input_data, "markdown", detail_offset, detail_limit)
+
+
+@app.get("/admin/mcp")
+async def mcp_pool_stats():
+    """MCP 세션 풀 현황 (풀을 사용하지 않으면 pooled=false)"""
+    if not isinstance(mcp_client, MCPSessionPools):
+        return {"pooled": False}
+    return {"pooled": True, "servers": mcp_client.stats()}
+
+
+@app.get("/admin/threads")
+async def list_threads(limit: int = 20, status: str | None = None):
+    """스레드 현황 (크기가 큰 순서) - 방치된 HITL 세션 등 메모리 점유 확인용"""
     return {
-        "status": "completed",
-        "thread_id": input_data.thread_id,
-        "report": final_message
+        "summary": await thread_registry.summary(),
+        "retention_seconds": thread_registry.retention_seconds,
+        "threads": [record.to_dict() for record in await thread_registry.list_threads(limit, status)],
     }
 
 
 # 체인 래퍼 (LangServe 호환 - 단순화)
-async def _process_input(input_data: dict) -> dict:
+# 비동기 제너레이터이므로 /report/stream은 이벤트를 즉시 전달하고,
+# /report/invoke는 마지막 이벤트(result 또는 interrupt)를 반환합니다.
+async def _process_input(input_data: dict) -> AsyncIterator[dict]:
     """입력 처리 래퍼"""
     # LangServe 요청은 새로운 thread_id 생성 또는 전달된 ID 사용
     if "instruction" not in input_data:
@@ -301,14 +629,13 @@ async def _process_input(input_data: dict) -> dict:
         
     report_input = ReportInput(**input_data)
     
-    # process_report_request modified to return dict
-    result = await process_report_request(report_input)
-    return result
+    async for event in stream_report_request(report_input):
+        yield event
 
 # LangServe 라우트 추가
 add_routes(
     app,
-    RunnableLambda(_process_input),
+    RunnableLambda(_process_input).with_types(input_type=ReportInput),
     path="/report",
 )
 
@@ -328,8 +655,15 @@ async def root():
         },
         "endpoints": {
             "/report/invoke": "POST - 리포트 생성",
-            "/report/stream": "POST - 스트리밍 리포트 생성",
+            "/report/stream": "POST - 스트리밍 리포트 생성 (토큰/도구 이벤트 SSE)",
+            "/report/resume": "POST - 중단된 리포트 재개",
+            "/report/resume/stream": "POST - 중단된 리포트 재개 (SSE)",
+            "/report/batch": "POST - 여러 리포트 생성 (NDJSON 스트리밍)",
+            "/report/markdown": "POST - 마크다운 리포트 스트리밍 (변환 내역 페이지네이션)",
+            "/report/render": "POST - markdown/csv/jsonl/html 리포트 스트리밍 (format 필드)",
             "/report/playground": "GET - 인터랙티브 플레이그라운드",
+            "/admin/threads": "GET - 스레드 현황 (크기순)",
+            "/admin/mcp": "GET - MCP 세션 풀 현황",
             "/docs": "GET - API 문서",
         }
     }
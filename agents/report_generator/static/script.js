@@ -21,6 +21,115 @@ function addMessage(content, isUser = false) {
     chatContainer.scrollTop = chatContainer.scrollHeight;
 }
 
+// 스트리밍 중인 에이전트 메시지 (토큰을 이어 붙임)
+function createStreamingMessage() {
+    const div = document.createElement('div');
+    div.className = 'chat-message agent-message';
+    const status = document.createElement('div');
+    status.className = 'text-xs text-gray-500';
+    const body = document.createElement('div');
+    div.appendChild(status);
+    div.appendChild(body);
+    chatContainer.appendChild(div);
+
+    let text = '';
+    const render = () => {
+        body.innerHTML = text
+            .replace(/\n/g, '<br>')
+            .replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>');
+        chatContainer.scrollTop = chatContainer.scrollHeight;
+    };
+
+    return {
+        setStatus(message) {
+            status.textContent = message;
+        },
+        appendToken(token) {
+            text += token;
+            render();
+        },
+        // 도구 호출 이후의 토큰만 표시 (중간 단계 출력은 지움)
+        reset() {
+            text = '';
+            render();
+        },
+        remove() {
+            div.remove();
+        },
+    };
+}
+
+// SSE 스트림 읽기 (LangServe /stream 및 /report/resume/stream 형식)
+async function readEventStream(response, onData) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        const frames = buffer.split(/\r?\n\r?\n/);
+        buffer = frames.pop();
+        for (const frame of frames) {
+            let eventName = 'message';
+            let data = '';
+            for (const line of frame.split(/\r?\n/)) {
+                if (line.startsWith('event:')) eventName = line.slice(6).trim();
+                else if (line.startsWith('data:')) data += line.slice(5).trim();
+            }
+            if (eventName === 'data' && data) {
+                onData(JSON.parse(data));
+            } else if (eventName === 'error') {
+                onData({ type: 'error', error: data });
+            }
+        }
+    }
+}
+
+// 스트리밍 요청 공통 처리: 토큰/도구 이벤트는 즉시 표시, 마지막 이벤트는 handleResponse로 전달
+async function streamRequest(url, body) {
+    const message = createStreamingMessage();
+    message.setStatus('⏳ 요청 전송 중...');
+
+    const response = await fetch(url, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(body)
+    });
+
+    let finalEvent = null;
+    await readEventStream(response, (event) => {
+        switch (event.type) {
+            case 'start':
+                currentThreadId = event.thread_id;
+                message.setStatus('🤖 에이전트 실행 중...');
+                break;
+            case 'token':
+                message.appendToken(event.content);
+                break;
+            case 'tool_start':
+                message.setStatus(`🔧 ${event.name} 실행 중...`);
+                message.reset();
+                break;
+            case 'tool_end':
+                message.setStatus(`✅ ${event.name} 완료`);
+                break;
+            case 'compaction':
+                message.setStatus(`🗜️ 대화 기록 압축 (-${event.tokens_saved} 토큰)`);
+                break;
+            default:
+                finalEvent = event;
+        }
+    });
+
+    message.remove();
+    if (finalEvent) {
+        handleResponse(finalEvent);
+    }
+}
+
 // 승인 카드 추가 함수
 function addApprovalCard(toolName, args, threadId, callback) {
     const clone = approvalTemplate.content.cloneNode(true);
@@ -151,43 +260,24 @@ async function sendMessage(text) {
     }
 
     try {
-        const response = await fetch('/report/invoke', {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ input: payload })
-        });
-
-        const data = await response.json();
-        // LangServe wraps result in 'output'
-        if (data.output) {
-            handleResponse(data.output);
-        } else {
-            handleResponse(data);
-        }
-
+        // LangServe /stream: 토큰과 도구 이벤트를 실시간으로 수신
+        await streamRequest('/report/stream', { input: payload });
     } catch (error) {
         addMessage(`Error: ${error.message}`);
     }
 }
 
 // Resume 요청 함수
-async function resumeReport(decision, editedArgs = null) {
+async function resumeReport(decision, editedArgs = null, toolName = 'get_exchange_rate') {
     if (!currentThreadId) return;
 
     try {
-        const response = await fetch('/report/resume', {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({
-                thread_id: currentThreadId,
-                decision: decision,
-                edited_args: editedArgs
-            })
+        await streamRequest('/report/resume/stream', {
+            thread_id: currentThreadId,
+            decision: decision,
+            edited_args: editedArgs,
+            tool_name: toolName
         });
-
-        const data = await response.json();
-        handleResponse(data);
-
     } catch (error) {
         addMessage(`Error: ${error.message}`);
     }
@@ -219,7 +309,7 @@ function handleResponse(data) {
 
         addMessage('⚠️ 작업을 계속하려면 승인이 필요합니다.');
         addApprovalCard(action.name, action.args, currentThreadId, (decision, args) => {
-            resumeReport(decision, args);
+            resumeReport(decision, args, action.name);
         });
     } else if (data.error) {
         addMessage(`Error: ${data.error}`);
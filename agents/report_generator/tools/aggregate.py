@@ -4,28 +4,86 @@ Report Generator Tools
 데이터 집계 및 마크다운 리포트 생성 도구
 """
 
-from collections import defaultdict
+import re
+import threading
+from pathlib import Path
 from typing import Any
 from langchain.tools import tool
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import ToolException
+
+from agents.report_generator.aggregation import GroupAggregate, aggregate_conversions
+from agents.report_generator.artifacts import get_artifact_store, has_thread_id, thread_id_from_config
+from agents.report_generator.config import get_aggregate_state_dir
+
+# 상태 이름은 파일명으로 사용되므로 안전한 문자만 허용
+_STATE_KEY_PATTERN = re.compile(r"^[A-Za-z0-9_.-]{1,128}$")
+
+# 같은 상태 파일을 동시에 갱신하지 않도록 보호
+_state_lock = threading.Lock()
+
+
+def _state_path(state_key: str) -> Path:
+    if not _STATE_KEY_PATTERN.match(state_key) or state_key.startswith("."):
+        raise ValueError(f"잘못된 state_key입니다: {state_key!r}")
+    return get_aggregate_state_dir() / f"{state_key}.json"
 
 
 @tool
 def aggregate_by_standard_code(
-    conversions: list[dict],
-    quantities: list[int]
-) -> dict[str, int]:
+    conversions: list[dict] | str,
+    quantities: list[int] | str,
+    state_key: str | None = None,
+    retracted_conversions: list[dict] | None = None,
+    retracted_quantities: list[int] | None = None,
+    config: RunnableConfig = None
+) -> dict:
     """
     변환된 표준 코드별로 수량을 집계합니다.
-    
+
     Args:
-        conversions: 코드 변환 결과 목록
-        quantities: 각 항목의 수량 목록
-        
+        conversions: 코드 변환 결과 목록 또는 아티팩트 핸들 (batch_convert_codes가 돌려준 "art_..." 값)
+        quantities: 각 항목의 수량 목록 또는 아티팩트 핸들 (conversions와 개수가 같아야 함)
+        state_key: (선택사항) 누적 집계 상태 이름. 지정하면 저장된 상태에 이번 행만 더하고
+            상태를 저장한 뒤 누적 합계를 반환합니다 (예: 'daily-sales').
+        retracted_conversions: (선택사항) 취소할 행의 코드 변환 결과 목록
+        retracted_quantities: (선택사항) 취소할 행의 수량 목록
+
     Returns:
         표준 코드별 총 수량 딕셔너리
+        (에이전트 스레드에서 표준 코드가 많으면 {"artifact": 핸들, "total_items", "total_quantity", "preview"})
     """
-    aggregated = defaultdict(int)
-    for conv, qty in zip(conversions, quantities):
-        std_code = conv.get("standard_code", "UNKNOWN")
-        aggregated[std_code] += qty
-    return dict(aggregated)
+    store = get_artifact_store()
+    thread_id = thread_id_from_config(config)
+
+    def _result(sums: dict[str, int]) -> dict:
+        # 에이전트 스레드 안에서만 큰 결과를 아티팩트로 보관 (스레드 밖에서는 정리되지 않음)
+        return store.offload(thread_id, "aggregated", sums) if has_thread_id(config) else sums
+
+    try:
+        conversions = store.resolve(thread_id, conversions)
+        quantities = store.resolve(thread_id, quantities)
+        delta = aggregate_conversions(conversions, quantities)
+        retracted = None
+        if retracted_conversions or retracted_quantities:
+            retracted = aggregate_conversions(retracted_conversions or [], retracted_quantities or [])
+
+        if state_key is None:
+            if retracted is not None:
+                delta.retract(retracted)
+            return _result(delta.sums())
+
+        path = _state_path(state_key)
+        with _state_lock:
+            state = GroupAggregate.load(path)
+            state.merge(delta)
+            if retracted is not None:
+                state.retract(retracted)
+            state.save(path)
+        return _result(state.sums())
+    except ValueError as e:
+        raise ToolException(str(e))
+
+
+# 개수 불일치 등의 오류는 에이전트에게 메시지로 돌려주어 다시 시도하게 함
+aggregate_by_standard_code.handle_tool_error = True
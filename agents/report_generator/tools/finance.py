@@ -2,58 +2,211 @@
 Finance Tools
 =============
 Retrieves financial data such as exchange rates using yfinance.
+
+Rates are served from an in-process cache keyed by (base, target):
+- fresh entries (younger than the TTL) are returned directly,
+- stale entries are returned immediately while one background refresh runs,
+- concurrent misses for the same pair share a single upstream fetch.
+The upstream backend is pluggable via `set_rate_provider` (e.g. a local stub in tests).
 """
 
-import yfinance as yf
-from typing import Any
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Protocol
+
 from langchain.tools import tool
 
+from agents.report_generator.config import get_exchange_rate_cache_config
+
+
+class RateProvider(Protocol):
+    """Backend that fetches a single exchange rate."""
+
+    def fetch_rate(self, base_currency: str, target_currency: str) -> float | None:
+        """Return the rate for 1 base_currency in target_currency, or None if unavailable."""
+        ...
+
+
+class YahooFinanceRateProvider:
+    """Fetches rates from Yahoo Finance via yfinance."""
+
+    @staticmethod
+    def symbol(base_currency: str, target_currency: str) -> str:
+        """Yahoo Finance symbol format"""
+        if base_currency == "USD":
+            return f"{target_currency}=X"
+        return f"{base_currency}{target_currency}=X"
+
+    def fetch_rate(self, base_currency: str, target_currency: str) -> float | None:
+        import yfinance as yf  # yfinance/pandas import is slow; load only when a rate is fetched
+
+        ticker = yf.Ticker(self.symbol(base_currency, target_currency))
+        # fast_info is often faster/more reliable for current price than history
+        price = ticker.fast_info.get('last_price')
+
+        if price is None:
+            # Fallback to history
+            hist = ticker.history(period="1d")
+            if not hist.empty:
+                price = hist['Close'].iloc[-1]
+
+        return float(price) if price is not None else None
+
+    def fetch_usd_rates(self, currencies: list[str]) -> dict[str, float]:
+        """Fetch USD→currency rates for many currencies in one bulk download."""
+        import yfinance as yf
+
+        symbols = {self.symbol("USD", currency): currency for currency in currencies}
+        data = yf.download(list(symbols), period="5d", progress=False, group_by="column")
+        if data.empty:
+            return {}
+
+        closes = data["Close"]
+        # A single-symbol download may come back as a Series instead of one column per symbol
+        single = next(iter(symbols)) if len(symbols) == 1 else None
+        rates = {}
+        for symbol, currency in symbols.items():
+            if hasattr(closes, "columns"):
+                if symbol not in closes.columns:
+                    continue  # Symbol missing from the download; skip it, keep the others
+                column = closes[symbol]
+            elif symbol == single:
+                column = closes
+            else:
+                continue
+            column = column.dropna()
+            if column.empty:
+                continue
+            try:
+                rates[currency] = float(column.iloc[-1])
+            except (TypeError, ValueError):
+                continue
+        return rates
+
+
+class ExchangeRateCache:
+    """
+    TTL cache with single-flight fetches and stale-while-revalidate.
+
+    Args:
+        provider: Backend used on cache misses.
+        ttl_seconds: How long a fetched rate is considered fresh.
+        stale_seconds: How long after the TTL a rate may still be served while refreshing.
+    """
+
+    def __init__(self, provider: RateProvider, ttl_seconds: float = 60.0, stale_seconds: float = 600.0):
+        self.provider = provider
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._entries: dict[tuple[str, str], tuple[float, float]] = {}
+        self._inflight: dict[tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self.fetches = 0
+
+    def get(self, base_currency: str, target_currency: str) -> float | None:
+        """
+        Get a rate, fetching it upstream only when needed.
+
+        Raises:
+            Exception: Whatever the provider raised, if no usable cached value exists.
+        """
+        key = (base_currency, target_currency)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                fetched_at, rate = entry
+                age = time.monotonic() - fetched_at
+                if age <= self.ttl_seconds:
+                    return rate
+                if age <= self.ttl_seconds + self.stale_seconds:
+                    # Serve stale, refresh in the background (at most one refresh per pair)
+                    if key not in self._inflight:
+                        future = self._inflight[key] = Future()
+                        threading.Thread(target=self._fetch, args=(key, future), daemon=True).start()
+                    return rate
+
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if owner:
+            self._fetch(key, future)
+        return future.result()
+
+    def _fetch(self, key: tuple[str, str], future: Future) -> None:
+        """Fetch one pair upstream and publish the result to every waiter."""
+        with self._lock:
+            self.fetches += 1
+        try:
+            rate = self.provider.fetch_rate(*key)
+        except Exception as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            return
+
+        with self._lock:
+            if rate is not None:
+                self._entries[key] = (time.monotonic(), rate)
+            self._inflight.pop(key, None)
+        future.set_result(rate)
+
+    def put(self, base_currency: str, target_currency: str, rate: float) -> None:
+        """Store a rate fetched elsewhere (e.g. by a bulk download)."""
+        with self._lock:
+            self._entries[(base_currency, target_currency)] = (time.monotonic(), rate)
+
+    def clear(self) -> None:
+        """Drop all cached rates."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared cache used by the tools
+rate_cache = ExchangeRateCache(YahooFinanceRateProvider(), **get_exchange_rate_cache_config())
+
+
+def set_rate_provider(provider: RateProvider) -> None:
+    """Swap the upstream backend (e.g. a local stub in tests) and drop cached rates."""
+    rate_cache.provider = provider
+    rate_cache.clear()
+
 
 @tool
 def get_exchange_rate(target_currency: str, base_currency: str = "USD") -> dict[str, Any]:
     """
     Get the current exchange rate between two currencies.
-    
+
     Args:
         target_currency: The currency to convert TO (e.g., 'KRW', 'EUR').
         base_currency: The currency to convert FROM (default: 'USD').
-        
+
     Returns:
         A dictionary containing the exchange rate and metadata.
     """
-    # Yahoo Finance symbol format
-    if base_currency.upper() == "USD":
-        symbol = f"{target_currency.upper()}=X"
-    else:
-        symbol = f"{base_currency.upper()}{target_currency.upper()}=X"
+    base_currency = base_currency.upper()
+    target_currency = target_currency.upper()
 
     try:
-        ticker = yf.Ticker(symbol)
-        # fast_info is often faster/more reliable for current price than history
-        price = ticker.fast_info.get('last_price')
-        
-        if price is None:
-             # Fallback to history
-            hist = ticker.history(period="1d")
-            if not hist.empty:
-                price = hist['Close'].iloc[-1]
-        
+        price = rate_cache.get(base_currency, target_currency)
+
         if price is None:
             return {
-                "error": f"Could not fetch rate for {symbol}",
+                "error": f"Could not fetch rate for {YahooFinanceRateProvider.symbol(base_currency, target_currency)}",
                 "success": False
             }
-            
+
         return {
-            "base_currency": base_currency.upper(),
-            "target_currency": target_currency.upper(),
+            "base_currency": base_currency,
+            "target_currency": target_currency,
             "rate": price,
             "success": True
         }
-        
+
     except Exception as e:
         return {
             "error": str(e),
             "success": False
         }
-
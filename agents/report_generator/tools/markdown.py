@@ -2,73 +2,154 @@
 Markdown Report Generator
 ==========================
 집계 데이터를 마크다운 리포트로 생성하는 도구
+
+iter_markdown_report는 리포트를 섹션/행 단위의 청크로 생성하는 제너레이터로,
+변환 내역이 수십만 건이어도 전체 문자열을 메모리에 만들지 않고 바로 전송할 수 있습니다
+(FastAPI StreamingResponse 등). generate_markdown_report는 같은 청크를 이어 붙인 결과입니다.
 """
 
-from typing import Any
+from itertools import islice
+from typing import Any, Iterable, Iterator
 from langchain.tools import tool
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import ToolException
 
+from agents.report_generator.artifacts import (
+    get_artifact_store,
+    has_thread_id,
+    is_artifact_handle,
+    thread_id_from_config
+)
 
-@tool
-def generate_markdown_report(
+# 한 청크에 담을 기본 줄 수
+DEFAULT_CHUNK_LINES = 1000
+
+
+def _iter_lines(
     aggregated_data: dict[str, int],
-    conversion_details: list[dict],
-    currency_info: dict | None = None
-) -> str:
-    """
-    집계 데이터를 마크다운 리포트로 생성합니다.
-    
-    Args:
-        aggregated_data: 표준 코드별 집계 데이터
-        conversion_details: 변환 상세 내역
-        currency_info: (선택사항) 환율 정보 {'base_currency': 'USD', 'target_currency': 'KRW', 'rate': 1400}
-        
-    Returns:
-        마크다운 형식의 리포트
-    """
-    lines = [
-        "# 📊 표준 코드 집계 리포트",
-        "",
-    ]
-    
+    conversion_details: Iterable[dict],
+    currency_info: dict | None,
+    detail_offset: int,
+    detail_limit: int | None,
+) -> Iterator[str]:
+    """리포트를 한 줄씩 생성"""
+    yield "# 📊 표준 코드 집계 리포트"
+    yield ""
+
     # 환율 정보가 있으면 상단에 표시
     if currency_info and currency_info.get("success", True):
         base = currency_info.get("base_currency", "USD")
         target = currency_info.get("target_currency", "KRW")
         rate = currency_info.get("rate", 0)
-        lines.extend([
-            "## 💱 환율 정보",
-            f"- 기준: 1 {base} = {rate:,.2f} {target}",
-            "",
-        ])
-
-    lines.extend([
-        "## 집계 결과",
-        "",
-        "| 표준 코드 | 총 수량 |",
-        "|-----------|---------| ",
-    ])
-    
+        yield "## 💱 환율 정보"
+        yield f"- 기준: 1 {base} = {rate:,.2f} {target}"
+        yield ""
+
+    yield "## 집계 결과"
+    yield ""
+    yield "| 표준 코드 | 총 수량 |"
+    yield "|-----------|---------| "
+
     total_qty = 0
     for code, qty in sorted(aggregated_data.items()):
-        lines.append(f"| {code} | {qty} |")
+        yield f"| {code} | {qty} |"
         total_qty += qty
-    
-    lines.extend([
-        "",
-        f"**총 항목 수**: {len(aggregated_data)}개",
-        f"**총 수량**: {total_qty}",
-        "",
-        "## 변환 내역",
-        "",
-        "| 외부 코드 | 표준 코드 | 카테고리 |",
-        "|-----------|-----------|----------|",
-    ])
-    
-    for detail in conversion_details:
-        lines.append(
+
+    yield ""
+    yield f"**총 항목 수**: {len(aggregated_data)}개"
+    yield f"**총 수량**: {total_qty}"
+    yield ""
+    yield "## 변환 내역"
+    yield ""
+    yield "| 외부 코드 | 표준 코드 | 카테고리 |"
+    yield "|-----------|-----------|----------|"
+
+    details = iter(conversion_details)
+    skipped = sum(1 for _ in islice(details, detail_offset))
+    stop = None if detail_limit is None else max(0, detail_limit)
+    shown = 0
+    for detail in islice(details, stop):
+        shown += 1
+        yield (
             f"| {detail.get('external_code', 'N/A')} | "
             f"{detail.get('standard_code', 'N/A')} | "
             f"{detail.get('category', 'N/A')} |"
         )
-    
-    return "\n".join(lines)
+
+    # 페이지/잘림 정보 (남은 행은 세기만 하고 보관하지 않음)
+    if detail_offset or detail_limit is not None:
+        remaining = sum(1 for _ in details)
+        total = skipped + shown + remaining
+        yield ""
+        if shown:
+            yield f"_변환 내역 {total}건 중 {skipped + 1}–{skipped + shown}번째 표시_"
+        else:
+            yield f"_변환 내역 {total}건 중 표시할 행이 없습니다_"
+        if remaining:
+            yield f"_이후 {remaining}건 생략 (detail_offset={skipped + shown}으로 다음 페이지 조회)_"
+
+
+def iter_markdown_report(
+    aggregated_data: dict[str, int],
+    conversion_details: Iterable[dict],
+    currency_info: dict | None = None,
+    detail_offset: int = 0,
+    detail_limit: int | None = None,
+    chunk_lines: int = DEFAULT_CHUNK_LINES,
+) -> Iterator[str]:
+    """
+    마크다운 리포트를 청크 단위로 생성합니다. 모든 청크를 이어 붙이면 전체 리포트가 됩니다.
+
+    Args:
+        aggregated_data: 표준 코드별 집계 데이터
+        conversion_details: 변환 상세 내역 (목록 또는 이터레이터)
+        currency_info: (선택사항) 환율 정보
+        detail_offset: 변환 내역 표에서 건너뛸 행 수 (페이지네이션)
+        detail_limit: 변환 내역 표에 표시할 최대 행 수 (None이면 전체)
+        chunk_lines: 청크당 줄 수
+    """
+    chunk_lines = max(1, chunk_lines)
+    lines = _iter_lines(aggregated_data, conversion_details, currency_info, max(0, detail_offset), detail_limit)
+    separator = ""
+    while batch := list(islice(lines, chunk_lines)):
+        yield separator + "\n".join(batch)
+        separator = "\n"
+
+
+@tool
+def generate_markdown_report(
+    aggregated_data: dict[str, int] | str,
+    conversion_details: list[dict] | str,
+    currency_info: dict | None = None,
+    config: RunnableConfig = None
+) -> str | dict:
+    """
+    집계 데이터를 마크다운 리포트로 생성합니다.
+
+    Args:
+        aggregated_data: 표준 코드별 집계 데이터 또는 아티팩트 핸들 ("art_...")
+        conversion_details: 변환 상세 내역 또는 아티팩트 핸들 ("art_...")
+        currency_info: (선택사항) 환율 정보 {'base_currency': 'USD', 'target_currency': 'KRW', 'rate': 1400}
+
+    Returns:
+        마크다운 형식의 리포트
+        (에이전트 스레드에서 입력이 아티팩트이거나 리포트가 길면 {"artifact": 핸들, "lines", "chars", "preview"} -
+        전체 리포트는 서버가 응답에 포함하므로 다시 옮겨 적을 필요가 없습니다)
+    """
+    store = get_artifact_store()
+    thread_id = thread_id_from_config(config)
+    try:
+        aggregated = store.resolve(thread_id, aggregated_data)
+        details = store.resolve(thread_id, conversion_details)
+    except ValueError as e:
+        raise ToolException(str(e))
+
+    report = "".join(iter_markdown_report(aggregated, details, currency_info))
+    if not has_thread_id(config):
+        return report
+    force = is_artifact_handle(aggregated_data) or is_artifact_handle(conversion_details)
+    return store.offload(thread_id, "report", report, force=force)
+
+
+# 잘못된 핸들 등의 오류는 에이전트에게 메시지로 돌려주어 다시 시도하게 함
+generate_markdown_report.handle_tool_error = True
@@ -0,0 +1,89 @@
+"""
+Bulk Exchange Rates
+===================
+Fetches many currency pairs at once and derives cross rates locally.
+
+Every pair (base, target) is expressed through USD legs:
+    rate(base → target) = rate(USD → target) / rate(USD → base)
+so a report that needs N currencies downloads at most N USD legs in one
+bulk request instead of one lookup per pair, and all of its rates come
+from the same snapshot.
+"""
+
+from typing import Any
+
+from langchain.tools import tool
+
+from agents.report_generator.tools.finance import rate_cache
+
+USD = "USD"
+
+
+def _fetch_usd_legs(currencies: set[str]) -> dict[str, float]:
+    """Fetch USD→currency legs with the configured provider (bulk when supported)."""
+    provider = rate_cache.provider
+    if not currencies:
+        return {}
+
+    fetch_many = getattr(provider, "fetch_usd_rates", None)
+    if fetch_many is not None:
+        legs = fetch_many(sorted(currencies))
+    else:
+        legs = {}
+        for currency in sorted(currencies):
+            rate = provider.fetch_rate(USD, currency)
+            if rate is not None:
+                legs[currency] = rate
+
+    # Share the fetched legs with get_exchange_rate
+    for currency, rate in legs.items():
+        rate_cache.put(USD, currency, rate)
+    return legs
+
+
+@tool
+def get_exchange_rates(pairs: list[list[str]]) -> list[dict[str, Any]]:
+    """
+    Get exchange rates for many currency pairs at once, all from one consistent snapshot.
+    Use this instead of calling get_exchange_rate repeatedly when a report needs several currencies.
+
+    Args:
+        pairs: List of [base_currency, target_currency] pairs, e.g. [["EUR", "KRW"], ["USD", "JPY"]].
+
+    Returns:
+        One result per pair, in input order, shaped like `get_exchange_rate` results
+        (failures also list the unavailable USD legs in `missing_legs`).
+    """
+    if any(len(pair) != 2 for pair in pairs):
+        return [{"error": "Each pair must be [base_currency, target_currency]", "success": False} for _ in pairs]
+    normalized = [(base.upper(), target.upper()) for base, target in pairs]
+    currencies = {currency for pair in normalized for currency in pair if currency != USD}
+
+    try:
+        legs = _fetch_usd_legs(currencies)
+    except Exception as e:
+        return [{"error": str(e), "success": False} for _ in normalized]
+    legs[USD] = 1.0
+
+    results = []
+    for base, target in normalized:
+        base_leg, target_leg = legs.get(base), legs.get(target)
+        if not base_leg or target_leg is None:
+            # The requested pair is reported as asked; the unavailable USD legs are listed separately
+            missing = [f"{USD}→{base}"] if not base_leg else []
+            if target_leg is None:
+                missing.append(f"{USD}→{target}")
+            results.append({
+                "error": f"Could not fetch rate for {base}→{target}",
+                "missing_legs": missing,
+                "success": False
+            })
+            continue
+
+        results.append({
+            "base_currency": base,
+            "target_currency": target,
+            "rate": target_leg / base_leg,
+            "success": True
+        })
+    return results
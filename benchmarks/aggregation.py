@@ -0,0 +1,82 @@
+"""
+Aggregation Engine Benchmark
+============================
+기존 aggregate_by_standard_code 방식(zip + defaultdict)과 집계 엔진을 비교합니다.
+
+- legacy:   레코드 목록 → defaultdict 합계 (기존 구현)
+- strings:  문자열 열 → factorize → 벡터화 집계
+- encoded:  이미 인코딩된 열(EncodedColumn) + 수량 배열 → 벡터화 집계 (열 단위 입력)
+
+Usage:
+    python -m benchmarks.aggregation
+    python -m benchmarks.aggregation --rows 1000000 10000000 --codes 1000
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from agents.report_generator.aggregation import EncodedColumn, aggregate_columns, np
+
+
+def legacy_aggregate(standard_codes: list[str], quantities: list[int]) -> dict[str, int]:
+    """기존 aggregate_by_standard_code의 집계 방식"""
+    aggregated = defaultdict(int)
+    for code, qty in zip(standard_codes, quantities):
+        aggregated[code] += qty
+    return dict(aggregated)
+
+
+def _best_ms(fn, repeat: int) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3, result
+
+
+def run(row_counts: list[int], code_count: int, repeat: int, seed: int) -> None:
+    rng = random.Random(seed)
+    labels = [f"STD-{i:03d}-{rng.choice('ABCVP')}" for i in range(code_count)]
+    print(f"NumPy: {'ON (' + np.__version__ + ')' if np is not None else 'OFF'}")
+    print(f"{'rows':>10} | {'legacy(ms)':>10} | {'strings(ms)':>11} | {'encoded(ms)':>11} | {'speedup':>8}")
+    print("-" * 63)
+    for rows in row_counts:
+        ids = [rng.randrange(code_count) for _ in range(rows)]
+        quantities = [rng.randint(1, 100) for _ in range(rows)]
+        standard_codes = [labels[i] for i in ids]
+        encoded = EncodedColumn(np.asarray(ids) if np is not None else ids, labels)
+        quantity_column = np.asarray(quantities) if np is not None else quantities
+
+        legacy_ms, expected = _best_ms(lambda: legacy_aggregate(standard_codes, quantities), repeat)
+        strings_ms, by_strings = _best_ms(lambda: aggregate_columns(standard_codes, quantities).sums(), repeat)
+        encoded_ms, by_encoded = _best_ms(lambda: aggregate_columns(encoded, quantity_column).sums(), repeat)
+
+        # 결과(값과 키 순서)가 기존 구현과 같은지 확인
+        for name, actual in (("strings", by_strings), ("encoded", by_encoded)):
+            if list(actual.items()) != list(expected.items()):
+                raise AssertionError(f"{name} 결과 불일치 ({rows} rows)")
+
+        print(
+            f"{rows:>10} | {legacy_ms:>10.1f} | {strings_ms:>11.1f} | "
+            f"{encoded_ms:>11.1f} | {legacy_ms / encoded_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aggregation engine benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--codes", type=int, default=1000, help="Number of distinct standard codes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    run(args.rows, args.codes, args.repeat, args.seed)
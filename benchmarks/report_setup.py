@@ -0,0 +1,78 @@
+"""
+Report Request Setup Benchmark
+==============================
+리포트 요청당 에이전트 준비 시간(p50/p99)을 비교합니다.
+
+- before: 요청마다 mcp_client.get_tools() + create_deep_agent(...)
+- after:  ReportAgentRegistry.get(...) (서버 시작 시 한 번 컴파일)
+
+LLM 호출은 하지 않지만, MCP 서버 설정(stdio/SSE)은 실제와 동일하게 사용합니다.
+
+Usage:
+    python -m benchmarks.report_setup --iterations 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from langchain_mcp_adapters.client import MultiServerMCPClient
+
+from agents.report_generator import server
+from agents.report_generator.agent_registry import ReportAgentRegistry
+from agents.report_generator.config import get_mcp_server_config
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    """(p50, p99) in ms"""
+    ordered = sorted(samples)
+    p99_index = min(len(ordered) - 1, round(0.99 * (len(ordered) - 1)))
+    return statistics.median(ordered) * 1e3, ordered[p99_index] * 1e3
+
+
+async def run(iterations: int) -> None:
+    mcp_client = MultiServerMCPClient(get_mcp_server_config())
+
+    before: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        mcp_tools = await mcp_client.get_tools()
+        server.build_report_agent(mcp_tools, server.DEFAULT_INTERRUPT_ON)
+        before.append(time.perf_counter() - start)
+
+    registry = ReportAgentRegistry(
+        load_tools=mcp_client.get_tools,
+        build_agent=server.build_report_agent,
+        refresh_interval=0,
+    )
+    start = time.perf_counter()
+    await registry.start(server.DEFAULT_INTERRUPT_ON)
+    startup = time.perf_counter() - start
+
+    after: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await registry.get(server.DEFAULT_INTERRUPT_ON)
+        after.append(time.perf_counter() - start)
+
+    print(f"{'mode':>8} | {'p50(ms)':>10} | {'p99(ms)':>10}")
+    print("-" * 36)
+    for name, samples in (("before", before), ("after", after)):
+        p50, p99 = _percentiles(samples)
+        print(f"{name:>8} | {p50:>10.3f} | {p99:>10.3f}")
+    print(f"\none-time registry startup: {startup * 1e3:.1f} ms ({registry.builds} build)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report request setup benchmark")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.iterations))
@@ -0,0 +1,109 @@
+"""
+Rule Matcher Micro-benchmark
+============================
+컴파일된 RuleMatcher와 기존 선형 탐색(startswith + re.search)을 비교합니다.
+
+Usage:
+    python -m benchmarks.rule_matcher
+    python -m benchmarks.rule_matcher --sizes 5 500 50000 --codes 2000
+"""
+
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from agents.code_converter.tools.lookup_code import CODE_MAPPING_RULES
+from agents.code_converter.tools.matcher import RuleMatcher
+
+
+def linear_scan(rules: dict[str, dict[str, str]], external_code: str) -> tuple[dict | None, str]:
+    """기존 _convert_single_code의 규칙 탐색 방식 (O(rules) per code)"""
+    for pattern, rule in rules.items():
+        if external_code.startswith(pattern):
+            match = re.search(r'(\d+)', external_code)
+            return rule, match.group(1) if match else "000"
+    match = re.search(r'(\d+)', external_code)
+    return None, match.group(1) if match else "000"
+
+
+def make_rules(size: int, rng: random.Random) -> dict[str, dict[str, str]]:
+    """
+    기본 규칙에 합성 벤더/파트너 prefix를 더해 size개의 규칙 테이블 생성
+    (합성 prefix는 길이가 같아 서로의 prefix가 되지 않으므로 두 방식의 결과가 같아야 함)
+    """
+    rules = dict(CODE_MAPPING_RULES)
+    while len(rules) < size:
+        # 기본 prefix(EXT-PROD 등)로 시작하지 않는 head만 사용
+        head = rng.choice(["VND", "PTN", "SUP"])
+        tail = "".join(rng.choices(string.ascii_uppercase, k=6))
+        rules[f"{head}-{tail}"] = {"prefix": "STD", "category": rng.choice("ABCVP")}
+    return dict(list(rules.items())[:size])
+
+
+def make_codes(rules: dict[str, dict[str, str]], count: int, rng: random.Random) -> list[str]:
+    """규칙에 일치하는 코드 90% + 알 수 없는 코드 10%"""
+    patterns = list(rules)
+    codes = []
+    for _ in range(count):
+        if rng.random() < 0.9:
+            codes.append(f"{rng.choice(patterns)}-{rng.randint(1, 999):03d}")
+        else:
+            codes.append(f"UNKNOWN-{rng.randint(1, 999)}")
+    return codes
+
+
+def _time_per_code(fn, codes: list[str], repeat: int) -> float:
+    """코드 1개당 최소 소요 시간(µs)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for code in codes:
+            fn(code)
+        best = min(best, time.perf_counter() - start)
+    return best / len(codes) * 1e6
+
+
+def run(sizes: list[int], code_count: int, repeat: int, seed: int) -> None:
+    rng = random.Random(seed)
+    print(f"{'rules':>8} | {'compile(ms)':>11} | {'linear(µs)':>10} | {'matcher(µs)':>11} | {'speedup':>8}")
+    print("-" * 62)
+    for size in sizes:
+        rules = make_rules(size, rng)
+        codes = make_codes(rules, code_count, rng)
+
+        start = time.perf_counter()
+        matcher = RuleMatcher(rules)
+        compile_ms = (time.perf_counter() - start) * 1e3
+
+        # 두 방식의 결과가 동일한지 먼저 확인
+        for code in codes[:200]:
+            expected = linear_scan(rules, code)
+            actual = matcher.match(code)
+            if actual != expected:
+                raise AssertionError(f"결과 불일치: {code} → {actual} != {expected}")
+
+        linear_us = _time_per_code(lambda c: linear_scan(rules, c), codes, repeat)
+        matcher_us = _time_per_code(matcher.match, codes, repeat)
+        print(
+            f"{size:>8} | {compile_ms:>11.2f} | {linear_us:>10.2f} | "
+            f"{matcher_us:>11.2f} | {linear_us / matcher_us:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rule matcher micro-benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 500, 50_000])
+    parser.add_argument("--codes", type=int, default=2000, help="Number of codes per run")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    run(args.sizes, args.codes, args.repeat, args.seed)
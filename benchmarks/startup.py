@@ -0,0 +1,100 @@
+"""
+Startup Profile
+===============
+두 에이전트 서버의 import 시간과 코드 변환 서버의 첫 응답 시간을 측정합니다.
+
+- import: 새 프로세스에서 `python -X importtime -c "import <module>"`를 실행하여
+          모듈 전체 import 시간과 가장 오래 걸린 직접 import를 보여줍니다.
+- first response: 코드 변환 MCP 서버를 stdio로 띄운 시점부터
+          initialize 완료와 첫 convert_code(규칙 기반) 응답까지의 시간
+
+Usage:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --repeat 5 --top 15
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+SERVER_MODULES = ("agents.code_converter.server", "agents.report_generator.server")
+
+
+def _parse_importtime(stderr: str) -> list[tuple[int, int, str]]:
+    """-X importtime 출력 → [(cumulative_us, depth, module), ...]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        rows.append((int(cumulative), depth, name.strip()))
+    return rows
+
+
+def profile_import(module: str, top: int) -> None:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root, capture_output=True, text=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1e3
+    rows = _parse_importtime(proc.stderr)
+    if proc.returncode != 0 or not rows:
+        print(f"❌ {module} import 실패\n{proc.stderr[-2000:]}")
+        return
+
+    total_us = next(cumulative for cumulative, _, name in rows if name == module)
+    # 서버 모듈이 직접 import한 모듈 (depth 1)
+    direct = sorted((r for r in rows if r[1] == 1), reverse=True)[:top]
+    print(f"\n📦 {module}: import {total_us / 1e3:.0f}ms (프로세스 전체 {wall_ms:.0f}ms)")
+    for cumulative, _, name in direct:
+        print(f"   {cumulative / 1e3:>8.1f}ms  {name}")
+
+
+async def _first_response() -> tuple[float, float]:
+    """(initialize 완료, 첫 convert_code 응답) - 프로세스 시작 기준 ms"""
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "agents.code_converter.server"],
+        cwd=str(project_root),
+    )
+    start = time.perf_counter()
+    async with stdio_client(params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            initialized = time.perf_counter()
+            result = await session.call_tool("convert_code", {"external_code": "EXT-PROD-001"})
+            responded = time.perf_counter()
+    if result.isError:
+        raise RuntimeError(result.content)
+    return (initialized - start) * 1e3, (responded - start) * 1e3
+
+
+def profile_first_response(repeat: int) -> None:
+    samples = [asyncio.run(_first_response()) for _ in range(repeat)]
+    print(f"\n⏱️ code_converter 첫 응답 (stdio, {repeat}회 중앙값)")
+    print(f"   initialize:         {statistics.median(s[0] for s in samples):>8.1f}ms")
+    print(f"   첫 convert_code:    {statistics.median(s[1] for s in samples):>8.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Server startup profile")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of converter cold starts to measure")
+    parser.add_argument("--top", type=int, default=10, help="Number of heaviest direct imports to show")
+    args = parser.parse_args()
+
+    for module in SERVER_MODULES:
+        profile_import(module, args.top)
+    profile_first_response(args.repeat)
@@ -0,0 +1,34 @@
+"""
+공통 테스트 설정
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    """
+    빠른 시작 모드의 리포트 서버 TestClient (메모리 체크포인터, 임시 아티팩트 디렉토리)
+
+    실제 code_converter MCP 서버를 stdio로 띄웁니다.
+    """
+    from fastapi.testclient import TestClient
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("REPORT_FAST_STARTUP", "1")
+        mp.setenv("REPORT_CHECKPOINTER", "memory")
+        mp.setenv("REPORT_ARTIFACT_DIR", str(tmp_path_factory.mktemp("artifacts")))
+        from agents.report_generator import artifacts, server
+
+        mp.setattr(artifacts, "_store", None)
+        with TestClient(server.app) as test_client:
+            yield test_client
+        # 스레드 밖의 파이프라인 호출은 아티팩트를 남기지 않아야 함
+        assert not any(artifacts.get_artifact_store()._root_dir.iterdir())
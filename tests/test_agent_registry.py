@@ -0,0 +1,131 @@
+"""
+ReportAgentRegistry 테스트 (컴파일된 에이전트 재사용, 도구 목록 변경 시 재생성)
+"""
+
+import asyncio
+
+import pytest
+from langchain_core.tools import StructuredTool
+
+from agents.report_generator import agent_registry
+from agents.report_generator.agent_registry import ReportAgentRegistry
+
+
+def _make_tool(name: str, description: str = "도구") -> StructuredTool:
+    return StructuredTool.from_function(lambda code: code, name=name, description=description)
+
+
+class FakeMCP:
+    """load_tools 호출 수를 세고 돌려줄 도구 목록을 바꿀 수 있는 MCP 클라이언트"""
+
+    def __init__(self):
+        self.tools = [_make_tool("batch_convert_codes")]
+        self.loads = 0
+
+    async def load_tools(self):
+        self.loads += 1
+        return list(self.tools)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """registry가 사용하는 time.monotonic을 수동으로 진행하는 시계"""
+    now = [1000.0]
+    monkeypatch.setattr(agent_registry.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def mcp():
+    return FakeMCP()
+
+
+def _registry(mcp: FakeMCP, refresh_interval: float = 300.0) -> ReportAgentRegistry:
+    return ReportAgentRegistry(
+        mcp.load_tools,
+        lambda tools, interrupt_on: {"tools": [t.name for t in tools], "interrupt_on": interrupt_on},
+        refresh_interval=refresh_interval,
+    )
+
+
+def test_start_precompiles_variants(mcp, clock):
+    registry = _registry(mcp)
+
+    async def scenario():
+        await registry.start({"get_exchange_rate": True}, {})
+        first = await registry.get({"get_exchange_rate": True})
+        second = await registry.get({"get_exchange_rate": True})
+        return first, second, await registry.get({})
+
+    first, second, without_interrupts = asyncio.run(scenario())
+
+    assert first is second
+    assert first["interrupt_on"] == {"get_exchange_rate": True}
+    assert without_interrupts["interrupt_on"] == {}
+    assert registry.builds == 2
+    assert mcp.loads == 1
+
+
+def test_concurrent_gets_build_once(mcp, clock):
+    registry = _registry(mcp)
+
+    async def scenario():
+        return await asyncio.gather(*(registry.get({"x": True}) for _ in range(10)))
+
+    agents = asyncio.run(scenario())
+
+    assert all(agent is agents[0] for agent in agents)
+    assert registry.builds == 1
+    assert mcp.loads == 1
+
+
+def test_unchanged_tools_keep_agents(mcp, clock):
+    registry = _registry(mcp, refresh_interval=60)
+
+    async def scenario():
+        first = await registry.get({})
+        clock[0] += 61
+        return first, await registry.get({})
+
+    first, second = asyncio.run(scenario())
+
+    assert mcp.loads == 2
+    assert first is second
+    assert registry.builds == 1
+
+
+def test_changed_tools_rebuild_agents(mcp, clock):
+    registry = _registry(mcp, refresh_interval=60)
+
+    async def scenario():
+        first = await registry.get({})
+        mcp.tools.append(_make_tool("get_supported_patterns"))
+        # 주기 전에는 다시 확인하지 않음
+        clock[0] += 30
+        cached = await registry.get({})
+        clock[0] += 31
+        return first, cached, await registry.get({})
+
+    first, cached, rebuilt = asyncio.run(scenario())
+
+    assert cached is first
+    assert rebuilt is not first
+    assert rebuilt["tools"] == ["batch_convert_codes", "get_supported_patterns"]
+    assert registry.builds == 2
+
+
+def test_refresh_reports_changes(mcp, clock):
+    registry = _registry(mcp, refresh_interval=0)
+
+    async def scenario():
+        await registry.get({})
+        unchanged = await registry.refresh()
+        mcp.tools = [_make_tool("batch_convert_codes", description="설명 변경")]
+        changed = await registry.refresh()
+        return unchanged, changed
+
+    assert asyncio.run(scenario()) == (False, True)
+    # refresh_interval이 0이면 get은 도구 목록을 다시 확인하지 않음
+    clock[0] += 10_000
+    asyncio.run(registry.get({}))
+    assert mcp.loads == 3
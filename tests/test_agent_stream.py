@@ -0,0 +1,112 @@
+"""
+stream_agent_run 테스트 (토큰/도구 이벤트 전달, 인터럽트, 실패 시 스레드 상태)
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langgraph.checkpoint.memory import MemorySaver
+
+from agents.report_generator import server
+from agents.report_generator.compaction import COMPACTION_EVENT
+from agents.report_generator.persistence import ThreadRegistry
+
+
+class FakeAgent:
+    """정해진 astream_events 이벤트를 차례로 내보내는 에이전트"""
+
+    def __init__(self, events: list[dict], values: dict, interrupts: tuple = (), error: Exception | None = None):
+        self.events = events
+        self.state = SimpleNamespace(values=values, interrupts=interrupts)
+        self.error = error
+        # 첫 이벤트를 내보내기 전에 대기 (start 이벤트가 먼저 전달되는지 확인용)
+        self.gate = asyncio.Event()
+
+    async def astream_events(self, agent_input, config, version):
+        await self.gate.wait()
+        for event in self.events:
+            yield event
+        if self.error is not None:
+            raise self.error
+
+    async def aget_state(self, config):
+        return self.state
+
+
+def _token(text: str) -> dict:
+    return {"event": "on_chat_model_stream", "name": "model", "data": {"chunk": AIMessageChunk(content=text)}}
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = ThreadRegistry(MemorySaver(), evict_completed=False)
+    monkeypatch.setattr(server, "thread_registry", registry)
+    return registry
+
+
+async def _collect(agent: FakeAgent, thread_id: str = "thread-1") -> tuple[dict, list[dict]]:
+    """첫 이벤트는 에이전트가 아무것도 내보내기 전에 받고, 나머지는 끝까지 수집"""
+    stream = server.stream_agent_run(agent, {"messages": []}, thread_id)
+    first = await stream.__anext__()
+    agent.gate.set()
+    return first, [event async for event in stream]
+
+
+def test_forwards_tokens_and_tool_events(registry):
+    agent = FakeAgent(
+        [
+            _token("변환을 "),
+            _token(""),
+            {"event": "on_tool_start", "name": "batch_convert_codes", "data": {"input": {"external_codes": ["A"]}}},
+            {"event": "on_tool_end", "name": "batch_convert_codes", "data": {"output": "x" * 5000}},
+            {"event": "on_custom_event", "name": COMPACTION_EVENT, "data": {"messages": 3, "tokens_saved": 100}},
+            {"event": "on_custom_event", "name": "other", "data": {}},
+            {"event": "on_chain_start", "name": "agent", "data": {}},
+            _token("완료"),
+        ],
+        values={"messages": [AIMessage(content="# 리포트")]},
+    )
+
+    first, events = asyncio.run(_collect(agent))
+
+    assert first == {"type": "start", "thread_id": "thread-1"}
+    assert [e["type"] for e in events] == ["token", "tool_start", "tool_end", "compaction", "token", "result"]
+    assert events[0]["content"] == "변환을 "
+    assert events[1] == {"type": "tool_start", "name": "batch_convert_codes", "input": {"external_codes": ["A"]}}
+    assert len(events[2]["output"]) == server.TOOL_OUTPUT_PREVIEW_CHARS + 1
+    assert events[3] == {"type": "compaction", "messages": 3, "tokens_saved": 100}
+    assert events[-1] == {"type": "result", "status": "completed", "thread_id": "thread-1", "report": "# 리포트"}
+    [record] = asyncio.run(registry.list_threads())
+    assert record.status == "completed"
+
+
+def test_interrupt_is_last_event(registry):
+    agent = FakeAgent(
+        [{"event": "on_tool_start", "name": "get_exchange_rate", "data": {"input": {"target_currency": "KRW"}}}],
+        values={"messages": [AIMessage(content="환율 조회 승인 필요")]},
+        interrupts=(SimpleNamespace(value={"action_requests": [{"name": "get_exchange_rate"}]}),),
+    )
+
+    _, events = asyncio.run(_collect(agent))
+
+    assert events[-1] == {
+        "type": "interrupt",
+        "status": "interrupted",
+        "thread_id": "thread-1",
+        "interrupts": {"action_requests": [{"name": "get_exchange_rate"}]},
+        "messages": ["환율 조회 승인 필요"],
+    }
+    [record] = asyncio.run(registry.list_threads())
+    assert record.status == "interrupted"
+
+
+def test_agent_error_marks_thread_failed(registry):
+    agent = FakeAgent([_token("변환")], values={}, error=RuntimeError("model down"))
+
+    with pytest.raises(RuntimeError, match="model down"):
+        asyncio.run(_collect(agent))
+
+    [record] = asyncio.run(registry.list_threads())
+    assert record.status == "failed"
@@ -0,0 +1,161 @@
+"""
+집계 엔진 테스트 (NumPy/순수 Python 경로 결과 일치, 입력 형태별 경로 선택, 병합/취소/저장)
+"""
+
+import random
+from collections import defaultdict
+
+import pytest
+
+from agents.report_generator import aggregation
+from agents.report_generator.aggregation import GroupAggregate, aggregate_columns, aggregate_conversions, factorize
+
+
+def _conversions(*codes: str) -> list[dict]:
+    return [{"standard_code": code, "category": code[-1]} for code in codes]
+
+
+@pytest.fixture
+def rows():
+    rng = random.Random(17)
+    codes = [f"STD-{rng.randrange(50):03d}-{rng.choice('ABC')}" for _ in range(2000)]
+    quantities = [rng.randrange(-5, 100) for _ in codes]
+    return codes, quantities
+
+
+def test_matches_legacy_sum(rows):
+    codes, quantities = rows
+    conversions = _conversions(*codes) + [{"external_code": "X"}]
+    legacy: defaultdict[str, int] = defaultdict(int)
+    for conv, quantity in zip(conversions, quantities + [3]):
+        legacy[conv.get("standard_code", "UNKNOWN")] += quantity
+
+    aggregate = aggregate_conversions(conversions, quantities + [3])
+
+    assert aggregate.sums() == dict(legacy)
+    assert list(aggregate.sums()) == list(legacy)
+    assert aggregate.rows == len(conversions)
+
+
+@pytest.mark.parametrize("by", [("standard_code",), ("category",), ("standard_code", "category")])
+def test_numpy_and_python_paths_agree(rows, by, monkeypatch):
+    np = pytest.importorskip("numpy")
+    codes, quantities = rows
+    categories = [code[-1] for code in codes]
+    records = aggregate_conversions(_conversions(*codes), quantities, by)
+    python = aggregate_columns(codes, quantities, categories, by)
+
+    monkeypatch.setattr(aggregation, "_VECTORIZE_MIN_ROWS", 0)
+    encoded_codes, encoded_categories = factorize(codes), factorize(categories)
+    vectorized = aggregate_columns(
+        aggregation.EncodedColumn(np.asarray(encoded_codes.ids), encoded_codes.labels),
+        np.asarray(quantities),
+        encoded_categories,
+        by,
+    )
+
+    # 그룹 순서(처음 등장한 순서)와 sum/count/min/max가 모두 같음
+    assert list(python.groups.items()) == list(records.groups.items())
+    assert list(vectorized.groups.items()) == list(python.groups.items())
+    assert vectorized.rows == python.rows == len(codes)
+
+
+def test_string_input_stays_on_python_path(rows, monkeypatch):
+    codes, quantities = rows
+
+    def fail(*args):
+        raise AssertionError("문자열 입력은 NumPy로 집계하지 않아야 함")
+
+    monkeypatch.setattr(aggregation, "_VECTORIZE_MIN_ROWS", 0)
+    monkeypatch.setattr(aggregation, "_aggregate_numpy", fail)
+    aggregate_columns(codes, quantities)
+    aggregate_columns(factorize(codes), quantities, [code[-1] for code in codes], ("standard_code", "category"))
+    aggregate_conversions(_conversions(*codes), quantities)
+
+
+def test_length_and_key_validation():
+    with pytest.raises(ValueError, match="개수가 다릅니다"):
+        aggregate_conversions(_conversions("S-1", "S-2"), [1])
+    with pytest.raises(ValueError, match="개수가 다릅니다"):
+        aggregate_columns(["S-1"], [1, 2])
+    with pytest.raises(ValueError, match="그룹 키"):
+        aggregate_conversions(_conversions("S-1"), [1], by=("external_code",))
+    with pytest.raises(ValueError, match="categories"):
+        aggregate_columns(["S-1"], [1], by=("category",))
+
+
+def test_merged_chunks_equal_single_aggregate():
+    codes = [f"STD-{i % 7:03d}-A" for i in range(100)]
+    quantities = list(range(100))
+
+    whole = aggregate_conversions(_conversions(*codes), quantities)
+    merged = GroupAggregate()
+    for start in range(0, 100, 13):
+        merged.merge(aggregate_conversions(_conversions(*codes[start:start + 13]), quantities[start:start + 13]))
+
+    assert merged.groups == whole.groups
+    assert merged.rows == whole.rows == 100
+
+
+def test_retract_removes_rows():
+    total = aggregate_conversions(_conversions("S-1", "S-1", "S-2"), [5, 10, 7])
+    total.retract(aggregate_conversions(_conversions("S-1"), [10]))
+
+    assert total.sums() == {"S-1": 5, "S-2": 7}
+    assert total.rows == 2
+    # 취소한 값이 최댓값이었으므로 남은 행의 max는 알 수 없음
+    assert total.groups[("S-1",)] == [5, 1, 5, None]
+
+    total.retract(aggregate_conversions(_conversions("S-2"), [7]))
+    assert total.sums() == {"S-1": 5}
+
+
+def test_retract_more_than_merged_fails():
+    total = aggregate_conversions(_conversions("S-1"), [5])
+    with pytest.raises(ValueError):
+        total.retract(aggregate_conversions(_conversions("S-1", "S-1"), [5, 5]))
+    with pytest.raises(ValueError):
+        total.retract(aggregate_conversions(_conversions("S-2"), [1]))
+
+
+def test_merge_requires_same_group_keys():
+    by_code = aggregate_conversions(_conversions("S-1"), [1])
+    by_code_and_category = aggregate_conversions(_conversions("S-1"), [1], by=("standard_code", "category"))
+    with pytest.raises(ValueError):
+        by_code.merge(by_code_and_category)
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    path = tmp_path / "state.json"
+    assert GroupAggregate.load(path).sums() == {}
+
+    state = aggregate_conversions(_conversions("S-1", "S-2"), [3, 4])
+    state.save(path)
+    loaded = GroupAggregate.load(path)
+    loaded.merge(aggregate_conversions(_conversions("S-1"), [2]))
+
+    assert loaded.sums() == {"S-1": 5, "S-2": 4}
+    assert loaded.rows == 3
+
+
+def test_tool_updates_saved_state_with_delta_only(tmp_path, monkeypatch):
+    from agents.report_generator.tools.aggregate import aggregate_by_standard_code
+
+    monkeypatch.setenv("REPORT_AGGREGATE_STATE_DIR", str(tmp_path))
+
+    def run(**kwargs) -> dict:
+        return aggregate_by_standard_code.invoke({"state_key": "daily", **kwargs})
+
+    assert run(conversions=_conversions("S-1", "S-2"), quantities=[3, 4]) == {"S-1": 3, "S-2": 4}
+    assert run(
+        conversions=_conversions("S-1"),
+        quantities=[2],
+        retracted_conversions=_conversions("S-2"),
+        retracted_quantities=[4],
+    ) == {"S-1": 5}
+    assert GroupAggregate.load(tmp_path / "daily.json").rows == 2
+    # 잘못된 state_key와 취소 오류는 에이전트에게 메시지로 전달
+    assert "state_key" in run(conversions=[], quantities=[], state_key="../x")
+    assert "취소할 수 없습니다" in run(
+        conversions=[], quantities=[], retracted_conversions=_conversions("S-9"), retracted_quantities=[1]
+    )
@@ -0,0 +1,122 @@
+"""
+아티팩트 저장소 및 ConversionArtifactInterceptor 테스트
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from langchain_mcp_adapters.interceptors import MCPToolCallRequest
+from mcp.types import CallToolResult, TextContent
+
+from agents.report_generator.artifacts import ArtifactStore, ConversionArtifactInterceptor
+
+
+class FakeConverter:
+    """code_converter MCP 서버 대신 batch_convert_codes 응답을 만드는 핸들러"""
+
+    def __init__(self, server_inline_limit: int = 10):
+        self.server_inline_limit = server_inline_limit
+        self.requests: list[MCPToolCallRequest] = []
+
+    async def __call__(self, request: MCPToolCallRequest) -> CallToolResult:
+        self.requests.append(request)
+        codes = request.args["external_codes"]
+        results = [{"external_code": code, "standard_code": f"STD-{code}", "category": "A"} for code in codes]
+        if len(results) <= self.server_inline_limit:
+            payload = {"schema_version": 1, "format": "records", "results": results, "stats": {"total": len(codes)}}
+        else:
+            payload = {"schema_version": 1, "format": "records", "handle": "res_0123", "total": len(codes),
+                       "preview": results[:2], "stats": {"total": len(codes)}}
+        text = json.dumps(payload, ensure_ascii=False)
+        return CallToolResult(content=[TextContent(type="text", text=text)], structuredContent=payload)
+
+
+@pytest.fixture
+def store():
+    return ArtifactStore(backend="memory", inline_limit=3, preview_size=2)
+
+
+@pytest.fixture
+def converter():
+    return FakeConverter()
+
+
+def _request(args: dict, thread_id: str | None = "thread-1", name: str = "batch_convert_codes") -> MCPToolCallRequest:
+    config = {"configurable": {"thread_id": thread_id}} if thread_id else {}
+    return MCPToolCallRequest(name=name, args=args, server_name="code_converter", runtime=SimpleNamespace(config=config))
+
+
+def _call(store: ArtifactStore, converter: FakeConverter, request: MCPToolCallRequest) -> CallToolResult:
+    return asyncio.run(ConversionArtifactInterceptor(store)(request, converter))
+
+
+def test_small_batch_passes_through(store, converter):
+    result = _call(store, converter, _request({"external_codes": ["A", "B"]}))
+
+    assert [r["external_code"] for r in result.structuredContent["results"]] == ["A", "B"]
+    assert converter.requests[0].name == "batch_convert_codes"
+
+
+def test_codes_handle_list_is_resolved(store, converter):
+    handle = store.put("thread-1", "codes", ["A", "B"])
+
+    _call(store, converter, _request({"external_codes": [handle], "format": "records"}))
+
+    [request] = converter.requests
+    assert request.args == {"external_codes": ["A", "B"], "format": "records"}
+
+
+def test_unknown_or_foreign_handle_is_an_error(store, converter):
+    foreign = store.put("thread-2", "codes", ["A"])
+
+    result = _call(store, converter, _request({"external_codes": [foreign]}))
+
+    assert result.isError
+    assert converter.requests == []
+
+
+def test_inline_results_over_limit_are_offloaded(store, converter):
+    codes = [f"C{i}" for i in range(8)]
+
+    result = _call(store, converter, _request({"external_codes": codes}))
+
+    summary = result.structuredContent
+    assert summary["kind"] == "conversions"
+    assert summary["total"] == 8
+    assert len(summary["preview"]) == 2
+    assert summary["stats"] == {"total": 8}
+    assert [r["external_code"] for r in store.get("thread-1", summary["artifact"])] == codes
+    assert json.loads(result.content[0].text) == summary
+
+
+def test_large_batch_returns_result_handle(store, converter):
+    codes = [f"C{i}" for i in range(25)]
+    handle = store.put("thread-1", "codes", codes)
+
+    result = _call(store, converter, _request({"external_codes": [handle]}))
+
+    # 전체 결과를 한 번에 받는 도구로 바꾸지 않고 batch_convert_codes의 결과 핸들을 그대로 전달
+    [request] = converter.requests
+    assert request.name == "batch_convert_codes"
+    assert request.args["external_codes"] == codes
+    assert result.structuredContent["handle"] == "res_0123"
+    assert result.structuredContent["total"] == 25
+
+
+def test_calls_outside_a_thread_are_untouched(store, converter):
+    codes = [f"C{i}" for i in range(8)]
+
+    result = _call(store, converter, _request({"external_codes": codes}, thread_id=None))
+
+    assert len(result.structuredContent["results"]) == 8
+    assert len(store._memory) == 0
+
+
+def test_other_tools_are_untouched(store, converter):
+    handle = store.put("thread-1", "codes", ["A"])
+
+    _call(store, converter, _request({"external_codes": [handle]}, name="convert_codes_raw"))
+
+    assert converter.requests[0].args == {"external_codes": [handle]}
@@ -0,0 +1,54 @@
+"""
+bulk_convert_codes 테스트 (열 단위 변환)
+"""
+
+import pytest
+
+from agents.code_converter.tools import bulk_convert
+from agents.code_converter.tools.bulk_convert import bulk_convert_codes
+from agents.code_converter.tools.lookup_code import _convert_single_code
+
+CODES = ["EXT-PROD-001", "ext-svc-002", "VENDOR-100", "UNKNOWN-7", "NODIGITS", "EXT-PROD-001", "PARTNER-42"]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request, monkeypatch):
+    """NumPy 경로와 순수 Python 경로를 모두 테스트"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(bulk_convert, "np", None)
+    return request.param
+
+
+def test_matches_single_code_conversion(engine):
+    result = bulk_convert_codes(CODES)
+
+    assert len(result) == len(CODES)
+    assert result.to_records(CODES) == [_convert_single_code(code) for code in CODES]
+    assert result.categories() == ["A", "B", "V", "X", "X", "A", "P"]
+
+
+def test_category_ids_index_table(engine):
+    result = bulk_convert_codes(CODES)
+    table = result.table
+
+    assert table.categories[table.unknown_id] == "X"
+    assert [int(i) for i in result.category_ids].count(table.unknown_id) == 2
+
+
+def test_empty_input(engine):
+    result = bulk_convert_codes([])
+
+    assert len(result) == 0
+    assert result.to_records([]) == []
+
+
+def test_numpy_array_input():
+    np = pytest.importorskip("numpy")
+    codes = np.array(CODES * 100)
+
+    result = bulk_convert_codes(codes)
+
+    assert list(result.standard_codes[:len(CODES)]) == [_convert_single_code(c)["standard_code"] for c in CODES]
+    assert len(result) == len(codes)
@@ -0,0 +1,116 @@
+"""
+HistoryCompactionMiddleware 테스트 (토큰 예산 초과 시 오래된 도구 결과/인자 압축)
+"""
+
+import json
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+from agents.report_generator import compaction
+from agents.report_generator.artifacts import ArtifactStore
+from agents.report_generator.compaction import COMPACTION_EVENT, HistoryCompactionMiddleware
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = ArtifactStore(backend="memory")
+    monkeypatch.setattr(compaction, "get_artifact_store", lambda: store)
+    monkeypatch.setattr(compaction, "get_config", lambda: {"configurable": {"thread_id": "thread-1"}})
+    return store
+
+
+@pytest.fixture
+def events(monkeypatch):
+    events = []
+    monkeypatch.setattr(compaction, "dispatch_custom_event", lambda name, data: events.append((name, data)))
+    return events
+
+
+def _conversions(prefix: str, count: int = 200) -> list[dict]:
+    return [{"external_code": f"{prefix}-{i}", "standard_code": f"STD-{i:03d}-A", "category": "A"} for i in range(count)]
+
+
+def _turn(call_id: str, name: str, args: dict, output) -> list:
+    """도구 호출 하나와 그 결과"""
+    content = output if isinstance(output, str) else json.dumps(output)
+    return [
+        AIMessage(content="", tool_calls=[{"id": call_id, "name": name, "args": args}]),
+        ToolMessage(content=content, tool_call_id=call_id, name=name),
+    ]
+
+
+def _history() -> list:
+    return [
+        HumanMessage(content="리포트를 만들어 주세요", id="human"),
+        *_turn("call-1", "batch_convert_codes", {"external_codes": ["A"]}, {"results": _conversions("A"), "stats": {"total": 200}}),
+        *_turn("call-2", "aggregate_by_standard_code", {"conversions": _conversions("B")}, {"STD-000-A": 3}),
+        *_turn("call-3", "batch_convert_codes", {"external_codes": ["C"]}, {"results": _conversions("C")}),
+        *_turn("call-4", "generate_markdown_report", {"aggregated_data": {}}, "# 리포트\n" + "| row |\n" * 500),
+    ]
+
+
+def _with_ids(messages: list) -> list:
+    for i, message in enumerate(messages):
+        message.id = message.id or f"msg-{i}"
+    return messages
+
+
+def test_under_budget_is_untouched(store, events):
+    middleware = HistoryCompactionMiddleware(token_budget=10**6)
+
+    assert middleware.before_model({"messages": _with_ids(_history())}, None) is None
+    assert events == []
+
+
+def test_compacts_oldest_tool_results_and_inputs(store, events):
+    messages = _with_ids(_history())
+    middleware = HistoryCompactionMiddleware(token_budget=1000, min_tokens=200, keep_recent=2)
+
+    update = middleware.before_model({"messages": messages}, None)
+
+    replaced = {m.id: m for m in update["messages"]}
+    # 가장 오래된 변환 결과는 다이제스트로 바뀌고 원본 결과 목록은 아티팩트로 보관
+    digest = json.loads(replaced[messages[2].id].content)
+    assert digest["compacted"] is True
+    assert digest["kind"] == "conversions"
+    assert digest["stats"] == {"total": 200}
+    assert store.get("thread-1", digest["artifact"]) == _conversions("A")
+    # 답을 받은 도구 호출의 큰 인자도 핸들로 바뀜
+    [call] = replaced[messages[3].id].tool_calls
+    assert store.get("thread-1", call["args"]["conversions"]) == _conversions("B")
+    # 최근 keep_recent개의 도구 결과는 그대로
+    assert messages[6].id not in replaced and messages[8].id not in replaced
+
+    [(name, stats)] = events
+    assert name == COMPACTION_EVENT
+    assert stats["messages"] == len(update["messages"])
+    compacted = [replaced.get(m.id, m) for m in messages]
+    assert stats["tokens_after"] == count_tokens_approximately(compacted) < stats["tokens_before"]
+
+
+def test_compacted_messages_are_not_compacted_again(store, events):
+    messages = _with_ids(_history())
+    middleware = HistoryCompactionMiddleware(token_budget=1000, min_tokens=200, keep_recent=0)
+
+    update = middleware.before_model({"messages": messages}, None)
+    replaced = {m.id: m for m in update["messages"]}
+    compacted = [replaced.get(m.id, m) for m in messages]
+
+    assert middleware.before_model({"messages": compacted}, None) is None
+    assert len(events) == 1
+
+
+def test_pending_tool_call_is_kept_for_resume(store, events):
+    messages = _with_ids([
+        *_history(),
+        AIMessage(content="", tool_calls=[
+            {"id": "call-5", "name": "get_exchange_rate", "args": {"pairs": _conversions("D")}}
+        ]),
+    ])
+    middleware = HistoryCompactionMiddleware(token_budget=1, min_tokens=200, keep_recent=0)
+
+    update = middleware.before_model({"messages": messages}, None)
+
+    assert messages[-1].id not in {m.id for m in update["messages"]}
@@ -0,0 +1,73 @@
+"""
+변환 결과 응답 테스트 (핸들 보관, 페이지 조회, limit 범위 검증)
+"""
+
+import asyncio
+
+import pytest
+
+from agents.code_converter.results import MAX_PAGE, ResultHandleStore, build_payload, page_payload
+
+RECORDS = [
+    {"external_code": f"EXT-PROD-{i:03d}", "standard_code": f"STD-{i:03d}-A", "category": "A", "success": True}
+    for i in range(25)
+]
+
+
+def _pages(limit: int) -> list[dict]:
+    """next_offset을 따라 마지막 페이지까지 조회"""
+    pages, offset = [], 0
+    while offset is not None:
+        pages.append(page_payload("res_test", RECORDS, {}, offset, limit, "records"))
+        offset = pages[-1]["next_offset"]
+    return pages
+
+
+@pytest.mark.parametrize("limit, sizes", [(1, [1] * 25), (10, [10, 10, 5]), (25, [25]), (MAX_PAGE, [25])])
+def test_pages_cover_all_records(limit, sizes):
+    pages = _pages(limit)
+
+    assert [len(page["results"]) for page in pages] == sizes
+    assert [r["external_code"] for page in pages for r in page["results"]] == [r["external_code"] for r in RECORDS]
+    assert pages[-1]["next_offset"] is None
+
+
+@pytest.mark.parametrize("limit", [0, -1, MAX_PAGE + 1])
+def test_out_of_range_limit_is_rejected(limit):
+    with pytest.raises(ValueError, match="limit"):
+        page_payload("res_test", RECORDS, {}, 0, limit, "records")
+
+
+def test_offset_past_end_returns_empty_last_page():
+    page = page_payload("res_test", RECORDS, {}, 100, 10, "columnar")
+
+    assert page["results"]["external_code"] == []
+    assert page["next_offset"] is None
+
+
+def test_large_batch_returns_handle_with_preview():
+    handles = ResultHandleStore()
+
+    inline = build_payload(RECORDS[:5], {"total": 5}, "records", handles, inline_limit=5, preview_size=2)
+    stored = build_payload(RECORDS, {"total": 25}, "records", handles, inline_limit=5, preview_size=2)
+
+    assert len(inline["results"]) == 5 and "handle" not in inline
+    assert stored["total"] == 25
+    assert [r["external_code"] for r in stored["preview"]] == ["EXT-PROD-000", "EXT-PROD-001"]
+    assert handles.get(stored["handle"]) == (RECORDS, {"total": 25})
+
+
+def test_code_converter_batch_returns_handle(monkeypatch):
+    from agents.code_converter import server as converter_server
+
+    codes = [r["external_code"] for r in RECORDS]
+    monkeypatch.setitem(converter_server._result_config, "inline_limit", 10)
+    payload = asyncio.run(converter_server.batch_convert_codes(codes)).structuredContent
+    assert payload["total"] == 25
+
+    page = asyncio.run(converter_server.fetch_conversion_results(payload["handle"], offset=20, limit=10))
+    assert [r["standard_code"] for r in page.structuredContent["results"]] == [f"STD-{i:03d}-A" for i in range(20, 25)]
+
+    rejected = asyncio.run(converter_server.fetch_conversion_results(payload["handle"], limit=0))
+    assert rejected.isError
+    assert "limit" in rejected.content[0].text
@@ -0,0 +1,124 @@
+"""
+convert_codes 테스트 (매핑 규칙 → 메모리 캐시 → 영구 저장소 → 에이전트 순서, 에이전트 fallback)
+"""
+
+import ast
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from agents.code_converter import service
+from agents.code_converter.cache import ConversionCache
+from agents.code_converter.store import PersistentConversionStore
+from agents.code_converter.tools.lookup_code import rules_fingerprint
+
+
+class FakeAgent:
+    """프롬프트의 코드 목록을 AGENT-* 표준 코드로 변환하는 에이전트 (failing 코드가 있으면 예외)"""
+
+    def __init__(self, failing: set[str] = frozenset()):
+        self.failing = failing
+        self.calls: list[list[str]] = []
+
+    async def ainvoke(self, agent_input: dict) -> dict:
+        prompt = agent_input["messages"][0]["content"]
+        codes = ast.literal_eval(prompt[prompt.index("["):])
+        self.calls.append(codes)
+        if self.failing & set(codes):
+            raise RuntimeError("LLM unavailable")
+        records = [
+            {"external_code": code, "standard_code": f"AGENT-{code}", "category": "G", "success": True}
+            for code in codes
+        ]
+        return {"messages": [SimpleNamespace(content=json.dumps(records))]}
+
+
+@pytest.fixture
+def converter(tmp_path, monkeypatch):
+    """격리된 캐시/저장소/에이전트로 service를 구성"""
+    agent = FakeAgent()
+    store = PersistentConversionStore(tmp_path / "store")
+    monkeypatch.setattr(service, "conversion_cache", ConversionCache(max_size=100))
+    monkeypatch.setattr(service, "conversion_store", store)
+    monkeypatch.setattr(service, "_converter_agent", agent)
+    monkeypatch.setattr(service, "is_rule_first_enabled", lambda: True)
+    yield SimpleNamespace(agent=agent, store=store, cache=service.conversion_cache)
+    store.close()
+
+
+def test_rule_matched_codes_skip_agent(converter):
+    codes = ["EXT-PROD-001", "ext-svc-002 ", "VENDOR-100"]
+    results, stats = asyncio.run(service.convert_codes(codes))
+
+    assert [r["standard_code"] for r in results] == ["STD-001-A", "STD-002-B", "STD-100-V"]
+    assert stats["fast_path"] == 3
+    assert stats["agent_fallback"] == 0
+    assert converter.agent.calls == []
+
+
+def test_rule_first_disabled_sends_codes_to_agent(converter, monkeypatch):
+    monkeypatch.setattr(service, "is_rule_first_enabled", lambda: False)
+
+    results, stats = asyncio.run(service.convert_codes(["EXT-PROD-001", "ODD-1"]))
+
+    assert [r["standard_code"] for r in results] == ["AGENT-EXT-PROD-001", "AGENT-ODD-1"]
+    assert stats["agent_fallback"] == 2
+    assert converter.agent.calls == [["EXT-PROD-001", "ODD-1"]]
+
+
+def test_failed_agent_shard_falls_back_without_caching(converter, monkeypatch):
+    monkeypatch.setitem(service._concurrency_config, "shard_size", 1)
+    converter.agent.failing = {"ODD-2"}
+    fingerprint = rules_fingerprint()
+
+    results, stats = asyncio.run(service.convert_codes(["ODD-1", "ODD-2", "ODD-3"]))
+
+    # 실패한 샤드의 코드만 기본 변환 결과(카테고리 X)로 채워짐
+    assert [r["standard_code"] for r in results] == ["AGENT-ODD-1", "STD-002-X", "AGENT-ODD-3"]
+    assert stats["agent_fallback"] == 3
+    assert converter.cache.get("ODD-2", fingerprint) is None
+    assert converter.store.get(service._store_key("ODD-2", fingerprint)) is None
+    assert converter.cache.get("ODD-1", fingerprint) is not None
+
+
+def test_lookup_order(converter):
+    fingerprint = rules_fingerprint()
+    converter.cache.put("ODD-0", fingerprint, {"external_code": "ODD-0", "standard_code": "CACHED"})
+    converter.store.put(service._store_key("ODD-1", fingerprint), {"external_code": "ODD-1", "standard_code": "STORED"})
+    # 규칙에 일치하는 코드는 캐시에 값이 있어도 규칙으로 변환
+    converter.cache.put("EXT-PROD-001", fingerprint, {"external_code": "EXT-PROD-001", "standard_code": "STALE"})
+
+    codes = ["EXT-PROD-001", "ODD-0", "ODD-1", "ODD-2"]
+    results, stats = asyncio.run(service.convert_codes(codes))
+
+    assert [r["standard_code"] for r in results] == ["STD-001-A", "CACHED", "STORED", "AGENT-ODD-2"]
+    assert stats == {"total": 4, "cache_hit": 1, "store_hit": 1, "fast_path": 1, "agent_fallback": 1}
+    # 에이전트에는 앞 단계에서 해석되지 않은 코드만 전달됨
+    assert converter.agent.calls == [["ODD-2"]]
+
+
+def test_rule_matched_codes_do_not_touch_cache(converter):
+    asyncio.run(service.convert_codes(["EXT-PROD-001", "EXT-SVC-002", "VENDOR-100"] * 10))
+
+    stats = converter.cache.stats()
+    assert stats["hits"] == 0
+    assert stats["misses"] == 0
+    assert stats["size"] == 0
+
+
+def test_only_agent_and_store_results_are_cached(converter):
+    fingerprint = rules_fingerprint()
+    converter.store.put(service._store_key("ODD-1", fingerprint), {"standard_code": "STORED"})
+
+    asyncio.run(service.convert_codes(["EXT-SVC-002", "ODD-1", "ODD-2"]))
+
+    assert converter.cache.get("ODD-1", fingerprint) == {"standard_code": "STORED"}
+    assert converter.cache.get("ODD-2", fingerprint)["standard_code"] == "AGENT-ODD-2"
+    assert converter.store.get(service._store_key("ODD-2", fingerprint))["standard_code"] == "AGENT-ODD-2"
+
+    # 두 번째 요청은 에이전트를 호출하지 않음
+    _, stats = asyncio.run(service.convert_codes(["ODD-1", "ODD-2"]))
+    assert stats["cache_hit"] == 2
+    assert len(converter.agent.calls) == 1
@@ -0,0 +1,96 @@
+"""
+PersistentConversionStore 테스트 (잘린 마지막 줄 복구, 인덱스 재생성)
+"""
+
+import pytest
+
+from agents.code_converter.store import LOG_FILENAME, PersistentConversionStore
+
+
+@pytest.fixture
+def open_store(tmp_path):
+    """같은 디렉토리의 저장소를 열고, 테스트가 닫지 않은 저장소는 끝난 뒤 닫음"""
+    stores = []
+
+    def _open(**kwargs) -> PersistentConversionStore:
+        store = PersistentConversionStore(tmp_path, **kwargs)
+        stores.append(store)
+        return store
+
+    yield _open
+    for store in stores:
+        try:
+            store.close()
+        except OSError:  # 테스트에서 이미 닫은 저장소
+            pass
+
+
+def test_values_survive_reopen(open_store):
+    store = open_store()
+    store.put("a", {"standard_code": "STD-001-A"})
+    store.put("a", {"standard_code": "STD-002-A"})
+    store.close()
+
+    reopened = open_store()
+    assert reopened.get("a") == {"standard_code": "STD-002-A"}
+    assert reopened.get("missing") is None
+
+
+def test_put_after_torn_tail(open_store, tmp_path):
+    store = open_store()
+    store.put("a", 1)
+    store.close()
+    # 쓰는 도중 종료된 프로세스가 남긴 잘린 줄
+    with open(tmp_path / LOG_FILENAME, "ab") as f:
+        f.write(b'["b",')
+
+    store = open_store()
+    store.put("c", 3)
+    assert store.get("a") == 1
+    assert store.get("b") is None
+    assert store.get("c") == 3
+    store.close()
+
+    # 다시 열어 전체 스캔/인덱스 재생성을 해도 잘린 줄 이후 레코드가 유지됨
+    reopened = open_store(compact_threshold=0)
+    assert reopened.stats()["tail_records"] == 0
+    assert reopened.get("a") == 1
+    assert reopened.get("c") == 3
+
+
+def test_put_compacts_tail(open_store):
+    store = open_store(compact_threshold=3)
+    for i in range(10):
+        store.put(f"k{i}", i)
+    store.put("k0", "latest")
+
+    stats = store.stats()
+    assert stats["indexed_records"] > 0
+    assert stats["tail_records"] <= 3
+    assert store.get("k0") == "latest"
+    assert [store.get(f"k{i}") for i in range(1, 10)] == list(range(1, 10))
+
+
+def test_reader_sees_other_writer(open_store):
+    writer = open_store(compact_threshold=2)
+    reader = open_store()
+    for i in range(5):
+        writer.put(f"k{i}", i)
+
+    # 인덱스가 교체되어도 다른 인스턴스에서 조회 가능
+    assert [reader.get(f"k{i}") for i in range(5)] == list(range(5))
+
+
+def test_overwrite_by_other_instance_is_visible(open_store):
+    writer = open_store()
+    reader = open_store()
+    writer.put("k", "old")
+    assert reader.get("k") == "old"
+
+    # 이미 조회한 키를 다른 인스턴스(프로세스)가 덮어씀
+    writer.put("k", "new")
+    assert reader.get("k") == "new"
+
+    writer.compact()
+    writer.put("k", "newest")
+    assert reader.get("k") == "newest"
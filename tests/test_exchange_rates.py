@@ -0,0 +1,222 @@
+"""
+Exchange rate tests with stub providers: cache single-flight / stale-while-revalidate
+and bulk cross-rate derivation.
+"""
+
+import threading
+import time
+
+import pytest
+
+from agents.report_generator.tools import finance
+from agents.report_generator.tools.finance import ExchangeRateCache, get_exchange_rate, set_rate_provider
+from agents.report_generator.tools.rates import get_exchange_rates
+
+
+class StubProvider:
+    """Returns rates from a table; fetches can be held open with `gate` and made to fail with `error`."""
+
+    def __init__(self, rates: dict[tuple[str, str], float]):
+        self.rates = dict(rates)
+        self.calls: list[tuple[str, str]] = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.error: Exception | None = None
+        self._lock = threading.Lock()
+
+    def fetch_rate(self, base_currency: str, target_currency: str) -> float | None:
+        with self._lock:
+            self.calls.append((base_currency, target_currency))
+        self.gate.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.rates.get((base_currency, target_currency))
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.005)
+
+
+def _run_concurrently(count: int, target) -> tuple[list, list[threading.Thread]]:
+    """Start `count` threads that call target() after a shared barrier; returns (results, threads)."""
+    barrier = threading.Barrier(count)
+    results: list = [None] * count
+
+    def run(i: int) -> None:
+        barrier.wait()
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return results, threads
+
+
+@pytest.fixture
+def provider():
+    return StubProvider({("USD", "KRW"): 1400.0})
+
+
+def test_fresh_entry_is_served_from_cache(provider):
+    cache = ExchangeRateCache(provider, ttl_seconds=60)
+
+    assert cache.get("USD", "KRW") == 1400.0
+    assert cache.get("USD", "KRW") == 1400.0
+    assert provider.calls == [("USD", "KRW")]
+
+
+def test_concurrent_misses_share_one_fetch(provider):
+    cache = ExchangeRateCache(provider, ttl_seconds=60)
+    provider.gate.clear()
+
+    results, threads = _run_concurrently(8, lambda: cache.get("USD", "KRW"))
+    _wait_for(lambda: provider.calls)
+    # Give every thread time to join the in-flight fetch before it completes
+    time.sleep(0.1)
+    provider.gate.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == [1400.0] * 8
+    assert provider.calls == [("USD", "KRW")]
+    assert cache.fetches == 1
+
+
+def test_stale_entry_is_served_while_one_refresh_runs(provider):
+    cache = ExchangeRateCache(provider, ttl_seconds=0, stale_seconds=60)
+    cache.put("USD", "KRW", 1300.0)
+    provider.gate.clear()
+
+    # Every read during the refresh gets the stale rate without blocking
+    assert [cache.get("USD", "KRW") for _ in range(5)] == [1300.0] * 5
+    _wait_for(lambda: provider.calls)
+    assert provider.calls == [("USD", "KRW")]
+
+    provider.gate.set()
+    _wait_for(lambda: not cache._inflight)
+    assert cache._entries[("USD", "KRW")][1] == 1400.0
+
+
+def test_expired_entry_blocks_for_a_new_fetch(provider):
+    cache = ExchangeRateCache(provider, ttl_seconds=0, stale_seconds=0)
+    cache.put("USD", "KRW", 1300.0)
+    time.sleep(0.01)
+
+    assert cache.get("USD", "KRW") == 1400.0
+    assert provider.calls == [("USD", "KRW")]
+
+
+def test_provider_error_clears_inflight_and_next_call_retries(provider):
+    cache = ExchangeRateCache(provider, ttl_seconds=60)
+    provider.error = RuntimeError("upstream down")
+    provider.gate.clear()
+
+    results, threads = _run_concurrently(4, lambda: cache.get("USD", "KRW"))
+    _wait_for(lambda: provider.calls)
+    time.sleep(0.1)
+    provider.gate.set()
+    for thread in threads:
+        thread.join(5)
+
+    # Every waiter of the failed fetch sees the error, and nothing stays in flight
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache._inflight == {}
+    assert len(provider.calls) == 1
+
+    provider.error = None
+    assert cache.get("USD", "KRW") == 1400.0
+    assert len(provider.calls) == 2
+
+
+def test_missing_rate_is_not_cached(provider):
+    cache = ExchangeRateCache(provider, ttl_seconds=60)
+
+    assert cache.get("USD", "XXX") is None
+    assert cache.get("USD", "XXX") is None
+    assert len(provider.calls) == 2
+
+
+@pytest.fixture
+def stub_rates(provider):
+    """Point the shared cache used by the tools at the stub provider."""
+    original = finance.rate_cache.provider
+    set_rate_provider(provider)
+    yield provider
+    set_rate_provider(original)
+
+
+def test_get_exchange_rate_tool(stub_rates):
+    assert get_exchange_rate.invoke({"target_currency": "krw"}) == {
+        "base_currency": "USD",
+        "target_currency": "KRW",
+        "rate": 1400.0,
+        "success": True,
+    }
+    missing = get_exchange_rate.invoke({"target_currency": "XXX"})
+    assert missing["success"] is False
+
+    stub_rates.error = RuntimeError("upstream down")
+    assert get_exchange_rate.invoke({"target_currency": "EUR"}) == {"error": "upstream down", "success": False}
+
+
+class StubBulkProvider(StubProvider):
+    """Stub provider with a bulk USD-leg download, as used by get_exchange_rates."""
+
+    def __init__(self, usd_rates: dict[str, float]):
+        super().__init__({("USD", currency): rate for currency, rate in usd_rates.items()})
+        self.bulk_calls: list[list[str]] = []
+
+    def fetch_usd_rates(self, currencies: list[str]) -> dict[str, float]:
+        self.bulk_calls.append(list(currencies))
+        return {c: self.rates[("USD", c)] for c in currencies if ("USD", c) in self.rates}
+
+
+@pytest.fixture
+def bulk_rates():
+    provider = StubBulkProvider({"KRW": 1400.0, "EUR": 0.9, "JPY": 150.0})
+    original = finance.rate_cache.provider
+    set_rate_provider(provider)
+    yield provider
+    set_rate_provider(original)
+
+
+def test_get_exchange_rates_derives_cross_rates(bulk_rates):
+    results = get_exchange_rates.invoke({"pairs": [["eur", "krw"], ["USD", "USD"], ["USD", "JPY"], ["JPY", "EUR"]]})
+
+    assert [r["success"] for r in results] == [True] * 4
+    assert results[0]["rate"] == pytest.approx(1400.0 / 0.9)
+    assert (results[0]["base_currency"], results[0]["target_currency"]) == ("EUR", "KRW")
+    assert results[1]["rate"] == 1.0
+    assert results[2]["rate"] == 150.0
+    assert results[3]["rate"] == pytest.approx(0.9 / 150.0)
+    # All legs come from one bulk download and are shared with get_exchange_rate
+    assert bulk_rates.bulk_calls == [["EUR", "JPY", "KRW"]]
+    assert bulk_rates.calls == []
+    assert get_exchange_rate.invoke({"target_currency": "JPY"})["rate"] == 150.0
+    assert bulk_rates.calls == []
+
+
+def test_get_exchange_rates_reports_requested_pair_and_missing_legs(bulk_rates):
+    del bulk_rates.rates[("USD", "JPY")]
+    results = get_exchange_rates.invoke({"pairs": [["JPY", "KRW"], ["KRW", "XXX"], ["JPY", "XXX"]]})
+
+    assert results == [
+        {"error": "Could not fetch rate for JPY→KRW", "missing_legs": ["USD→JPY"], "success": False},
+        {"error": "Could not fetch rate for KRW→XXX", "missing_legs": ["USD→XXX"], "success": False},
+        {"error": "Could not fetch rate for JPY→XXX", "missing_legs": ["USD→JPY", "USD→XXX"], "success": False},
+    ]
+    assert len(bulk_rates.bulk_calls) == 1
+
+
+def test_get_exchange_rates_validates_pairs(bulk_rates):
+    results = get_exchange_rates.invoke({"pairs": [["USD", "KRW"], ["EUR"]]})
+
+    assert [r["success"] for r in results] == [False, False]
+    assert bulk_rates.bulk_calls == []
@@ -0,0 +1,186 @@
+"""
+MCPSessionPool 테스트 (세션 재사용, 교체, 상태 확인)
+
+create_session을 가짜 세션으로 바꿔 서버 프로세스 없이 풀의 동작만 확인합니다.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from agents.report_generator import mcp_pool
+from agents.report_generator.mcp_pool import MCPSessionPool, MCPSessionPools
+
+
+class FakeSession:
+    def __init__(self, number: int, server):
+        self.number = number
+        self.server = server
+        self.closed = False
+
+    async def initialize(self) -> None:
+        pass
+
+    async def send_ping(self) -> None:
+        if self.number in self.server.unhealthy:
+            raise ConnectionError("no pong")
+
+    async def call_tool(self, name: str, arguments: dict | None = None):
+        self.server.active += 1
+        self.server.max_active = max(self.server.max_active, self.server.active)
+        await asyncio.sleep(0.01)
+        self.server.active -= 1
+        if name == "fail":
+            raise RuntimeError("tool failed")
+        return (self.number, name)
+
+
+class FakeServer:
+    """create_session 대체 - 연 세션과 닫힌 세션을 기록"""
+
+    def __init__(self):
+        self.sessions: list[FakeSession] = []
+        self.unhealthy: set[int] = set()
+        self.fail_connect = False
+        self.active = 0
+        self.max_active = 0
+
+    @asynccontextmanager
+    async def create_session(self, connection):
+        if self.fail_connect:
+            raise ConnectionError("server not found")
+        session = FakeSession(len(self.sessions), self)
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            session.closed = True
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = FakeServer()
+    monkeypatch.setattr(mcp_pool, "create_session", server.create_session)
+    return server
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """풀이 보는 time.monotonic만 수동으로 진행 (이벤트 루프의 시계는 그대로)"""
+    now = [1000.0]
+    monkeypatch.setattr(mcp_pool, "time", SimpleNamespace(monotonic=lambda: now[0], perf_counter=time.perf_counter))
+    return now
+
+
+def _pool(**kwargs) -> MCPSessionPool:
+    return MCPSessionPool("code_converter", {"transport": "stdio"}, **kwargs)
+
+
+def test_sessions_are_prewarmed_and_reused(server, clock):
+    pool = _pool(size=2)
+
+    async def scenario():
+        await pool.start()
+        opened = len(server.sessions)
+        results = await asyncio.gather(*(pool.call_tool("convert") for _ in range(10)))
+        await pool.aclose()
+        return opened, results
+
+    opened, results = asyncio.run(scenario())
+
+    assert opened == 2
+    assert {number for number, _ in results} == {0, 1}
+    # 세션 하나는 한 번에 한 호출만 사용
+    assert server.max_active == 2
+    assert pool.stats()["created"] == 2
+    assert pool.stats()["calls"] == 10
+    assert all(session.closed for session in server.sessions)
+
+
+def test_session_is_recycled_after_max_uses(server, clock):
+    pool = _pool(size=1, max_uses=3)
+
+    async def scenario():
+        results = [await pool.call_tool("convert") for _ in range(7)]
+        await pool.aclose()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert [number for number, _ in results] == [0, 0, 0, 1, 1, 1, 2]
+    assert pool.recycled == 2
+    assert all(session.closed for session in server.sessions)
+
+
+def test_idle_session_is_pinged_and_replaced_when_unhealthy(server, clock):
+    pool = _pool(size=1, ping_interval=30)
+
+    async def scenario():
+        first = await pool.call_tool("convert")
+        clock[0] += 10
+        # 쉰 시간이 짧으면 ping 없이 사용
+        server.unhealthy.add(0)
+        second = await pool.call_tool("convert")
+        clock[0] += 31
+        third = await pool.call_tool("convert")
+        await pool.aclose()
+        return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+
+    assert (first[0], second[0], third[0]) == (0, 0, 1)
+    assert pool.failed_checks == 1
+    assert pool.recycled == 1
+
+
+def test_failed_call_marks_session_for_check(server, clock):
+    pool = _pool(size=1)
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await pool.call_tool("fail")
+        # 실패한 세션은 ping에 응답하면 그대로 사용
+        healthy = await pool.call_tool("convert")
+        with pytest.raises(RuntimeError):
+            await pool.call_tool("fail")
+        server.unhealthy.add(0)
+        replaced = await pool.call_tool("convert")
+        await pool.aclose()
+        return healthy, replaced
+
+    healthy, replaced = asyncio.run(scenario())
+
+    assert healthy[0] == 0
+    assert replaced[0] == 1
+    assert pool.failed_checks == 1
+
+
+def test_start_failure_is_raised(server, clock):
+    server.fail_connect = True
+    pool = _pool(size=2)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(pool.start())
+    assert pool.stats()["idle"] == 0
+
+
+def test_pools_reject_unknown_server(server, clock):
+    pools = MCPSessionPools(
+        {"code_converter": {"transport": "stdio"}},
+        {"size": 1, "max_uses": 0, "ping_interval": 30.0, "ping_timeout": 1.0, "connect_timeout": 5.0},
+    )
+
+    async def scenario():
+        async with pools.session("code_converter") as session:
+            result = await session.call_tool("convert")
+        with pytest.raises(ValueError):
+            async with pools.session("unknown"):
+                pass
+        await pools.aclose()
+        return result
+
+    assert asyncio.run(scenario()) == (0, "convert")
+    assert pools.stats()["code_converter"]["calls"] == 1
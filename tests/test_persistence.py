@@ -0,0 +1,134 @@
+"""
+체크포인터 영속성 테스트 (SQLite 재시작 후 재개, 스레드당 체크포인트 수 제한)
+"""
+
+import asyncio
+import operator
+from typing import Annotated, TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+from agents.report_generator.persistence import ThreadRegistry, open_checkpointer
+
+
+class _State(TypedDict):
+    messages: Annotated[list[str], operator.add]
+
+
+def _graph(checkpointer):
+    """실행할 때마다 메시지를 하나 추가하는 그래프 (실행당 체크포인트 여러 개 생성)"""
+    builder = StateGraph(_State)
+    builder.add_node("reply", lambda state: {"messages": [f"reply-{len(state['messages'])}"]})
+    builder.add_edge(START, "reply")
+    builder.add_edge("reply", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+async def _run_turns(checkpointer, thread_id: str, turns: int) -> dict:
+    graph = _graph(checkpointer)
+    config = {"configurable": {"thread_id": thread_id}}
+    state = None
+    for i in range(turns):
+        state = await graph.ainvoke({"messages": [f"user-{i}"]}, config)
+    return state
+
+
+async def _count_checkpoints(checkpointer, thread_id: str) -> int:
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    return len([c async for c in checkpointer.alist(config)])
+
+
+@pytest.fixture
+def sqlite_config(tmp_path):
+    return {"backend": "sqlite", "path": str(tmp_path / "checkpoints.sqlite")}
+
+
+def test_sqlite_state_survives_reopen(sqlite_config):
+    async def scenario():
+        async with open_checkpointer(sqlite_config) as saver:
+            await _run_turns(saver, "thread-1", 2)
+            await ThreadRegistry(saver).on_run_finished("thread-1", "interrupted")
+
+        # 서버 재시작: 같은 파일을 다시 열어 이어서 실행
+        async with open_checkpointer(sqlite_config) as saver:
+            state = await _run_turns(saver, "thread-1", 1)
+            records = await ThreadRegistry(saver).list_threads()
+        return state, records
+
+    state, records = asyncio.run(scenario())
+
+    assert state["messages"] == ["user-0", "reply-1", "user-1", "reply-3", "user-0", "reply-5"]
+    assert [(r.thread_id, r.status) for r in records] == [("thread-1", "interrupted")]
+    assert records[0].size_bytes > 0
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_prune_keeps_latest_checkpoints(backend, sqlite_config):
+    config = sqlite_config if backend == "sqlite" else {"backend": "memory"}
+
+    async def scenario():
+        async with open_checkpointer(config) as saver:
+            registry = ThreadRegistry(saver, max_checkpoints_per_thread=2)
+            await _run_turns(saver, "thread-1", 3)
+            before = await _count_checkpoints(saver, "thread-1")
+            await registry.on_run_finished("thread-1", "interrupted")
+            after = await _count_checkpoints(saver, "thread-1")
+            # 남은 최신 체크포인트에서 전체 상태를 그대로 복원
+            state = await _graph(saver).aget_state({"configurable": {"thread_id": "thread-1"}})
+            return before, after, state.values
+
+    before, after, values = asyncio.run(scenario())
+
+    assert before > 2
+    assert after == 2
+    assert values["messages"][-2:] == ["user-2", "reply-5"]
+    assert len(values["messages"]) == 6
+
+
+def test_memory_prune_drops_unreferenced_blobs():
+    async def scenario():
+        async with open_checkpointer({"backend": "memory"}) as saver:
+            registry = ThreadRegistry(saver, max_checkpoints_per_thread=1)
+            await _run_turns(saver, "thread-1", 5)
+            await _run_turns(saver, "thread-2", 1)
+            blobs_before = len(saver.blobs)
+            size_before = await registry._measure("thread-1")
+            await registry.on_run_finished("thread-1", "interrupted")
+            return saver, blobs_before, size_before, await registry._measure("thread-1")
+
+    saver, blobs_before, size_before, size_after = asyncio.run(scenario())
+
+    [(_, checkpoint_tuple)] = saver.storage["thread-1"][""].items()
+    versions = saver.serde.loads_typed(checkpoint_tuple[0])["channel_versions"]
+    remaining = {(k[2], k[3]) for k in saver.blobs if k[0] == "thread-1"}
+    assert remaining <= set(versions.items())
+    assert len(saver.blobs) < blobs_before
+    assert size_after < size_before
+    # 다른 스레드의 blob은 그대로 유지
+    assert any(k[0] == "thread-2" for k in saver.blobs)
+
+
+def test_completed_thread_is_evicted():
+    async def scenario():
+        async with open_checkpointer({"backend": "memory"}) as saver:
+            registry = ThreadRegistry(saver)
+            await registry.mark_running("thread-1")
+            await _run_turns(saver, "thread-1", 1)
+            await registry.on_run_finished("thread-1", "completed")
+            return saver, await registry.summary()
+
+    saver, summary = asyncio.run(scenario())
+
+    assert "thread-1" not in saver.storage
+    assert not any(k[0] == "thread-1" for k in saver.blobs)
+    assert summary["threads"] == 0
+
+
+def test_unknown_backend_is_rejected():
+    async def scenario():
+        async with open_checkpointer({"backend": "redis"}):
+            pass
+
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
@@ -0,0 +1,160 @@
+"""
+리포트 서버 엔드포인트 테스트 (파이프라인 모드, 아티팩트 inline_limit(50)보다 많은 코드)
+
+실제 code_converter MCP 서버를 stdio로 띄우며, 모든 코드가 매핑 규칙으로 변환되므로 LLM을 호출하지 않습니다.
+"""
+
+import json
+
+import pytest
+
+from agents.report_generator.rendering import ReportData, iter_report
+
+# 표준 코드가 모두 다른 80개 코드 (집계 결과도 inline_limit보다 큼)
+CODES = [f"EXT-PROD-{i:03d}" for i in range(80)]
+QUANTITIES = [i + 1 for i in range(80)]
+
+
+def _report_input(**overrides) -> dict:
+    return {"external_codes": CODES, "quantities": QUANTITIES, **overrides}
+
+
+def test_invoke_pipeline(client):
+    response = client.post("/report/invoke", json={"input": _report_input(mode="pipeline")})
+
+    assert response.status_code == 200
+    output = response.json()["output"]
+    assert output["status"] == "completed"
+    assert output["summary"]["mode"] == "pipeline"
+    assert "**총 항목 수**: 80개" in output["report"]
+    assert f"**총 수량**: {sum(QUANTITIES)}" in output["report"]
+
+
+@pytest.mark.parametrize("path, wrap", [
+    ("/report/invoke", True),
+    ("/report/stream", True),
+    ("/report/render", False),
+    ("/report/markdown", False),
+])
+def test_length_mismatch_is_rejected(client, path, wrap):
+    report_input = _report_input(mode="pipeline", quantities=QUANTITIES[:-1])
+    response = client.post(path, json={"input": report_input} if wrap else report_input)
+
+    assert response.status_code == 422
+    assert "외부 코드(80개)와 수량(79개)의 개수가 다릅니다" in response.text
+
+
+def test_batch(client):
+    response = client.post("/report/batch", json={"reports": [_report_input(), _report_input(
+        external_codes=CODES[:3], quantities=QUANTITIES[:3],
+    )]})
+
+    assert response.status_code == 200
+    events = [json.loads(line) for line in response.text.splitlines()]
+    results = {event["index"]: event for event in events if "index" in event}
+    assert [results[i]["status"] for i in (0, 1)] == ["completed", "completed"]
+    assert "**총 항목 수**: 80개" in results[0]["report"]
+    assert "**총 항목 수**: 3개" in results[1]["report"]
+    # 두 리포트의 코드는 중복 제거 후 한 번만 변환
+    assert events[-1] == {
+        "type": "batch_summary",
+        "reports": 2,
+        "pipeline_reports": 2,
+        "agent_reports": 0,
+        "total_codes": 83,
+        "unique_codes": 80,
+    }
+
+
+def test_batch_rejects_length_mismatch(client):
+    response = client.post("/report/batch", json={"reports": [
+        _report_input(),
+        _report_input(quantities=QUANTITIES[:3]),
+    ]})
+
+    assert response.status_code == 422
+
+
+def test_markdown_page(client):
+    response = client.post("/report/markdown?detail_offset=5&detail_limit=3", json=_report_input())
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/markdown")
+    rows = [line for line in response.text.splitlines() if line.startswith("| EXT-PROD-")]
+    assert rows == [
+        "| EXT-PROD-005 | STD-005-A | A |",
+        "| EXT-PROD-006 | STD-006-A | A |",
+        "| EXT-PROD-007 | STD-007-A | A |",
+    ]
+    assert "_변환 내역 80건 중 6–8번째 표시_" in response.text
+    # 집계 섹션은 페이지와 관계없이 전체 행을 포함
+    assert "**총 항목 수**: 80개" in response.text
+
+
+def test_render_jsonl_page_matches_unpaged_rows(client):
+    full = client.post("/report/render", json=_report_input(format="jsonl")).text.splitlines()
+    paged = client.post("/report/render?detail_offset=70&detail_limit=20", json=_report_input(format="jsonl"))
+
+    assert paged.status_code == 200
+    full_details = [line for line in full if '"external_code"' in line]
+    paged_details = [line for line in paged.text.splitlines() if '"external_code"' in line]
+    assert len(full_details) == 80
+    assert paged_details == full_details[70:]
+
+
+def test_render_csv(client):
+    response = client.post("/report/render?detail_offset=5&detail_limit=3", json=_report_input(format="csv"))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.splitlines()
+    # CSV는 페이지 인자와 관계없이 표준 코드별 전체 집계만 포함
+    assert lines[0] == "standard_code,total_quantity"
+    assert len(lines) == 81
+    assert lines[1] == "STD-000-A,1"
+
+
+def test_render_html(client):
+    response = client.post("/report/render", json=_report_input(format="html"))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.text.startswith("<!DOCTYPE html>")
+    assert response.text.rstrip().endswith("</html>")
+    assert response.text.count("<tr><td>EXT-PROD-") == 80
+
+
+def test_html_escapes_codes():
+    data = ReportData({"<b>STD</b>": 2}, [{"external_code": "<script>", "standard_code": "<b>STD</b>", "category": "A"}])
+
+    html = "".join(iter_report(data, "html"))
+
+    assert "<td>&lt;script&gt;</td><td>&lt;b&gt;STD&lt;/b&gt;</td>" in html
+    assert "<script>" not in html
+
+
+def test_invoke_pipeline_in_other_format(client):
+    response = client.post("/report/invoke", json={"input": _report_input(format="csv")})
+
+    assert response.status_code == 200
+    output = response.json()["output"]
+    assert output["summary"]["format"] == "csv"
+    assert output["report"].splitlines()[0] == "standard_code,total_quantity"
+
+
+@pytest.mark.parametrize("path, wrap", [
+    ("/report/invoke", True),
+    ("/report/stream", True),
+    ("/report/render", False),
+])
+def test_instruction_requires_markdown(client, path, wrap):
+    report_input = _report_input(format="csv", instruction="요약해줘")
+    response = client.post(path, json={"input": report_input} if wrap else report_input)
+
+    assert response.status_code == 422
+
+
+def test_batch_rejects_instruction_with_other_format(client):
+    response = client.post("/report/batch", json={"reports": [_report_input(format="html", instruction="요약해줘")]})
+
+    assert response.status_code == 422
@@ -0,0 +1,104 @@
+"""
+RuleMatcher / 매핑 규칙 테이블 테스트
+"""
+
+import random
+import re
+import string
+
+import pytest
+
+from agents.code_converter.tools import lookup_code
+from agents.code_converter.tools.lookup_code import (
+    CODE_MAPPING_RULES,
+    convert_by_rule,
+    get_rule_matcher,
+    rules_fingerprint,
+    update_mapping_rules
+)
+from agents.code_converter.tools.matcher import RuleMatcher
+
+
+def linear_scan(rules: dict[str, dict[str, str]], external_code: str) -> tuple[dict | None, str]:
+    """컴파일된 매처 이전의 규칙 탐색 방식 (startswith + re.search)"""
+    for pattern, rule in rules.items():
+        if external_code.startswith(pattern):
+            match = re.search(r'(\d+)', external_code)
+            return rule, match.group(1) if match else "000"
+    match = re.search(r'(\d+)', external_code)
+    return None, match.group(1) if match else "000"
+
+
+def make_rules(size: int, rng: random.Random) -> dict[str, dict[str, str]]:
+    """서로의 prefix가 되지 않는 합성 규칙을 기본 규칙에 추가"""
+    rules = {pattern: dict(rule) for pattern, rule in CODE_MAPPING_RULES.items()}
+    while len(rules) < size:
+        head = rng.choice(["VND", "PTN", "SUP"])
+        tail = "".join(rng.choices(string.ascii_uppercase, k=6))
+        rules[f"{head}-{tail}"] = {"prefix": "STD", "category": rng.choice("ABCVP")}
+    return rules
+
+
+@pytest.fixture
+def restore_rules():
+    """규칙 테이블을 바꾸는 테스트 후 원래 규칙으로 복원"""
+    original = dict(lookup_code._mapping_rules)
+    yield
+    lookup_code._mapping_rules.clear()
+    lookup_code._mapping_rules.update(original)
+    lookup_code._rules_version += 1
+
+
+@pytest.mark.parametrize("size", [5, 500, 5000])
+def test_matcher_matches_linear_scan(size):
+    rng = random.Random(size)
+    rules = make_rules(size, rng)
+    patterns = list(rules)
+    codes = [f"{rng.choice(patterns)}-{rng.randint(1, 999):03d}" for _ in range(2000)]
+    codes += [
+        "UNKNOWN-123", "NODIGITS", "", "123", "EXT-PROD", "EXT-PROD-", "VENDOR-7-8",
+        "EXT-PRODUCT-42", "XEXT-PROD-001", "PARTNER-0001",
+    ]
+
+    matcher = RuleMatcher(rules)
+    for code in codes:
+        assert matcher.match(code) == linear_scan(rules, code), code
+
+
+def test_matcher_prefers_longest_prefix():
+    rules = {
+        "EXT": {"prefix": "STD", "category": "E"},
+        "EXT-PROD": {"prefix": "STD", "category": "A"},
+    }
+    matcher = RuleMatcher(rules)
+
+    assert matcher.match("EXT-PROD-001") == (rules["EXT-PROD"], "001")
+    assert matcher.match("EXT-SVC-002") == (rules["EXT"], "002")
+
+
+def test_matcher_without_rules():
+    assert RuleMatcher({}).match("EXT-PROD-001") == (None, "001")
+
+
+def test_rules_are_read_only():
+    with pytest.raises(TypeError):
+        CODE_MAPPING_RULES["NEW"] = {"prefix": "STD", "category": "N"}
+    with pytest.raises(TypeError):
+        CODE_MAPPING_RULES["EXT-PROD"]["category"] = "Z"
+
+
+def test_update_mapping_rules_refreshes_matcher_and_fingerprint(restore_rules):
+    matcher = get_rule_matcher()
+    fingerprint = rules_fingerprint()
+    assert convert_by_rule("NEW-001") is None
+
+    update_mapping_rules({"NEW": {"prefix": "STD", "category": "N"}})
+
+    assert get_rule_matcher() is not matcher
+    assert rules_fingerprint() != fingerprint
+    assert convert_by_rule("new-001")["standard_code"] == "STD-001-N"
+
+
+def test_matcher_and_fingerprint_are_reused_without_updates():
+    assert get_rule_matcher() is get_rule_matcher()
+    assert rules_fingerprint() == rules_fingerprint()
@@ -0,0 +1,40 @@
+"""
+서버 시작 테스트 (빠른 시작 모드에서 무거운 패키지를 import하지 않는지 확인)
+
+sys.modules를 깨끗한 상태에서 확인하기 위해 별도 프로세스에서 실행합니다.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+STARTUP_SCRIPT = """
+import sys
+from fastapi.testclient import TestClient
+from agents.report_generator import server
+
+with TestClient(server.app) as client:
+    assert client.get("/").status_code == 200
+    loaded = "deepagents" in sys.modules
+print("deepagents" if loaded else "ok")
+"""
+
+
+def test_fast_startup_does_not_import_deepagents(tmp_path):
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(project_root),
+        "REPORT_FAST_STARTUP": "1",
+        "REPORT_CHECKPOINTER": "memory",
+        "REPORT_ARTIFACT_DIR": str(tmp_path / "artifacts"),
+    }
+
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT], env=env, cwd=project_root, capture_output=True, text=True, timeout=120
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "ok"
@@ -0,0 +1,144 @@
+"""
+ThreadRegistry 테스트 (상태 기록, 크기순 조회, 만료 스레드 보관 및 삭제)
+"""
+
+import asyncio
+import json
+
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.memory import MemorySaver
+
+from agents.report_generator import persistence
+from agents.report_generator.artifacts import ArtifactStore
+from agents.report_generator.persistence import ThreadRegistry, open_checkpointer
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """registry가 사용하는 time.time을 수동으로 진행하는 시계"""
+    now = [1_000_000.0]
+    monkeypatch.setattr(persistence.time, "time", lambda: now[0])
+    return now
+
+
+async def _put_checkpoint(saver, thread_id: str, values: dict) -> None:
+    """채널 값이 values인 루트 체크포인트 하나 저장"""
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = values
+    versions = {channel: 1 for channel in values}
+    checkpoint["channel_versions"] = versions
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    await saver.aput(config, checkpoint, {"source": "input", "step": 0}, versions)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def checkpointer_config(request, tmp_path):
+    if request.param == "memory":
+        return {"backend": "memory"}
+    return {"backend": "sqlite", "path": str(tmp_path / "checkpoints.sqlite")}
+
+
+def test_records_status_and_lists_by_size(checkpointer_config, clock):
+    async def scenario():
+        async with open_checkpointer(checkpointer_config) as saver:
+            registry = ThreadRegistry(saver)
+            await _put_checkpoint(saver, "small", {"messages": ["x"]})
+            await _put_checkpoint(saver, "large", {"messages": ["x" * 5000]})
+            for thread_id in ("small", "large", "failed"):
+                await registry.mark_running(thread_id)
+            await registry.on_run_finished("small", "interrupted")
+            await registry.on_run_finished("large", "interrupted")
+            await registry.on_run_finished("failed", "failed")
+            return (
+                await registry.list_threads(),
+                await registry.list_threads(limit=1),
+                await registry.list_threads(status="failed"),
+                await registry.summary(),
+            )
+
+    everything, heaviest, failed, summary = asyncio.run(scenario())
+
+    assert [r.thread_id for r in everything] == ["large", "small", "failed"]
+    assert [r.thread_id for r in heaviest] == ["large"]
+    assert [r.thread_id for r in failed] == ["failed"]
+    assert everything[0].size_bytes > 5000
+    assert summary["threads"] == 3
+    assert summary["by_status"] == {"running": 0, "interrupted": 2, "completed": 0, "failed": 1}
+    assert summary["total_bytes"] == sum(r.size_bytes for r in everything)
+
+
+def test_sweep_evicts_only_expired_threads(checkpointer_config, clock):
+    async def scenario():
+        async with open_checkpointer(checkpointer_config) as saver:
+            registry = ThreadRegistry(saver, retention_seconds=3600)
+            await _put_checkpoint(saver, "abandoned", {"messages": ["paused"]})
+            await registry.on_run_finished("abandoned", "interrupted")
+            clock[0] += 1800
+            await _put_checkpoint(saver, "recent", {"messages": ["paused"]})
+            await registry.on_run_finished("recent", "interrupted")
+
+            clock[0] += 1801
+            expired = await registry.sweep()
+            remaining = [r.thread_id for r in await registry.list_threads()]
+            abandoned = await saver.aget_tuple({"configurable": {"thread_id": "abandoned"}})
+            recent = await saver.aget_tuple({"configurable": {"thread_id": "recent"}})
+            return expired, remaining, abandoned, recent
+
+    expired, remaining, abandoned, recent = asyncio.run(scenario())
+
+    assert expired == ["abandoned"]
+    assert remaining == ["recent"]
+    assert abandoned is None
+    assert recent is not None
+
+
+def test_resumed_thread_is_not_swept(clock):
+    registry = ThreadRegistry(MemorySaver(), retention_seconds=60)
+
+    async def scenario():
+        await registry.on_run_finished("thread-1", "interrupted")
+        clock[0] += 50
+        # 재개하면 마지막 활동 시각이 갱신됨
+        await registry.mark_running("thread-1")
+        clock[0] += 50
+        return await registry.sweep()
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_sweep_archives_latest_state(tmp_path, clock):
+    archive_dir = tmp_path / "archive"
+    saver = MemorySaver()
+    registry = ThreadRegistry(saver, retention_seconds=0, archive_dir=archive_dir)
+
+    async def scenario():
+        await _put_checkpoint(saver, "thread-1", {"messages": ["환율 승인 대기"]})
+        await registry.on_run_finished("thread-1", "interrupted")
+        clock[0] += 1
+        return await registry.sweep()
+
+    assert asyncio.run(scenario()) == ["thread-1"]
+
+    [path] = archive_dir.glob("threads-*.jsonl")
+    [entry] = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert entry["thread_id"] == "thread-1"
+    assert entry["status"] == "interrupted"
+    assert entry["values"] == {"messages": ["환율 승인 대기"]}
+
+
+def test_evict_deletes_thread_artifacts(clock):
+    artifacts = ArtifactStore(backend="memory")
+    registry = ThreadRegistry(MemorySaver(), artifacts=lambda: artifacts)
+    kept = artifacts.put("other", "conversions", [{"external_code": "A"}])
+    evicted = artifacts.put("thread-1", "conversions", [{"external_code": "B"}])
+
+    async def scenario():
+        await registry.mark_running("thread-1")
+        await registry.on_run_finished("thread-1", "completed")
+
+    asyncio.run(scenario())
+
+    assert artifacts.get("other", kept) == [{"external_code": "A"}]
+    with pytest.raises(ValueError):
+        artifacts.get("thread-1", evicted)
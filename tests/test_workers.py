@@ -0,0 +1,111 @@
+"""
+ConversionWorkerPool 분배 테스트
+
+워커 프로세스 대신 요청을 모아 두는 가짜 워커를 슬롯에 넣어, 모든 청크가 전달된 시점의
+워커별 분배를 확인한 뒤 응답합니다.
+"""
+
+import asyncio
+
+import pytest
+
+from agents.code_converter.tools.lookup_code import _convert_single_code
+from agents.code_converter.workers import ConversionWorkerPool, _resolve
+
+
+class FakeProcess:
+    pid = None
+
+    def is_alive(self) -> bool:
+        return True
+
+
+class FakeRequests:
+    """워커 요청 큐 대신 받은 요청을 기록"""
+
+    def __init__(self):
+        self.messages: list[tuple[int, str, list[str]]] = []
+
+    def put(self, message) -> None:
+        self.messages.append(message)
+
+
+@pytest.fixture
+def pool():
+    pool = ConversionWorkerPool(3, dispatch_chunk_size=10)
+    for slot in pool._slots:
+        slot.process, slot.requests = FakeProcess(), FakeRequests()
+    return pool
+
+
+async def _run(pool: ConversionWorkerPool, codes: list[str]) -> tuple[list[dict], dict[int, int]]:
+    """convert를 실행하고 모든 청크가 전달되면 (워커별 코드 수)를 기록한 뒤 응답"""
+    task = asyncio.create_task(pool.convert(codes))
+    expected = sum(-(-len(group) // pool.dispatch_chunk_size) for group in _home_groups(pool, codes).values())
+    while sum(len(slot.requests.messages) for slot in pool._slots) < expected:
+        await asyncio.sleep(0)
+
+    load = {slot.worker_id: sum(len(m[2]) for m in slot.requests.messages) for slot in pool._slots}
+    for slot in pool._slots:
+        for request_id, _, payload in slot.requests.messages:
+            with pool._lock:
+                pending = slot.inflight.pop(request_id)
+                slot.outstanding -= pending.weight
+            _resolve(pending.future, ([_convert_single_code(c) for c in payload], {"total": len(payload)}), None)
+    return await task, load
+
+
+def _home_groups(pool: ConversionWorkerPool, codes: list[str]) -> dict[int, list[str]]:
+    groups: dict[int, list[str]] = {}
+    for code in codes:
+        groups.setdefault(pool._route(code), []).append(code)
+    return groups
+
+
+def test_balanced_input_keeps_hash_affinity(pool):
+    codes = [f"EXT-PROD-{i:03d}" for i in range(30)]
+
+    (results, stats), load = asyncio.run(_run(pool, codes))
+
+    assert [r["external_code"] for r in results] == codes
+    assert stats == {"total": 30}
+    for slot in pool._slots:
+        routed = [code for _, _, payload in slot.requests.messages for code in payload]
+        assert all(pool._route(code) == slot.worker_id for code in routed)
+
+
+def test_skewed_input_spreads_across_workers(pool):
+    # 모두 같은 워커로 해시되는 코드 120개
+    candidates = (f"VENDOR-{i:04d}" for i in range(10_000))
+    codes = [code for code in candidates if pool._route(code) == 0][:120]
+
+    (results, stats), load = asyncio.run(_run(pool, codes))
+
+    assert [r["external_code"] for r in results] == codes
+    assert stats == {"total": 120}
+    assert all(count > 0 for count in load.values())
+    # 담당 워커는 한가한 워커보다 spill_threshold 넘게 밀리지 않음
+    assert max(load.values()) - min(load.values()) <= pool.spill_threshold + pool.dispatch_chunk_size
+
+
+def test_stats_requests_stay_on_requested_worker(pool):
+    async def scenario():
+        pool._slots[1].outstanding = 10_000
+        task = asyncio.create_task(pool.submit("stats", None, worker_id=1))
+        await asyncio.sleep(0)
+        [(request_id, kind, _)] = pool._slots[1].requests.messages
+        pending = pool._slots[1].inflight.pop(request_id)
+        _resolve(pending.future, {"size": 0}, None)
+        return kind, await task
+
+    assert asyncio.run(scenario()) == ("stats", {"size": 0})
+
+
+def test_unavailable_worker_falls_back_to_least_outstanding(pool):
+    pool._slots[0].degraded = True
+    pool._slots[1].outstanding = 50
+    codes = [code for code in (f"EXT-SVC-{i:03d}" for i in range(1000)) if pool._route(code) == 0][:5]
+
+    _, load = asyncio.run(_run(pool, codes))
+
+    assert load == {0: 0, 1: 0, 2: 5}